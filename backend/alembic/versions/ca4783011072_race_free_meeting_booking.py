@@ -0,0 +1,98 @@
+"""race free meeting booking
+
+Revision ID: ca4783011072
+Revises: 87d6a0aa4b5c
+Create Date: 2026-10-19 16:14:07.852870
+
+"""
+import bisect
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca4783011072'
+down_revision: Union[str, None] = '87d6a0aa4b5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONFLICT_REASON = 'Cancelada automaticamente: conflito de horário ou reunião pendente duplicada'
+
+
+def _cancel_conflicts(connection) -> None:
+    rows = connection.execute(sa.text("""
+        SELECT id, member_id, status, scheduled_date, duration_minutes
+        FROM meetings
+        WHERE status IN ('PENDING', 'CONFIRMED')
+        ORDER BY status = 'CONFIRMED' DESC, created_at, id
+    """)).fetchall()
+
+    kept = []  # (start, end) of kept meetings, sorted and non-overlapping
+    pending_members = set()
+    cancelled = []
+    for meeting_id, member_id, status, start, minutes in rows:
+        end = start + timedelta(minutes=minutes)
+        position = bisect.bisect_left(kept, (start, end))
+        # Zero-minute meetings have an empty range, which overlaps nothing
+        overlaps = end > start and (
+            position > 0 and kept[position - 1][1] > start
+            or position < len(kept) and kept[position][0] < end
+        )
+        if overlaps or (status == 'PENDING' and member_id in pending_members):
+            cancelled.append(meeting_id)
+            continue
+        if end > start:
+            kept.insert(position, (start, end))
+        if status == 'PENDING':
+            pending_members.add(member_id)
+
+    if cancelled:
+        connection.execute(sa.text("""
+            UPDATE meetings
+            SET status = 'CANCELLED', cancelled_at = now(), cancellation_reason = :reason
+            WHERE id = ANY(:ids)
+        """), {"reason": CONFLICT_REASON, "ids": cancelled})
+        print(f"⚠️  {len(cancelled)} reunião(ões) cancelada(s) por conflito de horário: {', '.join(cancelled)}")
+
+
+def upgrade() -> None:
+    # Numeric duration (invalid values, and values too large for an integer, fall back to the 60-minute default)
+    op.alter_column('meetings', 'duration_minutes',
+               existing_type=sa.VARCHAR(),
+               type_=sa.Integer(),
+               nullable=False,
+               server_default=None,
+               postgresql_using="CASE WHEN duration_minutes ~ '^[0-9]{1,6}$' THEN duration_minutes::integer ELSE 60 END")
+    op.add_column('meetings', sa.Column('time_range', postgresql.TSRANGE(), sa.Computed("tsrange(scheduled_date, scheduled_date + make_interval(mins => duration_minutes), '[)')", persisted=True), nullable=True))
+
+    # Existing double bookings would block the constraints. The baseline never
+    # prevented overlaps, so any two active meetings (confirmed ones included)
+    # may collide. Meetings are kept greedily: confirmed ones first, then the
+    # oldest; a meeting is cancelled only when it overlaps one that was kept (or
+    # is a member's second pending meeting), so cancelling one meeting never
+    # takes down others that only overlapped it.
+    _cancel_conflicts(op.get_bind())
+
+    op.create_index('uq_meetings_member_pending', 'meetings', ['member_id'], unique=True, postgresql_where=sa.text("status = 'PENDING'"))
+    op.create_exclude_constraint(
+        'ex_meetings_active_time_range',
+        'meetings',
+        ('time_range', '&&'),
+        using='gist',
+        where=sa.text("status IN ('PENDING', 'CONFIRMED')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ex_meetings_active_time_range', 'meetings')
+    op.drop_index('uq_meetings_member_pending', table_name='meetings', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_column('meetings', 'time_range')
+    op.alter_column('meetings', 'duration_minutes',
+               existing_type=sa.Integer(),
+               type_=sa.VARCHAR(),
+               nullable=True,
+               postgresql_using="duration_minutes::varchar")
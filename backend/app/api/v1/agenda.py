@@ -0,0 +1,62 @@
+"""
+Agenda API - A member's meetings, collective meetings and visits in one timeline
+"""
+from typing import List, Optional
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User
+from app.schemas.agenda import AgendaItem
+from app.services import agenda as agenda_service
+from app.api.dependencies import get_current_active_user
+
+
+router = APIRouter(prefix="/agenda", tags=["agenda"])
+
+
+def _require_member(current_user: User):
+    if not hasattr(current_user, 'member') or not current_user.member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Você precisa ser um membro"
+        )
+    return current_user.member
+
+
+@router.get("", response_model=List[AgendaItem])
+def get_my_agenda(
+    date_from: Optional[datetime] = Query(None, description="Events starting from (default: now)"),
+    date_to: Optional[datetime] = Query(None, description="Events starting before (default: 90 days after date_from)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the current member's agenda, ordered by start
+    """
+    member = _require_member(current_user)
+    date_from = date_from or datetime.utcnow()
+    date_to = date_to or date_from + timedelta(days=90)
+    if date_to <= date_from:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Período inválido"
+        )
+    return agenda_service.get_agenda(db, member.id, date_from, date_to, skip, limit)
+
+
+@router.get("/conflicts", response_model=List[AgendaItem])
+def get_my_conflicts(
+    start: datetime = Query(..., description="Start of the slot to check"),
+    duration_minutes: int = Query(60, ge=1, le=1440),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    List the current member's events overlapping a slot (empty when it is free)
+    """
+    member = _require_member(current_user)
+    return agenda_service.find_conflicts(db, member.id, start, duration_minutes)
@@ -0,0 +1,169 @@
+"""
+Availability API - Hub working hours, blocked periods and free/busy
+"""
+from typing import List
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.availability import (
+    WorkingHoursUpdate,
+    WorkingHoursResponse,
+    BlockedPeriodCreate,
+    BlockedPeriodResponse,
+    DayFreeBusy,
+    HubProfileUpdate,
+    HubProfileResponse
+)
+from app.services import availability as availability_service
+from app.services import hub_assignment as hub_assignment_service
+from app.api.dependencies import get_current_active_user, require_role
+
+
+router = APIRouter(prefix="/availability", tags=["availability"])
+
+
+def _check_hub_access(current_user: User, hub_id: str):
+    """Hubs manage their own calendar; admins manage any"""
+    if current_user.role != UserRole.ADMIN and current_user.id != hub_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você só pode gerenciar a sua própria agenda"
+        )
+
+
+@router.get("/hubs/{hub_id}/working-hours", response_model=List[WorkingHoursResponse])
+def get_working_hours(
+    hub_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get a Hub's weekly working hours (empty = global business hours)
+    """
+    return availability_service.get_working_hours(db, hub_id)
+
+
+@router.put("/hubs/{hub_id}/working-hours", response_model=List[WorkingHoursResponse])
+def set_working_hours(
+    hub_id: str,
+    working_hours: WorkingHoursUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Replace a Hub's weekly working hours
+    Requires: HUB (own calendar) or ADMIN role
+    """
+    _check_hub_access(current_user, hub_id)
+    return availability_service.set_working_hours(
+        db, hub_id, [interval.model_dump() for interval in working_hours.intervals]
+    )
+
+
+@router.get("/hubs/{hub_id}/blocked-periods", response_model=List[BlockedPeriodResponse])
+def get_blocked_periods(
+    hub_id: str,
+    upcoming_only: bool = Query(True),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get a Hub's blocked periods
+    Requires: HUB (own calendar) or ADMIN role
+    """
+    _check_hub_access(current_user, hub_id)
+    return availability_service.get_blocked_periods(db, hub_id, upcoming_only=upcoming_only)
+
+
+@router.post("/hubs/{hub_id}/blocked-periods", response_model=BlockedPeriodResponse, status_code=status.HTTP_201_CREATED)
+def add_blocked_period(
+    hub_id: str,
+    period: BlockedPeriodCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Block a period in a Hub's calendar
+    Requires: HUB (own calendar) or ADMIN role
+    """
+    _check_hub_access(current_user, hub_id)
+    return availability_service.add_blocked_period(db, hub_id, period.model_dump())
+
+
+@router.delete("/blocked-periods/{period_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_blocked_period(
+    period_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Remove a blocked period
+    Requires: HUB (own calendar) or ADMIN role
+    """
+    hub_id = None if current_user.role == UserRole.ADMIN else current_user.id
+    availability_service.delete_blocked_period(db, period_id, hub_id=hub_id)
+    return None
+
+
+@router.get("/hubs/{hub_id}/free-busy", response_model=List[DayFreeBusy])
+def get_free_busy(
+    hub_id: str,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get a Hub's free/busy bitmap per day
+    """
+    if not 0 <= (end_date - start_date).days < settings.MEETING_SLOTS_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Período inválido (máximo de {settings.MEETING_SLOTS_MAX_DAYS} dias)"
+        )
+    
+    return availability_service.get_free_busy(db, hub_id, start_date, end_date)
+
+
+@router.get("/hubs/{hub_id}/profile", response_model=HubProfileResponse)
+def get_hub_profile(
+    hub_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get what a Hub takes when meetings are assigned automatically
+    Requires: HUB or ADMIN role
+    """
+    return hub_assignment_service.get_profile(db, hub_id)
+
+
+@router.put("/hubs/{hub_id}/profile", response_model=HubProfileResponse)
+def set_hub_profile(
+    hub_id: str,
+    profile: HubProfileUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Replace a Hub's assignment profile (meeting types, preferred categories, capacity)
+    Requires: HUB (own profile) or ADMIN role
+    """
+    _check_hub_access(current_user, hub_id)
+    return hub_assignment_service.set_profile(db, hub_id, profile.model_dump(mode="json"))
+
+
+@router.post("/rebuild", status_code=status.HTTP_200_OK)
+def rebuild_availability(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Recompute the cached free/busy bitmaps of every Hub
+    Requires: ADMIN role
+    """
+    return availability_service.rebuild_cache(db)
@@ -0,0 +1,81 @@
+"""
+Calendar API - ICS feeds of member agendas
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User
+from app.models.calendar_feed import CalendarFeed
+from app.schemas.calendar_feed import CalendarFeedInfo
+from app.services import calendar_feed as calendar_feed_service
+from app.api.dependencies import get_current_active_user, etag_matches
+
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+
+def _require_member(current_user: User):
+    if not hasattr(current_user, 'member') or not current_user.member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Você precisa ser um membro"
+        )
+    return current_user.member
+
+
+def _feed_info(request: Request, feed: CalendarFeed) -> CalendarFeedInfo:
+    return CalendarFeedInfo(
+        token=feed.token,
+        url=str(request.url_for("get_calendar_feed", token=feed.token)),
+        rendered_at=feed.rendered_at,
+        created_at=feed.created_at
+    )
+
+
+@router.get("/me", response_model=CalendarFeedInfo)
+def get_my_calendar_feed(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the subscription URL of the current member's calendar
+    """
+    member = _require_member(current_user)
+    return _feed_info(request, calendar_feed_service.get_or_create_feed(db, member.id))
+
+
+@router.post("/me/rotate", response_model=CalendarFeedInfo)
+def rotate_my_calendar_feed(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Issue a new subscription URL (the previous one stops working)
+    """
+    member = _require_member(current_user)
+    return _feed_info(request, calendar_feed_service.rotate_token(db, member.id))
+
+
+@router.get("/{token}.ics", name="get_calendar_feed")
+def get_calendar_feed(
+    token: str,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    ICS feed for calendar apps (Google Calendar, Outlook, Apple Calendar)
+    Authenticated by the secret token in the URL
+    """
+    feed = calendar_feed_service.get_rendered_feed(db, token)
+    headers = {"ETag": feed.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, feed.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=feed.content,
+        media_type="text/calendar",
+        headers=headers
+    )
@@ -2,12 +2,13 @@
 Collective Meetings API
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.models.user import User, UserRole
-from app.models.collective_meeting import CollectiveMeetingStatus, meeting_attendees
+from app.models.collective_meeting import CollectiveMeetingStatus
 from app.schemas.collective_meeting import (
     CollectiveMeetingCreate,
     CollectiveMeetingUpdate,
@@ -16,10 +17,24 @@ from app.schemas.collective_meeting import (
     ConfirmAttendance,
     MarkAttendance,
     CollectiveMeetingStats,
-    MeetingAttendee
+    MeetingAttendee,
+    MeetingAttendeeList,
+    CheckinToken,
+    CheckinScan,
+    CheckinResult,
+    LiveCheckins,
+    MemberAttendance,
+    MemberAttendanceReportItem,
+    CollectiveMeetingSeriesCreate,
+    CollectiveMeetingSeriesUpdate,
+    CollectiveMeetingSeriesResponse,
+    CollectiveMeetingOccurrence
 )
 from app.services import collective_meeting as meeting_service
-from app.api.dependencies import get_current_active_user, require_role
+from app.services import checkin as checkin_service
+from app.services import attendance as attendance_service
+from app.services import meeting_series as series_service
+from app.api.dependencies import get_current_active_user, require_role, etag_matches
 
 
 router = APIRouter(prefix="/collective-meetings", tags=["collective-meetings"])
@@ -93,14 +108,175 @@ def get_meeting_stats(
     return stats
 
 
+@router.get("/occurrences", response_model=List[CollectiveMeetingOccurrence])
+def get_occurrences(
+    start: datetime = Query(..., description="Início do período (horário local, sem fuso)"),
+    end: datetime = Query(..., description="Fim do período (horário local, sem fuso, exclusivo)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get collective meetings in a period, including upcoming occurrences of
+    recurring series that were not materialized yet (id is null for those)
+    """
+    if end <= start or end - start > timedelta(days=366):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Período inválido (máximo de 366 dias)"
+        )
+    
+    return series_service.get_occurrences(db, start, end)
+
+
+# Recurring series
+
+@router.post("/series", response_model=CollectiveMeetingSeriesResponse, status_code=status.HTTP_201_CREATED)
+def create_series(
+    series: CollectiveMeetingSeriesCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Create a recurring collective meeting
+    Occurrences become meetings (and invite all active members) a few days before they happen
+    Requires: HUB or ADMIN role
+    """
+    return series_service.create_series(db, current_user.id, series.model_dump())
+
+
+@router.get("/series", response_model=List[CollectiveMeetingSeriesResponse])
+def get_all_series(
+    active_only: bool = Query(True),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get recurring collective meetings
+    Requires: HUB or ADMIN role
+    """
+    return series_service.get_all_series(db, active_only=active_only)
+
+
+@router.get("/series/{series_id}", response_model=CollectiveMeetingSeriesResponse)
+def get_series(
+    series_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get a recurring collective meeting
+    Requires: HUB or ADMIN role
+    """
+    series = series_service.get_series_by_id(db, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Série não encontrada"
+        )
+    return series
+
+
+@router.patch("/series/{series_id}", response_model=CollectiveMeetingSeriesResponse)
+def update_series(
+    series_id: str,
+    series_update: CollectiveMeetingSeriesUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Update a series (also applies to its upcoming meetings)
+    Requires: HUB or ADMIN role
+    """
+    return series_service.update_series(db, series_id, series_update.model_dump(exclude_unset=True))
+
+
+@router.delete("/series/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+def cancel_series(
+    series_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Stop a series and cancel its upcoming meetings
+    Requires: HUB or ADMIN role
+    """
+    series_service.cancel_series(db, series_id)
+    return None
+
+
+@router.get("/attendance/report", response_model=List[MemberAttendanceReportItem])
+def get_attendance_report(
+    order: str = Query("desc", pattern="^(asc|desc)$", description="Order by recent attendance rate"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get members ranked by attendance rate over their last completed meetings
+    Requires: HUB or ADMIN role
+    """
+    return attendance_service.get_attendance_report(db, ascending=order == "asc", skip=skip, limit=limit)
+
+
+@router.post("/attendance/rebuild", status_code=status.HTTP_200_OK)
+def rebuild_attendance_rollups(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Rebuild the precomputed attendance numbers from all completed meetings
+    Requires: ADMIN role
+    """
+    result = attendance_service.rebuild_rollups(db)
+    return {"message": f"Frequência recalculada para {result['members']} membros"}
+
+
+@router.get("/attendance/me", response_model=MemberAttendance)
+def get_my_attendance(
+    months: int = Query(12, ge=1, le=60),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get current member's attendance summary and monthly history
+    """
+    if not hasattr(current_user, 'member') or not current_user.member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Você precisa ser um membro"
+        )
+    
+    return attendance_service.get_member_attendance(db, current_user.member.id, months)
+
+
+@router.get("/attendance/members/{member_id}", response_model=MemberAttendance)
+def get_member_attendance(
+    member_id: str,
+    months: int = Query(12, ge=1, le=60),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get a member's attendance summary and monthly history
+    Requires: HUB or ADMIN role
+    """
+    return attendance_service.get_member_attendance(db, member_id, months)
+
+
 @router.get("/{meeting_id}", response_model=CollectiveMeetingWithAttendees)
 def get_collective_meeting(
     meeting_id: str,
+    request: Request,
+    response: Response,
+    include_attendees: bool = Query(True, description="Set to false to get only the meeting header (cacheable)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get a specific collective meeting with attendees
+    Without the roster the response carries an ETag: send it in If-None-Match to get 304 when unchanged.
+    For large groups, page the roster with GET /collective-meetings/{id}/attendees
     """
     meeting = meeting_service.get_collective_meeting_by_id(db, meeting_id)
     if not meeting:
@@ -109,29 +285,49 @@ def get_collective_meeting(
             detail="Reunião não encontrada"
         )
     
-    # Build attendees list
-    attendees_data = []
-    stmt = db.query(meeting_attendees).filter(meeting_attendees.c.meeting_id == meeting_id).all()
+    if not include_attendees:
+        etag = meeting_service.get_meeting_etag(meeting)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return CollectiveMeetingResponse.model_validate(meeting).model_dump()
     
-    for att in stmt:
-        from app.models.member import Member
-        member = db.query(Member).filter(Member.id == att.member_id).first()
-        if member:
-            attendees_data.append({
-                "member_id": member.id,
-                "member_name": member.user.full_name or member.user.email if hasattr(member, 'user') else "Unknown",
-                "company_name": member.company_name,
-                "confirmed": att.confirmed,
-                "attended": att.attended,
-                "confirmed_at": att.confirmed_at
-            })
-    
-    meeting_dict = {
-        **meeting.__dict__,
-        "attendees": attendees_data
+    return {
+        **CollectiveMeetingResponse.model_validate(meeting).model_dump(),
+        "attendees": meeting_service.get_attendee_roster(db, meeting_id)
     }
+
+
+@router.get("/{meeting_id}/attendees", response_model=MeetingAttendeeList)
+def get_meeting_attendees(
+    meeting_id: str,
+    confirmed: Optional[bool] = Query(None),
+    attended: Optional[bool] = Query(None),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get a page of the meeting's attendee roster, ordered by name
+    Filter by confirmed and/or attended
+    """
+    meeting = meeting_service.get_collective_meeting_by_id(db, meeting_id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reunião não encontrada"
+        )
     
-    return meeting_dict
+    return {
+        "total": meeting_service.count_attendees(db, meeting_id, confirmed, attended),
+        "skip": skip,
+        "limit": limit,
+        "attendees": meeting_service.get_attendee_roster(
+            db, meeting_id, confirmed, attended, skip=skip, limit=limit
+        )
+    }
 
 
 @router.patch("/{meeting_id}", response_model=CollectiveMeetingResponse)
@@ -208,6 +404,45 @@ def mark_attendance(
     return updated_meeting
 
 
+@router.post("/{meeting_id}/recount", response_model=CollectiveMeetingResponse)
+def recount_attendance(
+    meeting_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Recompute invited/confirmed/attended counters from the attendee roster
+    Requires: HUB or ADMIN role
+    """
+    return meeting_service.recount_attendance(db, meeting_id)
+
+
+@router.post("/{meeting_id}/checkin", response_model=CheckinResult)
+def check_in(
+    meeting_id: str,
+    scan: CheckinScan,
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Check in a member by scanning their QR code at the door
+    Arrivals are applied to the attendance list in the background
+    Requires: HUB or ADMIN role
+    """
+    return checkin_service.check_in(meeting_id, scan.token)
+
+
+@router.get("/{meeting_id}/checkins/live", response_model=LiveCheckins)
+def get_live_checkins(
+    meeting_id: str,
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get the live check-in count
+    Requires: HUB or ADMIN role
+    """
+    return checkin_service.get_live_checkins(meeting_id)
+
+
 # Member Routes
 
 @router.post("/{meeting_id}/confirm", status_code=status.HTTP_200_OK)
@@ -231,3 +466,22 @@ def confirm_attendance(
     meeting_service.confirm_attendance(db, meeting_id, member_id, confirmation.confirmed)
     
     return {"message": "Presença confirmada" if confirmation.confirmed else "Presença declinada"}
+
+
+@router.get("/{meeting_id}/checkin-token", response_model=CheckinToken)
+def get_checkin_token(
+    meeting_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get the signed token to show as a QR code at the meeting door
+    Available to invited members
+    """
+    if not hasattr(current_user, 'member') or not current_user.member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Você precisa ser um membro"
+        )
+    
+    return checkin_service.issue_checkin_token(db, meeting_id, current_user.member)
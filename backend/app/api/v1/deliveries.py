@@ -0,0 +1,39 @@
+"""
+Deliveries API - Monitoring of email/push notification delivery
+"""
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.notification_delivery import DeliveryMetrics
+from app.services import delivery as delivery_service
+from app.api.dependencies import require_role
+
+
+router = APIRouter(prefix="/deliveries", tags=["deliveries"])
+
+
+@router.get("/metrics", response_model=DeliveryMetrics)
+def get_delivery_metrics(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Get delivery backlog per channel and the throughput of this process's worker
+    Requires: ADMIN role
+    """
+    return delivery_service.get_delivery_metrics(db)
+
+
+@router.post("/failed/retry", status_code=status.HTTP_200_OK)
+def retry_failed_deliveries(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Move failed deliveries back to the queue
+    Requires: ADMIN role
+    """
+    count = delivery_service.retry_failed_deliveries(db)
+    return {"message": f"{count} entregas reenfileiradas"}
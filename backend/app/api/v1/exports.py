@@ -0,0 +1,97 @@
+"""
+Exports API - Hub reports downloaded as CSV, NDJSON, XLSX or Parquet
+"""
+from typing import Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.models.meeting import MeetingStatus, MeetingType
+from app.models.member import MemberStatus, BusinessCategory
+from app.models.payment import PaymentStatus, PaymentType
+from app.models.user import User, UserRole
+from app.models.visit import VisitStatus, VisitPurpose
+from app.schemas.export import ExportFormat
+from app.services import export as export_service
+from app.api.dependencies import require_role
+
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+def _download(report: str, statement, export_format: ExportFormat) -> StreamingResponse:
+    export_service.check_format(export_format)
+    return StreamingResponse(
+        export_service.stream(statement, export_format),
+        media_type=export_service.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{export_service.filename(report, export_format)}"'}
+    )
+
+
+@router.get("/visits")
+def export_visits(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    status_filter: Optional[VisitStatus] = Query(None),
+    purpose_filter: Optional[VisitPurpose] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Download all visits (same filters as /visits/all/visits, without paging)
+    Requires: HUB or ADMIN role
+    """
+    statement = export_service.visits_select(status_filter, purpose_filter, date_from, date_to)
+    return _download("visitas", statement, export_format)
+
+
+@router.get("/meetings")
+def export_meetings(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    status_filter: Optional[MeetingStatus] = Query(None),
+    meeting_type: Optional[MeetingType] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Download all 1:1 meetings (same filters as /meetings/all, without paging)
+    Requires: HUB or ADMIN role
+    """
+    statement = export_service.meetings_select(status_filter, meeting_type, date_from, date_to)
+    return _download("reunioes", statement, export_format)
+
+
+@router.get("/payments")
+def export_payments(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    status_filter: Optional[PaymentStatus] = Query(None),
+    payment_type: Optional[PaymentType] = Query(None),
+    date_from: Optional[datetime] = Query(None, description="Created from"),
+    date_to: Optional[datetime] = Query(None, description="Created until"),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Download payments, newest first
+    Requires: HUB or ADMIN role
+    """
+    statement = export_service.payments_select(status_filter, payment_type, date_from, date_to)
+    return _download("pagamentos", statement, export_format)
+
+
+@router.get("/members")
+def export_members(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    status_filter: Optional[MemberStatus] = Query(None),
+    business_category: Optional[BusinessCategory] = Query(None),
+    city: Optional[str] = Query(None),
+    date_from: Optional[datetime] = Query(None, description="Created from"),
+    date_to: Optional[datetime] = Query(None, description="Created until"),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Download members with their contact details
+    Requires: HUB or ADMIN role
+    """
+    statement = export_service.members_select(status_filter, business_category, city, date_from, date_to)
+    return _download("membros", statement, export_format)
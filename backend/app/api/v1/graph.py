@@ -0,0 +1,96 @@
+"""
+Graph API - Relationships between members built from visits and referrals
+"""
+from typing import List
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.graph import GraphMetric, GraphMember, SecondDegreeConnection, MemberRanking, GraphStats
+from app.services import member_graph as member_graph_service
+from app.api.dependencies import require_role
+
+
+router = APIRouter(prefix="/graph", tags=["graph"])
+
+
+@router.get("/stats", response_model=GraphStats)
+def get_graph_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get the size of the relationship graph
+    Requires: HUB or ADMIN role
+    """
+    return member_graph_service.get_stats(db)
+
+
+@router.get("/members/{member_id}/never-met", response_model=List[GraphMember])
+def get_never_met(
+    member_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    List active members the member has never visited nor been visited by
+    Requires: HUB or ADMIN role
+    """
+    return member_graph_service.get_never_met(db, member_id, skip, limit)
+
+
+@router.get("/members/{member_id}/second-degree", response_model=List[SecondDegreeConnection])
+def get_second_degree(
+    member_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    List the contacts of the member's contacts, by number of mutual contacts
+    Requires: HUB or ADMIN role
+    """
+    return member_graph_service.get_second_degree(db, member_id, limit)
+
+
+@router.get("/rankings", response_model=List[MemberRanking])
+def get_rankings(
+    metric: GraphMetric = Query(GraphMetric.DEGREE),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Rank active members by degree or centrality
+    Requires: HUB or ADMIN role
+    """
+    return member_graph_service.get_rankings(db, metric, limit)
+
+
+@router.get("/isolated", response_model=List[GraphMember])
+def get_isolated_members(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    List active members without any visit or referral
+    Requires: HUB or ADMIN role
+    """
+    return member_graph_service.get_isolated(db, skip, limit)
+
+
+@router.post("/rebuild", response_model=GraphStats, status_code=status.HTTP_200_OK)
+def rebuild_graph(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Reload the graph from the database
+    Requires: ADMIN role
+    """
+    return member_graph_service.rebuild(db)
@@ -6,6 +6,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User, UserRole
 from app.models.meeting import MeetingStatus, MeetingType
@@ -17,9 +18,16 @@ from app.schemas.meeting import (
     MeetingConfirm,
     MeetingCancel,
     MeetingComplete,
-    MeetingStats
+    MeetingStats,
+    MeetingBatchConfirm,
+    MeetingBatchCancel,
+    MeetingBatchComplete,
+    MeetingBatchResult,
+    MeetingAssign,
+    HubQueueSummary
 )
 from app.services import meeting as meeting_service
+from app.services import hub_assignment as hub_assignment_service
 from app.api.dependencies import get_current_active_user, require_role
 
 
@@ -31,6 +39,7 @@ router = APIRouter(prefix="/meetings", tags=["meetings"])
 @router.post("", response_model=MeetingResponse, status_code=status.HTTP_201_CREATED)
 def create_meeting(
     meeting: MeetingCreate,
+    ignore_conflicts: bool = Query(False, description="Create even if it overlaps the member's agenda"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -48,7 +57,9 @@ def create_meeting(
     member_id = current_user.member.id
     meeting_data = meeting.model_dump()
     
-    new_meeting = meeting_service.create_meeting(db, member_id, current_user.id, meeting_data)
+    new_meeting = meeting_service.create_meeting(
+        db, member_id, current_user.id, meeting_data, check_conflicts=not ignore_conflicts
+    )
     return new_meeting
 
 
@@ -161,18 +172,51 @@ def cancel_my_meeting(
 def create_meeting_as_hub(
     member_id: str,
     meeting: MeetingCreate,
+    ignore_conflicts: bool = Query(False, description="Create even if it overlaps the member's agenda"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
 ):
     """
     Create a meeting for a member (Hub creates)
+    Hubs take the meeting themselves; admins leave it to automatic assignment
     Requires: HUB or ADMIN role
     """
     meeting_data = meeting.model_dump()
-    new_meeting = meeting_service.create_meeting(db, member_id, current_user.id, meeting_data)
+    hub_id = current_user.id if current_user.role == UserRole.HUB else None
+    new_meeting = meeting_service.create_meeting(
+        db, member_id, current_user.id, meeting_data, check_conflicts=not ignore_conflicts, hub_id=hub_id
+    )
     return new_meeting
 
 
+@router.get("/hub/queue", response_model=List[MeetingResponse])
+def get_hub_queue(
+    hub_id: Optional[str] = Query(None, description="Admins only; defaults to the current user"),
+    status_filter: Optional[MeetingStatus] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get the upcoming meetings assigned to a Hub
+    Requires: HUB or ADMIN role
+    """
+    if hub_id is None or current_user.role != UserRole.ADMIN:
+        hub_id = current_user.id
+    return hub_assignment_service.get_hub_queue(db, hub_id, status_filter)
+
+
+@router.get("/hub/queues", response_model=List[HubQueueSummary])
+def get_hub_queues(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get the load of every Hub (and of the unassigned queue)
+    Requires: HUB or ADMIN role
+    """
+    return hub_assignment_service.get_queue_summary(db)
+
+
 @router.get("/all", response_model=List[MeetingWithMember])
 def get_all_meetings(
     status_filter: Optional[MeetingStatus] = Query(None),
@@ -229,6 +273,65 @@ def get_meeting_statistics(
     return stats
 
 
+@router.post("/batch/confirm", response_model=MeetingBatchResult)
+def confirm_meetings_batch(
+    batch: MeetingBatchConfirm,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Confirm several meetings in one transaction
+    Meetings that cannot be confirmed are reported per item and left untouched
+    Requires: HUB (assigned or unassigned meetings) or ADMIN role
+    """
+    items = [item.model_dump() for item in batch.items]
+    return meeting_service.confirm_meetings(db, current_user, items)
+
+
+@router.post("/batch/complete", response_model=MeetingBatchResult)
+def complete_meetings_batch(
+    batch: MeetingBatchComplete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Mark several meetings as completed in one transaction
+    Meetings that cannot be completed are reported per item and left untouched
+    Requires: HUB (assigned or unassigned meetings) or ADMIN role
+    """
+    items = [item.model_dump() for item in batch.items]
+    return meeting_service.complete_meetings(db, current_user, items)
+
+
+@router.post("/batch/cancel", response_model=MeetingBatchResult)
+def cancel_meetings_batch(
+    batch: MeetingBatchCancel,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Cancel several meetings in one transaction
+    Meetings that cannot be cancelled are reported per item and left untouched
+    Requires: HUB or ADMIN role
+    """
+    items = [item.model_dump() for item in batch.items]
+    return meeting_service.cancel_meetings(db, items)
+
+
+@router.post("/{meeting_id}/assign", response_model=MeetingResponse)
+def assign_meeting(
+    meeting_id: str,
+    assign_data: MeetingAssign,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Assign a meeting to a Hub (checked against the target Hub's profile unless an admin overrides it)
+    Requires: HUB (assigned or unassigned meeting) or ADMIN role
+    """
+    return meeting_service.assign_meeting(db, meeting_id, assign_data.hub_id, current_user, assign_data.override)
+
+
 @router.post("/{meeting_id}/confirm", response_model=MeetingResponse)
 def confirm_meeting(
     meeting_id: str,
@@ -237,11 +340,11 @@ def confirm_meeting(
     current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
 ):
     """
-    Confirm a meeting
-    Requires: HUB or ADMIN role
+    Confirm a meeting (a Hub confirming an unassigned meeting takes it over)
+    Requires: HUB (assigned or unassigned meeting) or ADMIN role
     """
     confirm_dict = confirm_data.model_dump()
-    confirmed_meeting = meeting_service.confirm_meeting(db, meeting_id, current_user.id, confirm_dict)
+    confirmed_meeting = meeting_service.confirm_meeting(db, meeting_id, current_user, confirm_dict)
     return confirmed_meeting
 
 
@@ -254,9 +357,9 @@ def complete_meeting(
 ):
     """
     Mark meeting as completed
-    Requires: HUB or ADMIN role
+    Requires: HUB (assigned or unassigned meeting) or ADMIN role
     """
-    completed_meeting = meeting_service.complete_meeting(db, meeting_id, complete_data.hub_notes)
+    completed_meeting = meeting_service.complete_meeting(db, meeting_id, current_user, complete_data.hub_notes)
     return completed_meeting
 
 
@@ -294,12 +397,21 @@ def delete_meeting(
 @router.get("/available-slots", response_model=List[datetime])
 def get_available_slots(
     date: datetime = Query(..., description="Date to check availability"),
+    end_date: Optional[datetime] = Query(None, description="Last date of the range (inclusive)"),
     duration_minutes: int = Query(60, ge=30, le=180),
+    hub_id: Optional[str] = Query(None, description="Only this Hub's availability"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Get available time slots for a given date
+    Get available time slots for a given date, or for every day up to end_date
+    A slot is available when at least one Hub (or the given Hub) is free
     """
-    slots = meeting_service.get_available_slots(db, date, duration_minutes)
+    if end_date and not 0 <= (end_date.date() - date.date()).days < settings.MEETING_SLOTS_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Período inválido (máximo de {settings.MEETING_SLOTS_MAX_DAYS} dias)"
+        )
+    
+    slots = meeting_service.get_available_slots(db, date, duration_minutes, end_date, hub_id=hub_id)
     return slots
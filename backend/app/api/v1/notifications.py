@@ -2,7 +2,7 @@
 Notifications API
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -11,10 +11,19 @@ from app.schemas.notification import (
     NotificationCreate,
     NotificationUpdate,
     NotificationResponse,
-    NotificationStats
+    NotificationStats,
+    NotificationBatch,
+    NotificationBatchResult
+)
+from app.schemas.notification_delivery import (
+    NotificationPreferenceUpdate,
+    NotificationPreferenceResponse,
+    PushSubscriptionCreate,
+    PushSubscriptionResponse
 )
 from app.services import notification as notification_service
-from app.api.dependencies import get_current_active_user, require_role
+from app.services import delivery as delivery_service
+from app.api.dependencies import get_current_active_user, require_role, etag_matches
 
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
@@ -24,6 +33,8 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("/me", response_model=List[NotificationResponse])
 def get_my_notifications(
+    request: Request,
+    response: Response,
     unread_only: bool = Query(False),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -32,7 +43,14 @@ def get_my_notifications(
 ):
     """
     Get notifications for current user
+    Supports conditional requests: send the last ETag in If-None-Match to get 304 when unchanged
     """
+    etag = notification_service.get_notifications_etag(db, current_user.id)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    
     notifications = notification_service.get_user_notifications(
         db,
         current_user.id,
@@ -94,6 +112,82 @@ def mark_all_notifications_as_read(
     return {"message": f"{count} notificações marcadas como lidas"}
 
 
+@router.post("/me/read-batch", response_model=NotificationBatchResult)
+def mark_notifications_as_read_batch(
+    batch: NotificationBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Mark a list of notifications as read
+    Notifications that do not belong to the current user are ignored
+    """
+    count = notification_service.mark_many_as_read(db, current_user.id, batch.notification_ids)
+    return {"requested": len(batch.notification_ids), "affected": count}
+
+
+@router.post("/me/delete-batch", response_model=NotificationBatchResult)
+def delete_notifications_batch(
+    batch: NotificationBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Delete a list of notifications
+    Notifications that do not belong to the current user are ignored
+    """
+    count = notification_service.delete_many(db, current_user.id, batch.notification_ids)
+    return {"requested": len(batch.notification_ids), "affected": count}
+
+
+@router.get("/me/preferences", response_model=NotificationPreferenceResponse)
+def get_my_delivery_preferences(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get email/push delivery preferences for current user
+    """
+    return delivery_service.get_preferences(db, current_user.id)
+
+
+@router.put("/me/preferences", response_model=NotificationPreferenceResponse)
+def update_my_delivery_preferences(
+    preferences_data: NotificationPreferenceUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Update email/push delivery preferences for current user
+    """
+    return delivery_service.update_preferences(db, current_user.id, preferences_data)
+
+
+@router.post("/me/push-subscriptions", response_model=PushSubscriptionResponse, status_code=status.HTTP_201_CREATED)
+def add_push_subscription(
+    subscription_data: PushSubscriptionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Register this browser for web push notifications
+    """
+    return delivery_service.add_push_subscription(db, current_user.id, subscription_data)
+
+
+@router.delete("/me/push-subscriptions/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_push_subscription(
+    subscription_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Stop web push notifications for a browser
+    """
+    delivery_service.delete_push_subscription(db, current_user.id, subscription_id)
+    return None
+
+
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_notification(
     notification_id: str,
@@ -134,7 +228,7 @@ def create_notification(
     Requires: HUB or ADMIN role
     """
     notification_data = notification.model_dump()
-    new_notification = notification_service.create_notification(db, notification_data)
+    new_notification = notification_service.create_notification(db, notification_data, coalesce=False)
     return new_notification
 
 
@@ -0,0 +1,54 @@
+"""
+Outbox API - Monitoring and dead-letter management
+"""
+from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.outbox import OutboxStats
+from app.services import outbox as outbox_service
+from app.api.dependencies import require_role
+
+
+router = APIRouter(prefix="/outbox", tags=["outbox"])
+
+
+@router.get("/stats", response_model=OutboxStats)
+def get_outbox_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Get outbox statistics
+    Requires: ADMIN role
+    """
+    stats = outbox_service.get_outbox_stats(db)
+    return stats
+
+
+@router.post("/dead/retry", status_code=status.HTTP_200_OK)
+def retry_dead_events(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Move dead-lettered events back to the queue
+    Requires: ADMIN role
+    """
+    count = outbox_service.retry_dead_events(db)
+    return {"message": f"{count} eventos reenfileirados"}
+
+
+@router.delete("/cleanup", status_code=status.HTTP_200_OK)
+def cleanup_processed_events(
+    days: int = Query(7, ge=1, le=365, description="Delete processed events older than X days"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Delete processed events (admin only)
+    Requires: ADMIN role
+    """
+    count = outbox_service.delete_processed_events(db, days)
+    return {"message": f"{count} eventos processados deletados"}
@@ -0,0 +1,40 @@
+"""
+Search API - Full-text search over members, visits and collective meetings
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.search import SearchResult, SearchResultType
+from app.services import search as search_service
+from app.api.dependencies import get_current_active_user
+
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=List[SearchResult])
+def search(
+    q: str = Query(..., min_length=2, max_length=200, description="Terms; supports \"phrases\", OR and -exclusions"),
+    types: Optional[List[SearchResultType]] = Query(None, description="Result types (default: all)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Search members, visits and collective meetings, best matches first
+    Members only find active members and their own visits; Hub/Admin find everything
+    """
+    member = getattr(current_user, 'member', None)
+    return search_service.search(
+        db,
+        q,
+        types=types,
+        member_id=member.id if member else None,
+        full_access=current_user.role in [UserRole.HUB, UserRole.ADMIN],
+        skip=skip,
+        limit=limit
+    )
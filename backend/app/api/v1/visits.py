@@ -2,7 +2,7 @@
 Visits API
 """
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
@@ -15,7 +15,8 @@ from app.schemas.visit import (
     VisitComplete,
     VisitResponse,
     VisitWithMembers,
-    VisitStats
+    VisitStats,
+    VisitFollowUpPage
 )
 from app.services import visit as visit_service
 from app.api.dependencies import get_current_active_user, require_role
@@ -29,6 +30,7 @@ router = APIRouter(prefix="/visits", tags=["visits"])
 @router.post("", response_model=VisitResponse, status_code=status.HTTP_201_CREATED)
 def create_visit(
     visit: VisitCreate,
+    ignore_conflicts: bool = Query(False, description="Create even if it overlaps either member's agenda"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -46,7 +48,7 @@ def create_visit(
     member_id = current_user.member.id
     visit_data = visit.model_dump()
     
-    new_visit = visit_service.create_visit(db, member_id, visit_data)
+    new_visit = visit_service.create_visit(db, member_id, visit_data, check_conflicts=not ignore_conflicts)
     return new_visit
 
 
@@ -99,6 +101,32 @@ def get_my_visit_stats(
     return stats
 
 
+@router.get("/follow-ups", response_model=VisitFollowUpPage)
+def get_my_follow_ups(
+    days_ahead: int = Query(30, ge=0, le=365, description="Upcoming follow-ups due within this many days (overdue ones always included)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get my open follow-ups (visits I made), overdue first
+    """
+    if not hasattr(current_user, 'member') or not current_user.member:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Você precisa ser um membro"
+        )
+    
+    return visit_service.get_follow_up_queue(
+        db,
+        visitor_id=current_user.member.id,
+        due_before=datetime.utcnow() + timedelta(days=days_ahead),
+        cursor=cursor,
+        limit=limit
+    )
+
+
 @router.get("/{visit_id}", response_model=VisitResponse)
 def get_visit(
     visit_id: str,
@@ -193,6 +221,34 @@ def complete_visit(
     return completed_visit
 
 
+@router.post("/{visit_id}/follow-up/complete", response_model=VisitResponse)
+def complete_follow_up(
+    visit_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Mark a visit's follow-up as done
+    Only the visitor (or a Hub/Admin) can complete it
+    """
+    visit = visit_service.get_visit_by_id(db, visit_id)
+    if not visit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Visita não encontrada"
+        )
+    
+    # Verify ownership
+    if current_user.role not in [UserRole.HUB, UserRole.ADMIN]:
+        if not hasattr(current_user, 'member') or not current_user.member or visit.visitor_id != current_user.member.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Apenas o visitante pode concluir o follow-up"
+            )
+    
+    return visit_service.complete_follow_up(db, visit_id)
+
+
 @router.delete("/{visit_id}/cancel", status_code=status.HTTP_204_NO_CONTENT)
 def cancel_visit(
     visit_id: str,
@@ -238,7 +294,7 @@ def get_all_visits(
     Get all visits with filters
     Requires: HUB or ADMIN role
     """
-    visits = visit_service.get_all_visits(
+    return visit_service.get_all_visits(
         db,
         status_filter=status_filter,
         purpose_filter=purpose_filter,
@@ -247,20 +303,28 @@ def get_all_visits(
         skip=skip,
         limit=limit
     )
-    
-    # Format response with member details
-    result = []
-    for visit in visits:
-        visit_dict = {
-            **visit.__dict__,
-            "visitor_name": visit.visitor.user.full_name or visit.visitor.user.email if hasattr(visit.visitor, 'user') else "Unknown",
-            "visitor_company": visit.visitor.company_name,
-            "visited_name": visit.visited.user.full_name or visit.visited.user.email if hasattr(visit.visited, 'user') else "Unknown",
-            "visited_company": visit.visited.company_name
-        }
-        result.append(visit_dict)
-    
-    return result
+
+
+@router.get("/all/follow-ups", response_model=VisitFollowUpPage)
+def get_all_follow_ups(
+    member_id: Optional[str] = Query(None, description="Only follow-ups of this visitor"),
+    days_ahead: int = Query(30, ge=0, le=365, description="Upcoming follow-ups due within this many days (overdue ones always included)"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(UserRole.HUB, UserRole.ADMIN))
+):
+    """
+    Get the open follow-ups of every member, overdue first
+    Requires: HUB or ADMIN role
+    """
+    return visit_service.get_follow_up_queue(
+        db,
+        visitor_id=member_id,
+        due_before=datetime.utcnow() + timedelta(days=days_ahead),
+        cursor=cursor,
+        limit=limit
+    )
 
 
 @router.get("/all/stats", response_model=VisitStats)
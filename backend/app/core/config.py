@@ -9,6 +9,7 @@ class Settings(BaseSettings):
     APP_NAME: str = "Ecosistema Union"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
+    APP_TIMEZONE: str = "America/Sao_Paulo"  # Meeting, visit and working-hour times are wall-clock times in this zone
     
     # Database
     DATABASE_URL: str
@@ -35,7 +36,81 @@ class Settings(BaseSettings):
     # Email (optional)
     RESEND_API_KEY: Optional[str] = None
     EMAIL_FROM: Optional[str] = None
-    
+
+    # Outbox worker
+    OUTBOX_WORKER_IN_APP: bool = True  # Run the worker as a task inside the API process
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BASE_SECONDS: int = 30  # Backoff: base * 2^(attempts - 1)
+
+    # Notifications
+    NOTIFICATION_COALESCE_WINDOW_MINUTES: int = 60  # 0 disables coalescing
+    NOTIFICATION_DIGEST_ENABLED: bool = False  # Batch LOW priority notifications into a daily digest
+    NOTIFICATION_DIGEST_INTERVAL_HOURS: int = 24
+    NOTIFICATION_DIGEST_POLL_INTERVAL_SECONDS: float = 300.0
+    NOTIFICATION_SWEEPER_IN_APP: bool = True  # Delete expired notifications in the background
+    NOTIFICATION_SWEEP_BATCH_SIZE: int = 1000
+    NOTIFICATION_SWEEP_INTERVAL_SECONDS: float = 600.0
+
+    # Delivery (email / web push)
+    APP_URL: str = "https://union.ebnez.com.br"  # Base for links in emails and pushes
+    DELIVERY_WORKER_IN_APP: bool = True
+    DELIVERY_BACKEND: str = "auto"  # auto | resend | sink ("auto": resend when RESEND_API_KEY is set, otherwise no email)
+    DELIVERY_SINK_URL: Optional[str] = None  # Local HTTP sink (python -m app.workers.delivery_sink)
+    DELIVERY_DEFAULT_MIN_PRIORITY: str = "HIGH"  # Lowest priority sent outside the app by default
+    DELIVERY_BATCH_SIZE: int = 200  # Deliveries claimed per worker iteration
+    DELIVERY_CONCURRENCY: int = 4  # Provider calls in flight at once
+    DELIVERY_POLL_INTERVAL_SECONDS: float = 5.0
+    DELIVERY_MAX_ATTEMPTS: int = 5
+    DELIVERY_RETRY_BASE_SECONDS: int = 60  # Backoff: base * 2^(attempts - 1)
+    DELIVERY_CLAIM_TIMEOUT_SECONDS: int = 300  # Claimed deliveries are retried after this (crashed worker)
+
+    # Hub meeting availability
+    MEETING_BUSINESS_START_HOUR: int = 9
+    MEETING_BUSINESS_END_HOUR: int = 18  # Slots must end by this hour
+    MEETING_SLOT_MINUTES: int = 30  # Slot granularity
+    MEETING_SLOTS_MAX_DAYS: int = 31  # Longest range per availability request
+    AVAILABILITY_WEEKS_AHEAD: int = 8  # Hub free/busy bitmaps cached in Redis for this window
+    AVAILABILITY_CACHE_TTL_SECONDS: int = 900  # Longest life of a cached bitmap (changes also drop it right away)
+    MEETING_AUTO_ASSIGN: bool = True  # Assign new 1:1 meetings to the least-loaded free Hub
+    ASSIGNMENT_REBUILD_SECONDS: int = 300  # Full reload of the in-memory Hub load queue
+
+    # Member relationship graph (visits and referrals)
+    GRAPH_REBUILD_SECONDS: int = 600  # Full reload; changes in between are applied incrementally
+
+    # Hub report exports
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched from the server-side cursor and written at a time
+
+    # Collective meeting check-in
+    CHECKIN_TOKEN_GRACE_HOURS: int = 12  # QR tokens expire this long after the meeting starts
+    CHECKIN_FLUSH_IN_APP: bool = True  # Apply Redis check-ins to the database in the background
+    CHECKIN_FLUSH_BATCH_SIZE: int = 500
+    CHECKIN_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Collective meeting attendance
+    ATTENDANCE_RATE_LAST_N: int = 10  # Member attendance rate window (completed meetings)
+
+    # Recurring collective meetings
+    SERIES_MATERIALIZE_DAYS_AHEAD: int = 7  # Occurrences become meetings (with invitations) this long before
+    SERIES_WORKER_IN_APP: bool = True
+    SERIES_WORKER_BATCH_SIZE: int = 20
+    SERIES_WORKER_INTERVAL_SECONDS: float = 300.0
+
+    # Reminders (scheduled jobs)
+    REMINDER_MEETING_OFFSETS_MINUTES: str = "1440,60"  # Before confirmed 1:1 meetings (comma-separated)
+    REMINDER_COLLECTIVE_OFFSETS_MINUTES: str = "1440,60"  # Before collective meetings
+    REMINDER_FOLLOW_UP_OFFSETS_MINUTES: str = "0"  # Before a visit's follow-up date
+    SCHEDULER_WORKER_IN_APP: bool = True
+    SCHEDULER_BATCH_SIZE: int = 100
+    SCHEDULER_POLL_INTERVAL_SECONDS: float = 30.0
+    SCHEDULER_MAX_ATTEMPTS: int = 5
+    SCHEDULER_RETRY_BASE_SECONDS: int = 60  # Backoff: base * 2^(attempts - 1)
+
+    # Web push (optional, requires pywebpush)
+    VAPID_PRIVATE_KEY: Optional[str] = None
+    VAPID_CLAIMS_EMAIL: Optional[str] = None
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,15 @@
+import redis
+from app.core.config import settings
+
+# Create Redis client (connections are opened lazily and pooled)
+redis_client = redis.Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=5,
+)
+
+
+# Dependency to get Redis client
+def get_redis() -> redis.Redis:
+    """Get Redis client"""
+    return redis_client
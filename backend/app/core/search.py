@@ -0,0 +1,54 @@
+"""
+Full-text search - Portuguese tsvector columns without accents
+
+The unaccent extension is not assumed: f_unaccent (created by the migrations) is an
+IMMUTABLE translate() over the Portuguese accented letters, so it can be used in
+generated columns. It maps one character to one character, which lets highlights
+computed on the unaccented text be put back on the original one.
+"""
+import html
+import re
+from typing import Tuple
+
+SEARCH_CONFIG = "portuguese"
+UNACCENT_FUNCTION = "f_unaccent"
+
+ACCENTED = "ÁÀÂÃÄáàâãäÉÈÊËéèêëÍÌÎÏíìîïÓÒÔÕÖóòôõöÚÙÛÜúùûüÇçÑñ"
+UNACCENTED = "AAAAAaaaaaEEEEeeeeIIIIiiiiOOOOOoooooUUUUuuuuCcNn"
+_UNACCENT_TABLE = str.maketrans(ACCENTED, UNACCENTED)
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+_HIGHLIGHT_TAGS = re.compile(f"({re.escape(HIGHLIGHT_START)}|{re.escape(HIGHLIGHT_STOP)})")
+
+
+def unaccent(value: str) -> str:
+    """Same mapping as f_unaccent"""
+    return value.translate(_UNACCENT_TABLE)
+
+
+def tsvector_sql(*parts: Tuple[str, str]) -> str:
+    """SQL of a generated tsvector column from (SQL expression, weight A-D) pairs"""
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', {UNACCENT_FUNCTION}(coalesce({expression}, ''))), '{weight}')"
+        for expression, weight in parts
+    )
+
+
+def restore_accents(headline: str, document: str) -> str:
+    """
+    Put the original characters back into a headline computed on unaccent(document).
+    The text is user input: it comes back HTML-escaped, only the highlight tags are markup.
+    """
+    parts = _HIGHLIGHT_TAGS.split(headline)
+    plain = "".join(part for part in parts if part not in (HIGHLIGHT_START, HIGHLIGHT_STOP))
+    start = unaccent(document).find(plain)
+    original = document[start:start + len(plain)] if start >= 0 else plain
+    result, position = [], 0
+    for part in parts:
+        if part in (HIGHLIGHT_START, HIGHLIGHT_STOP):
+            result.append(part)
+        else:
+            result.append(html.escape(original[position:position + len(part)]))
+            position += len(part)
+    return "".join(result)
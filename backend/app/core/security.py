@@ -41,6 +41,19 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def create_checkin_token(member_id: str, meeting_id: str, member_name: str, expire: datetime) -> str:
+    """Create signed JWT for QR check-in at a collective meeting"""
+    to_encode = {
+        "sub": member_id,
+        "mid": meeting_id,
+        "name": member_name,
+        "exp": expire,
+        "type": "checkin"
+    }
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return encoded_jwt
+
+
 def decode_token(token: str) -> dict:
     """Decode and verify JWT token"""
     try:
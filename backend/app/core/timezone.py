@@ -0,0 +1,66 @@
+"""
+Local time - Event dates are naive wall-clock times in APP_TIMEZONE
+
+Meetings, visits and working hours are entered as local times (the frontend sends
+"2030-01-01T14:00:00" without an offset) and stored naive. Audit columns
+(created_at, updated_at, ...) stay naive UTC. Compare event dates with local_now(),
+and convert with to_utc() before mixing them with audit timestamps.
+"""
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+
+@lru_cache
+def local_zone() -> ZoneInfo:
+    return ZoneInfo(settings.APP_TIMEZONE)
+
+
+def local_now() -> datetime:
+    """Current wall-clock time in APP_TIMEZONE (naive, like event dates)"""
+    return datetime.now(local_zone()).replace(tzinfo=None)
+
+
+def to_utc(value: datetime) -> datetime:
+    """Naive local time -> naive UTC"""
+    return value.replace(tzinfo=local_zone()).astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+
+
+def to_local(value: datetime) -> datetime:
+    """Naive UTC -> naive local time"""
+    return value.replace(tzinfo=ZoneInfo("UTC")).astimezone(local_zone()).replace(tzinfo=None)
+
+
+def utc_offset(value: datetime) -> timedelta:
+    """Offset of APP_TIMEZONE at a naive local time"""
+    return value.replace(tzinfo=local_zone()).utcoffset()
+
+
+def offset_changes(start: datetime, end: datetime) -> List[Tuple[datetime, timedelta, timedelta]]:
+    """
+    (onset, offset before, offset after) for each change of offset between two local times.
+    The onset is the local time in the offset before, as VTIMEZONE observances expect.
+    """
+    utc = ZoneInfo("UTC")
+    zone = local_zone()
+
+    def offset_at(instant: datetime) -> timedelta:
+        return instant.replace(tzinfo=utc).astimezone(zone).utcoffset()
+
+    changes = []
+    day, end = to_utc(start), to_utc(end)
+    offset = offset_at(day)
+    while day < end:
+        next_day = day + timedelta(days=1)
+        if offset_at(next_day) != offset:
+            # Narrow down to the hour of the change
+            hour = day + timedelta(hours=1)
+            while offset_at(hour) == offset:
+                hour += timedelta(hours=1)
+            changes.append((hour + offset, offset, offset_at(hour)))
+            offset = offset_at(hour)
+        day = next_day
+    return changes
@@ -2,7 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
-from app.api.v1 import auth, members, onboarding, upload, onboarding_videos, quiz, meetings, notifications, profile, visits, collective_meetings
+from app.api.v1 import auth, members, onboarding, upload, onboarding_videos, quiz, meetings, notifications, profile, visits, collective_meetings, outbox, deliveries, calendar, availability, agenda, graph, search, exports
+from app.workers import outbox as outbox_worker, notification_digest as digest_worker, notification_sweeper as sweeper_worker, delivery as delivery_worker, checkin_flush as checkin_worker, series_materializer as series_worker, scheduler as scheduler_worker
+import asyncio
 import os
 
 # Create FastAPI app
@@ -42,6 +44,14 @@ app.include_router(notifications.router, prefix="/api/v1")
 app.include_router(profile.router, prefix="/api/v1")
 app.include_router(visits.router, prefix="/api/v1")
 app.include_router(collective_meetings.router, prefix="/api/v1")
+app.include_router(outbox.router, prefix="/api/v1")
+app.include_router(deliveries.router, prefix="/api/v1")
+app.include_router(calendar.router, prefix="/api/v1")
+app.include_router(availability.router, prefix="/api/v1")
+app.include_router(agenda.router, prefix="/api/v1")
+app.include_router(graph.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -76,8 +86,27 @@ async def startup_event():
     print(f"📤 Upload endpoints: /api/v1/upload/*")
     print(f"🎥 Onboarding Videos endpoints: /api/v1/onboarding-videos/*")
     print(f"📁 Uploads directory: {UPLOAD_DIR}")
+    
+    # Background workers
+    app.state.worker_tasks = []
+    if settings.OUTBOX_WORKER_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(outbox_worker.run_in_app()))
+    if settings.NOTIFICATION_DIGEST_ENABLED:
+        app.state.worker_tasks.append(asyncio.create_task(digest_worker.run_in_app()))
+    if settings.NOTIFICATION_SWEEPER_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(sweeper_worker.run_in_app()))
+    if settings.DELIVERY_WORKER_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(delivery_worker.run_in_app()))
+    if settings.CHECKIN_FLUSH_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(checkin_worker.run_in_app()))
+    if settings.SERIES_WORKER_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(series_worker.run_in_app()))
+    if settings.SCHEDULER_WORKER_IN_APP:
+        app.state.worker_tasks.append(asyncio.create_task(scheduler_worker.run_in_app()))
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     print(f"👋 {settings.APP_NAME} shutting down...")
+    for task in app.state.worker_tasks:
+        task.cancel()
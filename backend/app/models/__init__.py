@@ -8,9 +8,17 @@ from app.models.onboarding_video import OnboardingVideo, VideoProvider
 from app.models.video_progress import VideoProgress
 from app.models.quiz import QuizQuestion, QuizOption, QuizAnswer
 from app.models.meeting import Meeting, MeetingType, MeetingStatus
-from app.models.notification import Notification, NotificationType, NotificationPriority
+from app.models.notification import Notification, NotificationType, NotificationPriority, PendingDigestItem
 from app.models.visit import Visit, VisitPurpose, VisitStatus
-from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingType, CollectiveMeetingStatus
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingType, CollectiveMeetingStatus, CollectiveMeetingSeries, SeriesFrequency
+from app.models.outbox import OutboxEvent, OutboxStatus
+from app.models.attendance import MemberAttendanceMonthly, MemberAttendanceSummary
+from app.models.calendar_feed import CalendarFeed
+from app.models.availability import HubWorkingHours, HubBlockedPeriod, HubProfile
+from app.models.scheduled_job import ScheduledJob, ScheduledJobStatus
+from app.models.notification_delivery import (
+    NotificationDelivery, NotificationPreference, PushSubscription, DeliveryChannel, DeliveryStatus
+)
 
 __all__ = [
     "User",
@@ -38,10 +46,28 @@ __all__ = [
     "Notification",
     "NotificationType",
     "NotificationPriority",
+    "PendingDigestItem",
     "Visit",
     "VisitPurpose",
     "VisitStatus",
     "CollectiveMeeting",
     "CollectiveMeetingType",
     "CollectiveMeetingStatus",
+    "CollectiveMeetingSeries",
+    "SeriesFrequency",
+    "OutboxEvent",
+    "OutboxStatus",
+    "NotificationDelivery",
+    "NotificationPreference",
+    "PushSubscription",
+    "DeliveryChannel",
+    "DeliveryStatus",
+    "MemberAttendanceMonthly",
+    "MemberAttendanceSummary",
+    "CalendarFeed",
+    "HubWorkingHours",
+    "HubBlockedPeriod",
+    "HubProfile",
+    "ScheduledJob",
+    "ScheduledJobStatus",
 ]
@@ -0,0 +1,50 @@
+"""
+Attendance Rollup Models - Precomputed collective meeting attendance per member
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Date, DateTime, Integer, Float, ForeignKey, Index
+
+from app.core.database import Base
+
+
+class MemberAttendanceMonthly(Base):
+    """Completed collective meetings per member per month"""
+    __tablename__ = "member_attendance_monthly"
+
+    member_id = Column(String, ForeignKey('members.id', ondelete='CASCADE'), primary_key=True)
+    month = Column(Date, primary_key=True)  # Primeiro dia do mês
+
+    meetings_invited = Column(Integer, default=0, nullable=False)
+    meetings_confirmed = Column(Integer, default=0, nullable=False)
+    meetings_attended = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<MemberAttendanceMonthly {self.member_id} - {self.month}>"
+
+
+class MemberAttendanceSummary(Base):
+    """Attendance totals and rate over the last N completed meetings per member"""
+    __tablename__ = "member_attendance_summary"
+
+    member_id = Column(String, ForeignKey('members.id', ondelete='CASCADE'), primary_key=True)
+
+    # All completed meetings
+    meetings_invited = Column(Integer, default=0, nullable=False)
+    meetings_attended = Column(Integer, default=0, nullable=False)
+
+    # Last N completed meetings (ATTENDANCE_RATE_LAST_N)
+    recent_invited = Column(Integer, default=0, nullable=False)
+    recent_attended = Column(Integer, default=0, nullable=False)
+    recent_attendance_rate = Column(Float, nullable=True)  # 0-100, None sem reuniões
+
+    last_attended_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_member_attendance_summary_recent_rate", "recent_attendance_rate"),
+    )
+
+    def __repr__(self):
+        return f"<MemberAttendanceSummary {self.member_id} - {self.recent_attendance_rate}>"
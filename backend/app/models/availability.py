@@ -0,0 +1,81 @@
+"""
+Hub Availability Models - Working hours, blocked periods and assignment profile of each Hub
+"""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, ForeignKey, Index, CheckConstraint
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class HubWorkingHours(Base):
+    """Weekly working interval of a Hub (several per weekday allowed, e.g. morning and afternoon)"""
+    __tablename__ = "hub_working_hours"
+    __table_args__ = (
+        CheckConstraint('weekday BETWEEN 0 AND 6', name='ck_hub_working_hours_weekday'),
+        CheckConstraint('start_minute >= 0 AND end_minute <= 1440 AND start_minute < end_minute', name='ck_hub_working_hours_range'),
+        Index('ix_hub_working_hours_hub_weekday', 'hub_user_id', 'weekday'),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    hub_user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+
+    weekday = Column(Integer, nullable=False)  # 0 = segunda ... 6 = domingo
+    start_minute = Column(Integer, nullable=False)  # Minutos desde 00:00 (horário local, APP_TIMEZONE)
+    end_minute = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    hub = relationship("User", backref="working_hours")
+
+    def __repr__(self):
+        return f"<HubWorkingHours {self.hub_user_id} - {self.weekday} {self.start_minute}-{self.end_minute}>"
+
+
+class HubBlockedPeriod(Base):
+    """Period in which a Hub takes no meetings (vacation, events, personal time)"""
+    __tablename__ = "hub_blocked_periods"
+    __table_args__ = (
+        CheckConstraint('starts_at < ends_at', name='ck_hub_blocked_periods_range'),
+        Index('ix_hub_blocked_periods_hub_ends_at', 'hub_user_id', 'ends_at'),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    hub_user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+
+    starts_at = Column(DateTime, nullable=False)  # Horário local, como as reuniões
+    ends_at = Column(DateTime, nullable=False)
+    reason = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    hub = relationship("User", backref="blocked_periods")
+
+    def __repr__(self):
+        return f"<HubBlockedPeriod {self.hub_user_id} - {self.starts_at} to {self.ends_at}>"
+
+
+class HubProfile(Base):
+    """What a Hub takes when 1:1 meetings are assigned automatically (no row = takes everything)"""
+    __tablename__ = "hub_profiles"
+
+    hub_user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+
+    # Skills (comma-separated, NULL = any)
+    meeting_types = Column(String, nullable=True)  # Ex: "ONLINE,PRESENCIAL"
+    business_categories = Column(String, nullable=True)  # Categorias preferidas (desempate)
+
+    # Capacity
+    accepting_meetings = Column(Boolean, default=True, nullable=False)
+    max_active_meetings = Column(Integer, nullable=True)  # Reuniões pendentes/confirmadas futuras
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    hub = relationship("User")
+
+    def __repr__(self):
+        return f"<HubProfile {self.hub_user_id}>"
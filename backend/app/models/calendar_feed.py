@@ -0,0 +1,29 @@
+"""
+Calendar Feed Model - Per-member ICS feed rendered once per change
+"""
+import secrets
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, LargeBinary, ForeignKey
+
+from app.core.database import Base
+
+
+class CalendarFeed(Base):
+    """ICS calendar feed of a member, cached until one of its entries changes"""
+    __tablename__ = "calendar_feeds"
+
+    member_id = Column(String, ForeignKey('members.id', ondelete='CASCADE'), primary_key=True)
+
+    # Secret used in the feed URL (calendar apps cannot send auth headers)
+    token = Column(String, unique=True, nullable=False, index=True, default=lambda: secrets.token_urlsafe(32))
+
+    # Cached render (NULL = invalidated, rendered again on the next request)
+    content = Column(LargeBinary, nullable=True)
+    etag = Column(String, nullable=True)
+    rendered_at = Column(DateTime, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CalendarFeed {self.member_id}>"
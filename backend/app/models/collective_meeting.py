@@ -4,10 +4,12 @@ Collective Meeting Model - Meetings with all members
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Text, Integer, Boolean, Enum as SQLEnum, ForeignKey, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, Integer, Boolean, Enum as SQLEnum, ForeignKey, Table, UniqueConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 
 from app.core.database import Base
+from app.core.search import tsvector_sql
 
 
 class CollectiveMeetingType(str, Enum):
@@ -24,6 +26,17 @@ class CollectiveMeetingStatus(str, Enum):
     REALIZADA = "REALIZADA"  # Completed
 
 
+class SeriesFrequency(str, Enum):
+    """Recurrence frequency enum (RRULE FREQ)"""
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+
+
+# RRULE BYDAY codes, Monday first (datetime.weekday() order)
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
 # Association table for meeting attendees
 meeting_attendees = Table(
     'meeting_attendees',
@@ -32,16 +45,79 @@ meeting_attendees = Table(
     Column('member_id', String, ForeignKey('members.id', ondelete='CASCADE'), primary_key=True),
     Column('confirmed', Boolean, default=False),
     Column('attended', Boolean, default=False),
-    Column('confirmed_at', DateTime, nullable=True)
+    Column('confirmed_at', DateTime, nullable=True),
+    # A member's invitations (agenda, calendar feed)
+    Index('ix_meeting_attendees_member_id', 'member_id')
 )
 
 
+class CollectiveMeetingSeries(Base):
+    """Recurring collective meeting; occurrences are materialized shortly before they happen"""
+    __tablename__ = "collective_meeting_series"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    
+    # Template of the occurrences
+    title = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    meeting_type = Column(SQLEnum(CollectiveMeetingType), nullable=False)
+    duration_minutes = Column(Integer, default=60)
+    location = Column(String, nullable=True)
+    meeting_link = Column(String, nullable=True)
+    agenda = Column(Text, nullable=True)
+    
+    # Recurrence rule (RRULE subset: FREQ, INTERVAL, BYDAY, UNTIL, COUNT)
+    starts_at = Column(DateTime, nullable=False)  # DTSTART: first occurrence and time of day
+    frequency = Column(SQLEnum(SeriesFrequency), nullable=False, default=SeriesFrequency.WEEKLY)
+    interval = Column(Integer, nullable=False, default=1)
+    by_weekday = Column(String, nullable=True)  # "MO,TH" (WEEKLY only, default: weekday of starts_at)
+    until = Column(DateTime, nullable=True)
+    count = Column(Integer, nullable=True)
+    
+    # Materialization (occurrences before this instant already exist as meetings)
+    materialized_until = Column(DateTime, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
+    
+    # Creator
+    created_by_id = Column(String, ForeignKey('users.id'), nullable=False)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    cancelled_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<CollectiveMeetingSeries {self.id} - {self.title}>"
+
+    @property
+    def rrule(self) -> str:
+        """Recurrence rule in iCalendar (RFC 5545) notation"""
+        parts = [f"FREQ={self.frequency.value}", f"INTERVAL={self.interval}"]
+        if self.by_weekday:
+            parts.append(f"BYDAY={self.by_weekday}")
+        if self.until:
+            parts.append(f"UNTIL={self.until.strftime('%Y%m%dT%H%M%SZ')}")
+        if self.count:
+            parts.append(f"COUNT={self.count}")
+        return ";".join(parts)
+
+
 class CollectiveMeeting(Base):
     """Collective meeting model for meetings with all members"""
     __tablename__ = "collective_meetings"
+    __table_args__ = (
+        # One meeting per series occurrence (materialization is idempotent)
+        UniqueConstraint('series_id', 'occurrence_start', name='uq_collective_meetings_series_occurrence'),
+        Index('ix_collective_meetings_scheduled_date', 'scheduled_date'),
+        Index('ix_collective_meetings_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     
+    # Series this meeting was materialized from (NULL for one-off meetings)
+    series_id = Column(String, ForeignKey('collective_meeting_series.id', ondelete='SET NULL'), nullable=True, index=True)
+    occurrence_start = Column(DateTime, nullable=True)  # Original slot in the series (scheduled_date may be moved)
+    
     # Meeting details
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
@@ -65,6 +141,14 @@ class CollectiveMeeting(Base):
     agenda = Column(Text, nullable=True)  # Meeting agenda
     notes = Column(Text, nullable=True)  # Meeting notes/minutes
     
+    # Full-text search (maintained by the database, not loaded by default)
+    search_vector = deferred(Column(TSVECTOR, Computed(tsvector_sql(
+        ("title", "A"),
+        ("description", "B"),
+        ("agenda", "B"),
+        ("notes", "C"),
+    ), persisted=True)))
+    
     # Attendance tracking
     total_invited = Column(Integer, default=0)
     total_confirmed = Column(Integer, default=0)
@@ -78,6 +162,7 @@ class CollectiveMeeting(Base):
     
     # Relationships
     created_by = relationship("User", backref="collective_meetings_created")
+    series = relationship("CollectiveMeetingSeries", backref="meetings")
     attendees = relationship("Member", secondary=meeting_attendees, backref="collective_meetings")
 
     def __repr__(self):
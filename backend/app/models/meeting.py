@@ -4,7 +4,8 @@ Meeting Model
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, Computed, Index, Enum as SQLEnum, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint, TSRANGE
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -24,9 +25,36 @@ class MeetingStatus(str, Enum):
     COMPLETED = "COMPLETED"  # Realizada
 
 
+# Constraint names (violations are reported as 409 Conflict)
+OVERLAP_CONSTRAINT = "ex_meetings_active_time_range"
+PENDING_CONSTRAINT = "uq_meetings_member_pending"
+
+# Hub compared with = in the exclusion constraint (btree_gist); unassigned meetings
+# share the '' key and keep excluding each other
+HUB_KEY = "coalesce(assigned_hub_id, '')"
+
+
 class Meeting(Base):
     """Meeting model for scheduling member meetings"""
     __tablename__ = "meetings"
+    __table_args__ = (
+        # Active meetings of the same Hub never overlap (enforced by the database, race-free)
+        ExcludeConstraint(
+            (text(HUB_KEY), '='),
+            ('time_range', '&&'),
+            using='gist',
+            where=text("status IN ('PENDING', 'CONFIRMED')"),
+            name=OVERLAP_CONSTRAINT
+        ),
+        # At most one pending meeting per member
+        Index(PENDING_CONSTRAINT, 'member_id', unique=True, postgresql_where=text("status = 'PENDING'")),
+        # Member agenda range queries
+        Index('ix_meetings_member_scheduled_date', 'member_id', 'scheduled_date'),
+        # Per-Hub queues
+        Index('ix_meetings_assigned_hub_scheduled_date', 'assigned_hub_id', 'scheduled_date'),
+        # Incremental sync of the Hub load queue
+        Index('ix_meetings_updated_at', 'updated_at'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     
@@ -34,11 +62,17 @@ class Meeting(Base):
     member_id = Column(String, ForeignKey('members.id', ondelete='CASCADE'), nullable=False)
     scheduled_by_id = Column(String, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
     confirmed_by_id = Column(String, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    assigned_hub_id = Column(String, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)  # Hub responsável
+    assigned_at = Column(DateTime, nullable=True)
     
     # Meeting details
     meeting_type = Column(SQLEnum(MeetingType), nullable=False, default=MeetingType.ONLINE)
     scheduled_date = Column(DateTime, nullable=False)
-    duration_minutes = Column(String, default="60")  # Duração padrão: 60 minutos
+    duration_minutes = Column(Integer, nullable=False, default=60)  # Duração padrão: 60 minutos
+    time_range = Column(
+        TSRANGE,
+        Computed("tsrange(scheduled_date, scheduled_date + make_interval(mins => duration_minutes), '[)')", persisted=True)
+    )
     
     # Location/Link
     location = Column(String, nullable=True)  # Para reuniões presenciais
@@ -64,6 +98,7 @@ class Meeting(Base):
     member = relationship("Member", back_populates="meetings")
     scheduled_by = relationship("User", foreign_keys=[scheduled_by_id])
     confirmed_by = relationship("User", foreign_keys=[confirmed_by_id])
+    assigned_hub = relationship("User", foreign_keys=[assigned_hub_id])
 
     def __repr__(self):
         return f"<Meeting {self.id} - {self.member_id} - {self.scheduled_date}>"
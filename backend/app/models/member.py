@@ -1,8 +1,10 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, String, Enum as SQLEnum, DateTime, Integer, ForeignKey, Text, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Enum as SQLEnum, DateTime, Integer, ForeignKey, Text, Float, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, backref, deferred
 from app.core.database import Base
+from app.core.search import tsvector_sql
 import uuid
 
 
@@ -35,9 +37,34 @@ class BusinessCategory(str, enum.Enum):
     OUTROS = "OUTROS"
 
 
+# Category labels as members would type them (searchable)
+CATEGORY_LABELS = {
+    BusinessCategory.TECNOLOGIA: "tecnologia",
+    BusinessCategory.SAUDE: "saúde",
+    BusinessCategory.EDUCACAO: "educação",
+    BusinessCategory.FINANCAS: "finanças",
+    BusinessCategory.MARKETING: "marketing",
+    BusinessCategory.CONSULTORIA: "consultoria",
+    BusinessCategory.CONSTRUCAO: "construção",
+    BusinessCategory.ALIMENTACAO: "alimentação",
+    BusinessCategory.VAREJO: "varejo",
+    BusinessCategory.SERVICOS: "serviços",
+    BusinessCategory.INDUSTRIA: "indústria",
+    BusinessCategory.OUTROS: "",
+}
+_CATEGORY_LABEL_SQL = "CASE business_category " + " ".join(
+    f"WHEN '{category.value}' THEN '{label}'" for category, label in CATEGORY_LABELS.items()
+) + " END"
+
+
 class Member(Base):
     """Member model - Business owner profile"""
     __tablename__ = "members"
+    __table_args__ = (
+        # Incremental sync of the member graph
+        Index('ix_members_updated_at', 'updated_at'),
+        Index('ix_members_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     # Primary Key
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -87,12 +114,24 @@ class Member(Base):
     total_referrals_received = Column(Integer, default=0)
     total_deals_closed = Column(Integer, default=0)
     
+    # Full-text search (maintained by the database, not loaded by default)
+    search_vector = deferred(Column(TSVECTOR, Computed(tsvector_sql(
+        ("company_name", "A"),
+        (_CATEGORY_LABEL_SQL, "B"),
+        ("city", "B"),
+        ("state", "B"),
+        ("company_description", "C"),
+        ("skills", "C"),
+        ("interests", "C"),
+        ("bio", "D"),
+    ), persisted=True)))
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    user = relationship("User", foreign_keys=[user_id], backref="member")
+    user = relationship("User", foreign_keys=[user_id], backref=backref("member", uselist=False))
     meetings = relationship("Meeting", back_populates="member", cascade="all, delete-orphan")
     
     def __repr__(self):
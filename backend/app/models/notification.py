@@ -4,7 +4,7 @@ Notification Model
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -17,11 +17,13 @@ class NotificationType(str, Enum):
     MEETING_CONFIRMED = "MEETING_CONFIRMED"  # Reunião confirmada
     MEETING_CANCELLED = "MEETING_CANCELLED"  # Reunião cancelada
     MEETING_REMINDER = "MEETING_REMINDER"  # Lembrete de reunião
+    VISIT_FOLLOW_UP = "VISIT_FOLLOW_UP"  # Lembrete de follow-up de visita
     NEW_VIDEO = "NEW_VIDEO"  # Novo vídeo disponível
     REFERRAL_APPROVED = "REFERRAL_APPROVED"  # Indicação aprovada
     SYSTEM_ANNOUNCEMENT = "SYSTEM_ANNOUNCEMENT"  # Anúncio do sistema
     PAYMENT_CONFIRMED = "PAYMENT_CONFIRMED"  # Pagamento confirmado
     PAYMENT_REJECTED = "PAYMENT_REJECTED"  # Pagamento rejeitado
+    DIGEST = "DIGEST"  # Resumo de notificações de baixa prioridade
 
 
 class NotificationPriority(str, Enum):
@@ -60,13 +62,34 @@ class Notification(Base):
     is_read = Column(Boolean, default=False, nullable=False)
     read_at = Column(DateTime, nullable=True)
     
+    # Coalescing: number of similar notifications merged into this row
+    group_count = Column(Integer, default=1, nullable=False)
+    
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Atualizado ao agrupar
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=True)  # Notificações podem expirar
     
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+    __table_args__ = (
+        # Inbox listing, newest first
+        Index("ix_notifications_user_created_at", "user_id", "created_at"),
+        # Hot path: unread inbox, badge counts and coalescing lookups
+        Index(
+            "ix_notifications_user_unread_created_at",
+            "user_id", "created_at",
+            postgresql_where=(is_read == False),
+        ),
+        # Expiry sweeper only looks at rows that can expire
+        Index(
+            "ix_notifications_expires_at",
+            "expires_at",
+            postgresql_where=(expires_at.isnot(None)),
+        ),
+    )
+
     def __repr__(self):
         return f"<Notification {self.id} - {self.type} - User {self.user_id}>"
 
@@ -74,3 +97,26 @@ class Notification(Base):
         """Mark notification as read"""
         self.is_read = True
         self.read_at = datetime.utcnow()
+
+
+class PendingDigestItem(Base):
+    """Low-priority notification waiting to be folded into a daily digest"""
+    __tablename__ = "pending_digest_items"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    
+    user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    
+    # Original notification details
+    type = Column(SQLEnum(NotificationType), nullable=False)
+    title = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    action_url = Column(String, nullable=True)
+    related_entity_type = Column(String, nullable=True)
+    related_entity_id = Column(String, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PendingDigestItem {self.id} - {self.type} - User {self.user_id}>"
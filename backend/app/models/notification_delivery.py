@@ -0,0 +1,104 @@
+"""
+Notification Delivery Models - Email and web push delivery of notifications
+"""
+import uuid
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.models.notification import NotificationPriority
+
+
+class DeliveryChannel(str, Enum):
+    """Delivery channel enum"""
+    EMAIL = "EMAIL"
+    WEB_PUSH = "WEB_PUSH"
+
+
+class DeliveryStatus(str, Enum):
+    """Delivery status enum"""
+    PENDING = "PENDING"  # Aguardando envio
+    SENDING = "SENDING"  # Reservada por um worker
+    SENT = "SENT"  # Enviada
+    FAILED = "FAILED"  # Falhou após todas as tentativas
+
+
+class NotificationPreference(Base):
+    """Per-user delivery channel preferences"""
+    __tablename__ = "notification_preferences"
+
+    user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+
+    # Channels
+    email_enabled = Column(Boolean, default=True, nullable=False)
+    push_enabled = Column(Boolean, default=True, nullable=False)
+
+    # Only notifications with this priority or higher leave the app
+    min_priority = Column(SQLEnum(NotificationPriority), default=NotificationPriority.HIGH, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<NotificationPreference user={self.user_id} email={self.email_enabled} push={self.push_enabled}>"
+
+
+class PushSubscription(Base):
+    """Web push subscription of a user's browser"""
+    __tablename__ = "push_subscriptions"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+
+    # Subscription data from the browser Push API
+    endpoint = Column(String, nullable=False, unique=True)
+    p256dh = Column(String, nullable=False)
+    auth = Column(String, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PushSubscription {self.id} - User {self.user_id}>"
+
+
+class NotificationDelivery(Base):
+    """Delivery of a notification through an external channel"""
+    __tablename__ = "notification_deliveries"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    notification_id = Column(String, ForeignKey('notifications.id', ondelete='CASCADE'), nullable=False)
+    user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    channel = Column(SQLEnum(DeliveryChannel), nullable=False)
+
+    # Processing state
+    status = Column(SQLEnum(DeliveryStatus), default=DeliveryStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    claimed_at = Column(DateTime, nullable=True)  # Quando um worker reservou a entrega
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    notification = relationship("Notification")
+
+    __table_args__ = (
+        # Workers only scan deliveries that are waiting or in flight
+        Index(
+            "ix_notification_deliveries_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=(status.in_([DeliveryStatus.PENDING, DeliveryStatus.SENDING])),
+        ),
+        Index("ix_notification_deliveries_notification_id", "notification_id"),
+    )
+
+    def __repr__(self):
+        return f"<NotificationDelivery {self.id} - {self.channel} - {self.status}>"
@@ -0,0 +1,49 @@
+"""
+Outbox Model - Side effects recorded in the same transaction as the business change
+"""
+import uuid
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, Index, Enum as SQLEnum
+
+from app.core.database import Base
+
+
+class OutboxStatus(str, Enum):
+    """Outbox event status enum"""
+    PENDING = "PENDING"  # Aguardando processamento
+    DONE = "DONE"  # Processado com sucesso
+    DEAD = "DEAD"  # Falhou após todas as tentativas
+
+
+class OutboxEvent(Base):
+    """Outbox event model - drained in batches by the outbox worker"""
+    __tablename__ = "outbox_events"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Event details
+    event_type = Column(String, nullable=False)  # Ex: "notification.create"
+    payload = Column(JSON, nullable=False)
+
+    # Processing state
+    status = Column(SQLEnum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Próxima tentativa
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Only pending events are ever scanned by the worker
+        Index(
+            "ix_outbox_events_pending_available_at",
+            "available_at",
+            postgresql_where=(status == OutboxStatus.PENDING),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent {self.id} - {self.event_type} - {self.status}>"
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, String, Enum as SQLEnum, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Enum as SQLEnum, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import uuid
@@ -26,6 +26,10 @@ class ReferralStatus(str, enum.Enum):
 class Referral(Base):
     """Referral model - Business referrals between members"""
     __tablename__ = "referrals"
+    __table_args__ = (
+        # Incremental sync of the member graph
+        Index('ix_referrals_updated_at', 'updated_at'),
+    )
 
     # Primary Key
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -0,0 +1,52 @@
+"""
+Scheduled Job Model - Persistent due-queue for time-based work (reminders, follow-ups)
+"""
+import uuid
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index, Enum as SQLEnum
+
+from app.core.database import Base
+
+
+class ScheduledJobStatus(str, Enum):
+    """Scheduled job status enum"""
+    PENDING = "PENDING"  # Aguardando o horário de execução
+    DEAD = "DEAD"  # Falhou após todas as tentativas
+
+
+class ScheduledJob(Base):
+    """
+    Scheduled job model - claimed by the scheduler worker once run_at is reached.
+    Jobs are deleted when they run, so the table only holds upcoming and dead jobs.
+    """
+    __tablename__ = "scheduled_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Job details
+    job_type = Column(String, nullable=False)  # Ex: "meeting.reminder"
+    entity_id = Column(String, nullable=False)  # Reunião, reunião coletiva ou visita
+    run_at = Column(DateTime, nullable=False)  # Quando deve ser executado (UTC; eventos são convertidos do horário local)
+
+    # Processing state
+    status = Column(SQLEnum(ScheduledJobStatus), nullable=False, default=ScheduledJobStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # The worker only ever scans pending jobs by due time
+        Index(
+            "ix_scheduled_jobs_pending_run_at",
+            "run_at",
+            postgresql_where=(status == ScheduledJobStatus.PENDING),
+        ),
+        # Rescheduling and cancelling look jobs up by entity
+        Index("ix_scheduled_jobs_entity", "entity_id", "job_type"),
+    )
+
+    def __repr__(self):
+        return f"<ScheduledJob {self.id} - {self.job_type} - {self.run_at} - {self.status}>"
@@ -3,7 +3,7 @@ Video Progress Model - Track user video watching progress
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -11,6 +11,10 @@ from app.core.database import Base
 class VideoProgress(Base):
     """Track user progress on onboarding videos"""
     __tablename__ = "video_progress"
+    __table_args__ = (
+        # Uma linha por usuário e vídeo (a lista de vídeos faz LEFT JOIN por usuário)
+        UniqueConstraint("user_id", "video_id", name="uq_video_progress_user_video"),
+    )
     
     # Primary Key
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
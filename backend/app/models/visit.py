@@ -4,10 +4,12 @@ Visit Model - Members visiting other members for networking
 import uuid
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer, Index, Computed, Enum as SQLEnum, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 
 from app.core.database import Base
+from app.core.search import tsvector_sql
 
 
 class VisitPurpose(str, Enum):
@@ -28,9 +30,24 @@ class VisitStatus(str, Enum):
     NAO_REALIZADA = "NAO_REALIZADA"  # Não compareceu
 
 
+# Completed visits with a follow-up still to be done
+FOLLOW_UP_OPEN = "status = 'REALIZADA' AND follow_up_needed IS NOT NULL AND follow_up_completed_at IS NULL"
+
+
 class Visit(Base):
     """Visit model - Members visiting other members"""
     __tablename__ = "visits"
+    __table_args__ = (
+        # Member agenda range queries (as visitor and as visited)
+        Index('ix_visits_visitor_visit_date', 'visitor_id', 'visit_date'),
+        Index('ix_visits_visited_visit_date', 'visited_id', 'visit_date'),
+        # Incremental sync of the member graph
+        Index('ix_visits_updated_at', 'updated_at'),
+        # Follow-up queue (Hub-wide and per visitor), ordered by due date
+        Index('ix_visits_follow_up_queue', 'follow_up_date', 'id', postgresql_where=text(FOLLOW_UP_OPEN)),
+        Index('ix_visits_visitor_follow_up_queue', 'visitor_id', 'follow_up_date', 'id', postgresql_where=text(FOLLOW_UP_OPEN)),
+        Index('ix_visits_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     
@@ -59,6 +76,16 @@ class Visit(Base):
     # Follow-up
     follow_up_needed = Column(String, nullable=True)  # Ações de follow-up necessárias
     follow_up_date = Column(DateTime, nullable=True)  # Data para follow-up
+    follow_up_completed_at = Column(DateTime, nullable=True)  # Quando o follow-up foi feito
+    
+    # Full-text search (maintained by the database, not loaded by default)
+    search_vector = deferred(Column(TSVECTOR, Computed(tsvector_sql(
+        ("services_learned", "A"),
+        ("potential_referrals", "A"),
+        ("visit_summary", "B"),
+        ("follow_up_needed", "C"),
+        ("visitor_notes", "C"),
+    ), persisted=True)))
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,25 @@
+"""
+Agenda Schemas
+"""
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel
+
+
+class AgendaItemType(str, Enum):
+    """Source of an agenda item"""
+    MEETING = "MEETING"  # Reunião 1:1 com o Hub
+    COLLECTIVE_MEETING = "COLLECTIVE_MEETING"  # Reunião coletiva
+    VISIT = "VISIT"  # Visita (feita ou recebida)
+
+
+class AgendaItem(BaseModel):
+    """One event in a member's agenda"""
+    type: AgendaItemType
+    id: str
+    title: str
+    start: datetime
+    end: datetime
+    status: str  # Status da origem (MeetingStatus, CollectiveMeetingStatus ou VisitStatus)
+    location: Optional[str] = None
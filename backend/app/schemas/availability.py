@@ -0,0 +1,92 @@
+"""
+Hub Availability Schemas
+"""
+from datetime import date, datetime
+from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.models.meeting import MeetingType
+from app.models.member import BusinessCategory
+
+
+# Working hours
+class WorkingHoursInterval(BaseModel):
+    """Weekly working interval (minutes since local midnight, APP_TIMEZONE)"""
+    weekday: int = Field(..., ge=0, le=6, description="0 = segunda ... 6 = domingo")
+    start_minute: int = Field(..., ge=0, le=1440)
+    end_minute: int = Field(..., ge=0, le=1440)
+    
+    @model_validator(mode='after')
+    def validate_range(self):
+        if self.start_minute >= self.end_minute:
+            raise ValueError('O início deve ser anterior ao fim')
+        return self
+
+
+class WorkingHoursUpdate(BaseModel):
+    """Schema for replacing a Hub's working hours"""
+    intervals: List[WorkingHoursInterval]
+
+
+class WorkingHoursResponse(WorkingHoursInterval):
+    """Schema for working hours response"""
+    id: str
+    hub_user_id: str
+    
+    class Config:
+        from_attributes = True
+
+
+# Blocked periods
+class BlockedPeriodCreate(BaseModel):
+    """Schema for blocking a period (local times, like meeting dates)"""
+    starts_at: datetime
+    ends_at: datetime
+    reason: Optional[str] = Field(None, max_length=500)
+
+
+class BlockedPeriodResponse(BlockedPeriodCreate):
+    """Schema for blocked period response"""
+    id: str
+    hub_user_id: str
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+# Free/busy
+class DayFreeBusy(BaseModel):
+    """Free/busy bitmap of a Hub day (bit i = slot i after midnight, 1 = free)"""
+    date: date
+    slot_minutes: int
+    free_bitmap: str  # Hexadecimal
+    free_minutes: int
+
+
+# Assignment profile
+class HubProfileUpdate(BaseModel):
+    """Schema for replacing a Hub's assignment profile (empty lists = any)"""
+    meeting_types: List[MeetingType] = []
+    business_categories: List[BusinessCategory] = []
+    accepting_meetings: bool = True
+    max_active_meetings: Optional[int] = Field(None, ge=1)
+
+
+class HubProfileResponse(HubProfileUpdate):
+    """Schema for assignment profile response"""
+    hub_user_id: str
+    updated_at: datetime
+    
+    @field_validator('meeting_types', 'business_categories', mode='before')
+    @classmethod
+    def split_values(cls, v):
+        # Stored comma-separated
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return v.split(",")
+        return v
+    
+    class Config:
+        from_attributes = True
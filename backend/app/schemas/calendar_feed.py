@@ -0,0 +1,14 @@
+"""
+Calendar Feed Schemas
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CalendarFeedInfo(BaseModel):
+    """Subscription URL of the member's ICS feed"""
+    token: str
+    url: str
+    rendered_at: Optional[datetime] = None
+    created_at: datetime
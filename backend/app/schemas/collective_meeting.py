@@ -1,11 +1,11 @@
 """
 Collective Meeting Schemas
 """
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from app.models.collective_meeting import CollectiveMeetingType, CollectiveMeetingStatus
+from app.models.collective_meeting import CollectiveMeetingType, CollectiveMeetingStatus, SeriesFrequency, WEEKDAYS
 
 
 # Base Schema
@@ -49,6 +49,7 @@ class CollectiveMeetingResponse(CollectiveMeetingBase):
     total_invited: int
     total_confirmed: int
     total_attended: int
+    series_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     cancelled_at: Optional[datetime]
@@ -58,6 +59,76 @@ class CollectiveMeetingResponse(CollectiveMeetingBase):
         from_attributes = True
 
 
+# Recurring series
+class CollectiveMeetingSeriesCreate(BaseModel):
+    """Schema for creating a recurring series"""
+    title: str = Field(..., min_length=3, max_length=200)
+    description: Optional[str] = Field(None, max_length=2000)
+    meeting_type: CollectiveMeetingType
+    duration_minutes: int = 60
+    location: Optional[str] = None
+    meeting_link: Optional[str] = None
+    agenda: Optional[str] = None
+    starts_at: datetime
+    frequency: SeriesFrequency = SeriesFrequency.WEEKLY
+    interval: int = Field(1, ge=1, le=52)
+    by_weekday: Optional[str] = Field(None, description="Dias da semana, ex: MO,TH (apenas WEEKLY)")
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(None, ge=1, le=1000)
+    
+    @field_validator('by_weekday')
+    @classmethod
+    def validate_weekdays(cls, v):
+        if v is None:
+            return v
+        days = [day.strip().upper() for day in v.split(",") if day.strip()]
+        if not days or any(day not in WEEKDAYS for day in days):
+            raise ValueError(f'Dias inválidos, use: {",".join(WEEKDAYS)}')
+        return ",".join(days)
+
+
+class CollectiveMeetingSeriesUpdate(BaseModel):
+    """Schema for updating the template of a series"""
+    title: Optional[str] = Field(None, min_length=3, max_length=200)
+    description: Optional[str] = None
+    meeting_type: Optional[CollectiveMeetingType] = None
+    duration_minutes: Optional[int] = None
+    location: Optional[str] = None
+    meeting_link: Optional[str] = None
+    agenda: Optional[str] = None
+
+
+class CollectiveMeetingSeriesResponse(CollectiveMeetingSeriesCreate):
+    """Schema for series response"""
+    id: str
+    rrule: str
+    is_active: bool
+    materialized_until: Optional[datetime]
+    created_by_id: str
+    created_at: datetime
+    updated_at: datetime
+    cancelled_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+
+class CollectiveMeetingOccurrence(BaseModel):
+    """Collective meeting in a date range (id is None until the occurrence is materialized)"""
+    id: Optional[str]
+    series_id: Optional[str]
+    materialized: bool
+    title: str
+    description: Optional[str]
+    meeting_type: CollectiveMeetingType
+    scheduled_date: datetime
+    duration_minutes: int
+    location: Optional[str]
+    meeting_link: Optional[str]
+    agenda: Optional[str]
+    status: CollectiveMeetingStatus
+
+
 # Attendee Schema
 class MeetingAttendee(BaseModel):
     """Schema for meeting attendee"""
@@ -71,7 +142,16 @@ class MeetingAttendee(BaseModel):
 
 # Meeting with Attendees
 class CollectiveMeetingWithAttendees(CollectiveMeetingResponse):
-    """Collective meeting with attendee list"""
+    """Collective meeting with attendee list (None when the roster was not requested)"""
+    attendees: Optional[List[MeetingAttendee]] = None
+
+
+# Paged roster
+class MeetingAttendeeList(BaseModel):
+    """Page of a meeting's attendee roster"""
+    total: int
+    skip: int
+    limit: int
     attendees: List[MeetingAttendee]
 
 
@@ -87,6 +167,71 @@ class MarkAttendance(BaseModel):
     member_ids: List[str]
 
 
+# QR Check-in
+class CheckinToken(BaseModel):
+    """Signed token encoded in the member's check-in QR code"""
+    token: str
+    expires_at: datetime
+
+
+class CheckinScan(BaseModel):
+    """Schema for a scanned check-in QR code"""
+    token: str = Field(..., min_length=1)
+
+
+class CheckinResult(BaseModel):
+    """Result of a check-in scan"""
+    member_id: str
+    member_name: Optional[str]
+    already_checked_in: bool
+    checked_in: int
+
+
+class LiveCheckins(BaseModel):
+    """Live check-in count"""
+    meeting_id: str
+    checked_in: int
+    pending_flush: int
+
+
+# Member attendance (precomputed, completed meetings only)
+class MonthlyAttendance(BaseModel):
+    """Attendance of a member in one month"""
+    month: date
+    meetings_invited: int
+    meetings_confirmed: int
+    meetings_attended: int
+    
+    class Config:
+        from_attributes = True
+
+
+class MemberAttendance(BaseModel):
+    """Attendance summary and monthly history of a member"""
+    member_id: str
+    last_n: int  # Tamanho da janela da taxa recente
+    meetings_invited: int
+    meetings_attended: int
+    recent_invited: int
+    recent_attended: int
+    recent_attendance_rate: Optional[float]
+    last_attended_at: Optional[datetime]
+    history: List[MonthlyAttendance]
+
+
+class MemberAttendanceReportItem(BaseModel):
+    """Member attendance row of the Hub report"""
+    member_id: str
+    member_name: str
+    company_name: str
+    meetings_invited: int
+    meetings_attended: int
+    recent_invited: int
+    recent_attended: int
+    recent_attendance_rate: Optional[float]
+    last_attended_at: Optional[datetime]
+
+
 # Statistics
 class CollectiveMeetingStats(BaseModel):
     """Collective meeting statistics"""
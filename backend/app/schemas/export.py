@@ -0,0 +1,12 @@
+"""
+Export Schemas
+"""
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """File format of an export"""
+    CSV = "csv"
+    NDJSON = "ndjson"  # Um objeto JSON por linha
+    XLSX = "xlsx"  # Requer openpyxl
+    PARQUET = "parquet"  # Requer pyarrow
@@ -0,0 +1,45 @@
+"""
+Member Graph Schemas
+"""
+from datetime import datetime
+from enum import Enum
+from pydantic import BaseModel
+
+
+class GraphMetric(str, Enum):
+    """How members are ranked"""
+    DEGREE = "DEGREE"  # Membros distintos com quem se relaciona
+    IN_DEGREE = "IN_DEGREE"  # Membros que o visitaram ou indicaram
+    OUT_DEGREE = "OUT_DEGREE"  # Membros que visitou ou indicou
+    PAGERANK = "PAGERANK"  # Centralidade ponderada pelas interações
+
+
+class GraphMember(BaseModel):
+    """A member as a node of the graph"""
+    id: str
+    company_name: str
+    business_category: str
+
+
+class SecondDegreeConnection(GraphMember):
+    """A contact of the member's contacts"""
+    mutual_connections: int
+
+
+class MemberRanking(GraphMember):
+    """A member's position in a ranking"""
+    score: float
+    in_degree: int
+    out_degree: int
+
+
+class GraphStats(BaseModel):
+    """Size of the relationship graph"""
+    members: int
+    active_members: int
+    edges: int  # Pares (origem, destino) distintos
+    visits: int
+    referrals: int
+    isolated_members: int
+    density: float
+    built_at: datetime
@@ -2,7 +2,7 @@
 Meeting Schemas
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.meeting import MeetingType, MeetingStatus
@@ -12,7 +12,7 @@ from app.models.meeting import MeetingType, MeetingStatus
 class MeetingBase(BaseModel):
     meeting_type: MeetingType
     scheduled_date: datetime
-    duration_minutes: str = "60"
+    duration_minutes: int = 60
     location: Optional[str] = None
     meeting_link: Optional[str] = None
     member_notes: Optional[str] = None
@@ -21,7 +21,8 @@ class MeetingBase(BaseModel):
 # Create Schema
 class MeetingCreate(MeetingBase):
     """Schema for creating a meeting"""
-    pass
+    # Limits apply to new input only: legacy meetings may be shorter or longer
+    duration_minutes: int = Field(60, ge=15, le=480)
     
     @field_validator('scheduled_date')
     @classmethod
@@ -36,7 +37,7 @@ class MeetingUpdate(BaseModel):
     """Schema for updating a meeting"""
     meeting_type: Optional[MeetingType] = None
     scheduled_date: Optional[datetime] = None
-    duration_minutes: Optional[str] = None
+    duration_minutes: Optional[int] = Field(None, ge=15, le=480)
     location: Optional[str] = None
     meeting_link: Optional[str] = None
     member_notes: Optional[str] = None
@@ -62,6 +63,71 @@ class MeetingComplete(BaseModel):
     hub_notes: Optional[str] = None
 
 
+# Batch Hub Actions
+class MeetingConfirmItem(MeetingConfirm):
+    """One meeting of a batch confirmation"""
+    meeting_id: str
+
+
+class MeetingCancelItem(MeetingCancel):
+    """One meeting of a batch cancellation"""
+    meeting_id: str
+
+
+class MeetingCompleteItem(MeetingComplete):
+    """One meeting of a batch completion"""
+    meeting_id: str
+
+
+class MeetingBatchConfirm(BaseModel):
+    """Schema for confirming several meetings"""
+    items: List[MeetingConfirmItem] = Field(..., min_length=1, max_length=200)
+
+
+class MeetingBatchCancel(BaseModel):
+    """Schema for cancelling several meetings"""
+    items: List[MeetingCancelItem] = Field(..., min_length=1, max_length=200)
+
+
+class MeetingBatchComplete(BaseModel):
+    """Schema for completing several meetings"""
+    items: List[MeetingCompleteItem] = Field(..., min_length=1, max_length=200)
+
+
+class MeetingBatchItemResult(BaseModel):
+    """Outcome of one meeting in a batch"""
+    meeting_id: str
+    success: bool
+    status: Optional[MeetingStatus] = None  # Status após a ação (ou atual, em caso de erro)
+    error: Optional[str] = None
+
+
+class MeetingBatchResult(BaseModel):
+    """Per-item report of a batch action"""
+    requested: int
+    succeeded: int
+    failed: int
+    results: List[MeetingBatchItemResult]
+
+
+# Hub Assignment
+class MeetingAssign(BaseModel):
+    """Schema for assigning a meeting to a Hub"""
+    hub_id: str
+    override: bool = Field(False, description="Admins only: assign even if the Hub's profile refuses new meetings")
+
+
+class HubQueueSummary(BaseModel):
+    """Upcoming meetings of a Hub (hub_id None = unassigned)"""
+    hub_id: Optional[str]
+    hub_name: Optional[str]
+    pending: int
+    confirmed: int
+    load: int
+    accepting_meetings: bool
+    max_active_meetings: Optional[int]
+
+
 # Response Schemas
 class MeetingMemberInfo(BaseModel):
     """Member info for meeting response"""
@@ -81,6 +147,8 @@ class MeetingResponse(MeetingBase):
     member_id: str
     scheduled_by_id: Optional[str]
     confirmed_by_id: Optional[str]
+    assigned_hub_id: Optional[str]
+    assigned_at: Optional[datetime]
     status: MeetingStatus
     hub_notes: Optional[str]
     cancellation_reason: Optional[str]
@@ -2,7 +2,7 @@
 Notification Schemas
 """
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from pydantic import BaseModel, Field
 
 from app.models.notification import NotificationType, NotificationPriority
@@ -40,7 +40,9 @@ class NotificationResponse(NotificationBase):
     user_id: str
     is_read: bool
     read_at: Optional[datetime]
+    group_count: int = 1  # Notificações semelhantes agrupadas nesta
     created_at: datetime
+    updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -52,6 +54,17 @@ class NotificationMarkAllRead(BaseModel):
     user_id: str
 
 
+class NotificationBatch(BaseModel):
+    """Schema for batch actions on a list of notifications"""
+    notification_ids: List[str] = Field(..., min_length=1, max_length=500)
+
+
+class NotificationBatchResult(BaseModel):
+    """Result of a batch action"""
+    requested: int
+    affected: int
+
+
 # Statistics
 class NotificationStats(BaseModel):
     """Notification statistics"""
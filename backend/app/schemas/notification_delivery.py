@@ -0,0 +1,67 @@
+"""
+Notification Delivery Schemas
+"""
+from datetime import datetime
+from typing import Optional, Dict
+from pydantic import BaseModel, Field
+
+from app.models.notification import NotificationPriority
+
+
+# Preferences
+class NotificationPreferenceUpdate(BaseModel):
+    """Schema for updating delivery preferences"""
+    email_enabled: Optional[bool] = None
+    push_enabled: Optional[bool] = None
+    min_priority: Optional[NotificationPriority] = None
+
+
+class NotificationPreferenceResponse(BaseModel):
+    """Schema for delivery preferences response"""
+    user_id: str
+    email_enabled: bool
+    push_enabled: bool
+    min_priority: NotificationPriority
+
+    class Config:
+        from_attributes = True
+
+
+# Web push subscriptions
+class PushSubscriptionCreate(BaseModel):
+    """Schema for registering a browser push subscription"""
+    endpoint: str = Field(..., min_length=1, max_length=2000)
+    p256dh: str = Field(..., min_length=1)
+    auth: str = Field(..., min_length=1)
+
+
+class PushSubscriptionResponse(BaseModel):
+    """Schema for push subscription response"""
+    id: str
+    endpoint: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# Metrics
+class ChannelDeliveryMetrics(BaseModel):
+    """Backlog and throughput of a delivery channel"""
+    pending: int
+    sending: int
+    sent: int
+    failed: int
+    worker_sent: int = 0
+    worker_failed: int = 0
+    worker_batches: int = 0
+    avg_batch_seconds: Optional[float] = None
+    sent_per_second: float = 0.0
+
+
+class DeliveryMetrics(BaseModel):
+    """Delivery metrics"""
+    backend: str
+    worker_started_at: datetime
+    oldest_pending_at: Optional[datetime]
+    channels: Dict[str, ChannelDeliveryMetrics]
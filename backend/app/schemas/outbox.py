@@ -0,0 +1,15 @@
+"""
+Outbox Schemas
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+# Statistics
+class OutboxStats(BaseModel):
+    """Outbox statistics"""
+    pending_events: int
+    done_events: int
+    dead_events: int
+    oldest_pending_at: Optional[datetime]
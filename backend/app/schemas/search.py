@@ -0,0 +1,24 @@
+"""
+Search Schemas
+"""
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SearchResultType(str, Enum):
+    """What a search result is"""
+    MEMBER = "MEMBER"  # Perfil de membro
+    VISIT = "VISIT"  # Resumo de visita
+    COLLECTIVE_MEETING = "COLLECTIVE_MEETING"  # Reunião coletiva (pauta e ata)
+
+
+class SearchResult(BaseModel):
+    """One ranked search hit"""
+    type: SearchResultType
+    id: str
+    title: str
+    date: Optional[datetime] = None  # Data da visita ou da reunião
+    rank: float
+    headline: str  # Trecho em HTML escapado, com os termos encontrados entre <mark></mark>
@@ -2,7 +2,7 @@
 Visit Schemas
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from app.models.visit import VisitPurpose, VisitStatus
@@ -57,6 +57,7 @@ class VisitResponse(VisitBase):
     networking_quality: Optional[int]
     follow_up_needed: Optional[str]
     follow_up_date: Optional[datetime]
+    follow_up_completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime]
@@ -74,6 +75,26 @@ class VisitWithMembers(VisitResponse):
     visited_company: str
 
 
+# Follow-up Queue
+class VisitFollowUpItem(BaseModel):
+    """A follow-up still to be done after a visit"""
+    id: str  # Visita
+    visitor_id: str
+    visitor_company: str
+    visited_id: str
+    visited_company: str
+    visit_date: datetime
+    follow_up_needed: str
+    follow_up_date: datetime
+    overdue: bool
+
+
+class VisitFollowUpPage(BaseModel):
+    """A page of the follow-up queue (pass next_cursor to get the next one)"""
+    items: List[VisitFollowUpItem]
+    next_cursor: Optional[str] = None
+
+
 # Visit Statistics
 class VisitStats(BaseModel):
     """Visit statistics"""
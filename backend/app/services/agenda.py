@@ -0,0 +1,163 @@
+"""
+Agenda Service - A member's 1:1 meetings, collective meetings and visits as one stream
+
+Each source is an indexed range query already ordered by start; heapq.merge
+combines them lazily, so a page only reads skip + limit rows per source.
+"""
+import heapq
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import or_
+from fastapi import HTTPException, status
+
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
+from app.models.visit import Visit, VisitStatus
+from app.models.member import Member
+from app.schemas.agenda import AgendaItemType
+
+
+# Longest event considered when looking for overlaps (range queries start this much earlier)
+AGENDA_LOOKBACK_HOURS = 24
+
+
+def _item(item_type: AgendaItemType, item_id: str, title: str, start: datetime, duration_minutes, item_status, location=None) -> Dict[str, Any]:
+    return {
+        "type": item_type,
+        "id": item_id,
+        "title": title,
+        "start": start,
+        "end": start + timedelta(minutes=duration_minutes or 60),
+        "status": item_status.value,
+        "location": location
+    }
+
+
+def _sort_key(item: Dict[str, Any]):
+    return (item["start"], item["type"].value, item["id"])
+
+
+# Sources (ordered by start, then ID)
+
+def _meetings(db: Session, member_id: str, since: datetime, until: datetime, limit: int, active_only: bool) -> Iterator[Dict[str, Any]]:
+    statuses = [MeetingStatus.PENDING, MeetingStatus.CONFIRMED]
+    if not active_only:
+        statuses.append(MeetingStatus.COMPLETED)
+    rows = db.query(
+        Meeting.id, Meeting.scheduled_date, Meeting.duration_minutes, Meeting.status, Meeting.location, Meeting.meeting_link
+    ).filter(
+        Meeting.member_id == member_id,
+        Meeting.scheduled_date >= since,
+        Meeting.scheduled_date < until,
+        Meeting.status.in_(statuses)
+    ).order_by(Meeting.scheduled_date, Meeting.id).limit(limit)
+    for row in rows:
+        yield _item(
+            AgendaItemType.MEETING, row.id, "Reunião com o Hub", row.scheduled_date,
+            row.duration_minutes, row.status, row.location or row.meeting_link
+        )
+
+
+def _collective_meetings(db: Session, member_id: str, since: datetime, until: datetime, limit: int, active_only: bool) -> Iterator[Dict[str, Any]]:
+    statuses = [CollectiveMeetingStatus.AGENDADA, CollectiveMeetingStatus.CONFIRMADA]
+    if not active_only:
+        statuses.append(CollectiveMeetingStatus.REALIZADA)
+    query = db.query(
+        CollectiveMeeting.id, CollectiveMeeting.title, CollectiveMeeting.scheduled_date, CollectiveMeeting.duration_minutes,
+        CollectiveMeeting.status, CollectiveMeeting.location, CollectiveMeeting.meeting_link
+    ).join(
+        meeting_attendees, meeting_attendees.c.meeting_id == CollectiveMeeting.id
+    ).filter(
+        meeting_attendees.c.member_id == member_id,
+        CollectiveMeeting.scheduled_date >= since,
+        CollectiveMeeting.scheduled_date < until,
+        CollectiveMeeting.status.in_(statuses)
+    )
+    if active_only:
+        # Every member is invited; only confirmed attendance blocks the slot
+        query = query.filter(meeting_attendees.c.confirmed == True)
+    for row in query.order_by(CollectiveMeeting.scheduled_date, CollectiveMeeting.id).limit(limit):
+        yield _item(
+            AgendaItemType.COLLECTIVE_MEETING, row.id, row.title, row.scheduled_date,
+            row.duration_minutes, row.status, row.location or row.meeting_link
+        )
+
+
+def _visits(db: Session, member_id: str, since: datetime, until: datetime, limit: int, active_only: bool) -> Iterator[Dict[str, Any]]:
+    statuses = [VisitStatus.AGENDADA]
+    if not active_only:
+        statuses.append(VisitStatus.REALIZADA)
+    visitor = aliased(Member)
+    visited = aliased(Member)
+    rows = db.query(
+        Visit.id, Visit.visitor_id, Visit.visit_date, Visit.duration_minutes, Visit.status, Visit.location,
+        visitor.company_name.label("visitor_company"),
+        visited.company_name.label("visited_company")
+    ).join(
+        visitor, visitor.id == Visit.visitor_id
+    ).join(
+        visited, visited.id == Visit.visited_id
+    ).filter(
+        or_(Visit.visitor_id == member_id, Visit.visited_id == member_id),
+        Visit.visit_date >= since,
+        Visit.visit_date < until,
+        Visit.status.in_(statuses)
+    ).order_by(Visit.visit_date, Visit.id).limit(limit)
+    for row in rows:
+        title = f"Visita: {row.visited_company}" if row.visitor_id == member_id else f"Visita de {row.visitor_company}"
+        yield _item(
+            AgendaItemType.VISIT, row.id, title, row.visit_date,
+            row.duration_minutes, row.status, row.location
+        )
+
+
+SOURCES = [_meetings, _collective_meetings, _visits]
+
+
+def _merged(db: Session, member_id: str, since: datetime, until: datetime, limit: int, active_only: bool) -> Iterator[Dict[str, Any]]:
+    """k-way merge of the sources by start"""
+    return heapq.merge(
+        *(source(db, member_id, since, until, limit, active_only) for source in SOURCES),
+        key=_sort_key
+    )
+
+
+def get_agenda(
+    db: Session,
+    member_id: str,
+    date_from: datetime,
+    date_to: datetime,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """A page of the member's agenda: events starting in [date_from, date_to), cancelled ones excluded"""
+    return list(islice(_merged(db, member_id, date_from, date_to, skip + limit, False), skip, skip + limit))
+
+
+def find_conflicts(db: Session, member_id: str, start: datetime, duration_minutes: int) -> List[Dict[str, Any]]:
+    """Active events of the member overlapping [start, start + duration)"""
+    end = start + timedelta(minutes=duration_minutes)
+    since = start - timedelta(hours=AGENDA_LOOKBACK_HOURS)
+    # The range query bounds the scan; the few candidates are checked exactly here
+    candidates = _merged(db, member_id, since, end, None, True)
+    return [item for item in candidates if item["end"] > start]
+
+
+def check_conflicts(db: Session, member_id: str, start: datetime, duration_minutes: int, own_agenda: bool = True) -> None:
+    """Raise 409 Conflict when the slot overlaps the member's agenda"""
+    conflicts = find_conflicts(db, member_id, start, duration_minutes or 60)
+    if not conflicts:
+        return
+    if not own_agenda:
+        # Other members' events are not disclosed
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="O membro visitado já tem um compromisso neste horário"
+        )
+    first = conflicts[0]
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Conflito de agenda: {first['title']} em {first['start'].strftime('%d/%m/%Y às %H:%M')}"
+    )
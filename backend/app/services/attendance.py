@@ -0,0 +1,192 @@
+"""
+Attendance Service - Precomputed collective meeting attendance per member
+
+Rollups only count completed (REALIZADA) meetings and are refreshed incrementally,
+for the members and month of a meeting, whenever its attendance can change.
+"""
+from typing import List, Optional, Dict, Any, Union
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select, literal, Date, cast
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.models.attendance import MemberAttendanceMonthly, MemberAttendanceSummary
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
+from app.models.member import Member
+from app.models.user import User
+
+
+MemberFilter = Union[List[str], Select]
+
+
+def _month_bounds(value: datetime) -> tuple:
+    start = date(value.year, value.month, 1)
+    end = date(value.year + (value.month == 12), value.month % 12 + 1, 1)
+    return start, end
+
+
+def _completed_attendance():
+    """Attendee rows of completed meetings"""
+    return meeting_attendees.join(
+        CollectiveMeeting,
+        CollectiveMeeting.id == meeting_attendees.c.meeting_id
+    )
+
+
+def _refresh_monthly(db: Session, member_filter: Optional[MemberFilter] = None, month: Optional[date] = None) -> None:
+    month_column = cast(func.date_trunc('month', CollectiveMeeting.scheduled_date), Date)
+    conditions = [CollectiveMeeting.status == CollectiveMeetingStatus.REALIZADA]
+    stale = db.query(MemberAttendanceMonthly)
+
+    if member_filter is not None:
+        conditions.append(meeting_attendees.c.member_id.in_(member_filter))
+        stale = stale.filter(MemberAttendanceMonthly.member_id.in_(member_filter))
+    if month is not None:
+        start, end = _month_bounds(month)
+        conditions += [CollectiveMeeting.scheduled_date >= start, CollectiveMeeting.scheduled_date < end]
+        stale = stale.filter(MemberAttendanceMonthly.month == start)
+
+    stale.delete(synchronize_session=False)
+
+    rows = select(
+        meeting_attendees.c.member_id,
+        month_column,
+        func.count(),
+        func.count().filter(meeting_attendees.c.confirmed == True),
+        func.count().filter(meeting_attendees.c.attended == True),
+        literal(datetime.utcnow())
+    ).select_from(_completed_attendance()).where(and_(*conditions)).group_by(
+        meeting_attendees.c.member_id,
+        month_column
+    )
+    db.execute(MemberAttendanceMonthly.__table__.insert().from_select(
+        ["member_id", "month", "meetings_invited", "meetings_confirmed", "meetings_attended", "updated_at"],
+        rows
+    ))
+
+
+def _refresh_summary(db: Session, member_filter: Optional[MemberFilter] = None) -> None:
+    conditions = [CollectiveMeeting.status == CollectiveMeetingStatus.REALIZADA]
+    stale = db.query(MemberAttendanceSummary)
+
+    if member_filter is not None:
+        conditions.append(meeting_attendees.c.member_id.in_(member_filter))
+        stale = stale.filter(MemberAttendanceSummary.member_id.in_(member_filter))
+
+    stale.delete(synchronize_session=False)
+
+    ranked = select(
+        meeting_attendees.c.member_id,
+        meeting_attendees.c.attended,
+        CollectiveMeeting.scheduled_date,
+        func.row_number().over(
+            partition_by=meeting_attendees.c.member_id,
+            order_by=CollectiveMeeting.scheduled_date.desc()
+        ).label("position")
+    ).select_from(_completed_attendance()).where(and_(*conditions)).subquery()
+
+    recent = ranked.c.position <= settings.ATTENDANCE_RATE_LAST_N
+    recent_invited = func.count().filter(recent)
+    recent_attended = func.count().filter(and_(recent, ranked.c.attended == True))
+
+    rows = select(
+        ranked.c.member_id,
+        func.count(),
+        func.count().filter(ranked.c.attended == True),
+        recent_invited,
+        recent_attended,
+        recent_attended * 100.0 / func.nullif(recent_invited, 0),
+        func.max(ranked.c.scheduled_date).filter(ranked.c.attended == True),
+        literal(datetime.utcnow())
+    ).group_by(ranked.c.member_id)
+    db.execute(MemberAttendanceSummary.__table__.insert().from_select(
+        [
+            "member_id", "meetings_invited", "meetings_attended",
+            "recent_invited", "recent_attended", "recent_attendance_rate",
+            "last_attended_at", "updated_at"
+        ],
+        rows
+    ))
+
+
+def refresh_members(db: Session, member_filter: MemberFilter, month: datetime) -> None:
+    """Recompute rollups for the given members (list of IDs or a select of IDs), without committing"""
+    _refresh_monthly(db, member_filter, month)
+    _refresh_summary(db, member_filter)
+
+
+def refresh_for_meeting(db: Session, meeting: CollectiveMeeting) -> None:
+    """Recompute rollups for a meeting's attendees (no-op unless the meeting was completed)"""
+    if meeting.status != CollectiveMeetingStatus.REALIZADA:
+        return
+    db.flush()
+    refresh_members(
+        db,
+        select(meeting_attendees.c.member_id).where(meeting_attendees.c.meeting_id == meeting.id),
+        meeting.scheduled_date
+    )
+
+
+def rebuild_rollups(db: Session) -> Dict[str, int]:
+    """Rebuild every rollup from scratch (backfill or repair)"""
+    _refresh_monthly(db)
+    _refresh_summary(db)
+    db.commit()
+    return {
+        "monthly_rows": db.query(func.count(MemberAttendanceMonthly.member_id)).scalar(),
+        "members": db.query(func.count(MemberAttendanceSummary.member_id)).scalar()
+    }
+
+
+def get_member_attendance(db: Session, member_id: str, months: int = 12) -> Dict[str, Any]:
+    """Get a member's attendance summary and monthly history"""
+    summary = db.query(MemberAttendanceSummary).filter(
+        MemberAttendanceSummary.member_id == member_id
+    ).first()
+
+    history = db.query(MemberAttendanceMonthly).filter(
+        MemberAttendanceMonthly.member_id == member_id
+    ).order_by(MemberAttendanceMonthly.month.desc()).limit(months).all()
+
+    return {
+        "member_id": member_id,
+        "last_n": settings.ATTENDANCE_RATE_LAST_N,
+        "meetings_invited": summary.meetings_invited if summary else 0,
+        "meetings_attended": summary.meetings_attended if summary else 0,
+        "recent_invited": summary.recent_invited if summary else 0,
+        "recent_attended": summary.recent_attended if summary else 0,
+        "recent_attendance_rate": summary.recent_attendance_rate if summary else None,
+        "last_attended_at": summary.last_attended_at if summary else None,
+        "history": history
+    }
+
+
+def get_attendance_report(
+    db: Session,
+    ascending: bool = False,
+    skip: int = 0,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """Get members ranked by attendance rate over their last N completed meetings"""
+    rate = MemberAttendanceSummary.recent_attendance_rate
+    query = db.query(
+        MemberAttendanceSummary.member_id,
+        func.coalesce(User.full_name, User.email).label("member_name"),
+        Member.company_name,
+        MemberAttendanceSummary.meetings_invited,
+        MemberAttendanceSummary.meetings_attended,
+        MemberAttendanceSummary.recent_invited,
+        MemberAttendanceSummary.recent_attended,
+        MemberAttendanceSummary.recent_attendance_rate,
+        MemberAttendanceSummary.last_attended_at
+    ).join(
+        Member, Member.id == MemberAttendanceSummary.member_id
+    ).join(
+        User, User.id == Member.user_id
+    ).order_by(
+        rate.asc().nulls_last() if ascending else rate.desc().nulls_last(),
+        MemberAttendanceSummary.member_id
+    )
+
+    return [dict(row._mapping) for row in query.offset(skip).limit(limit).all()]
@@ -0,0 +1,397 @@
+"""
+Availability Service - Hub free/busy bitmaps
+
+Each Hub day is a 96-bit bitmap (bit i = 15-minute slot i after local midnight, 1 = free):
+working hours minus blocked periods minus the Hub's PENDING/CONFIRMED meetings. The next
+AVAILABILITY_WEEKS_AHEAD weeks are cached in Redis (hex strings), so slot lookups
+are bit operations instead of SQL scans. Whenever a meeting, working hours or
+blocked period changes, the affected days are dropped and their generation is
+bumped; the next read recomputes them. Entries live AVAILABILITY_CACHE_TTL_SECONDS
+at most.
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
+from datetime import date, datetime, time, timedelta
+import redis
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.timezone import local_now
+from app.models.availability import HubWorkingHours, HubBlockedPeriod
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.user import User, UserRole, UserStatus
+
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+ALL_SLOTS = (1 << SLOTS_PER_DAY) - 1
+
+# Meetings that take a Hub's time
+BUSY_STATUSES = [MeetingStatus.PENDING, MeetingStatus.CONFIRMED]
+
+
+def _key(hub_id: str, day: date) -> str:
+    return f"availability:{hub_id}:{day.isoformat()}"
+
+
+def _slot_mask(first_slot: int, last_slot: int) -> int:
+    """Bits first_slot..last_slot - 1"""
+    first_slot, last_slot = max(first_slot, 0), min(last_slot, SLOTS_PER_DAY)
+    if first_slot >= last_slot:
+        return 0
+    return ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+
+def _busy_masks(start: datetime, end: datetime) -> Dict[date, int]:
+    """Slots touched by [start, end) per day (rounded outwards)"""
+    masks = {}
+    day = start.date()
+    while datetime.combine(day, time.min) < end:
+        midnight = datetime.combine(day, time.min)
+        first_minute = (max(start, midnight) - midnight).total_seconds() / 60
+        last_minute = (min(end, midnight + timedelta(days=1)) - midnight).total_seconds() / 60
+        masks[day] = _slot_mask(math.floor(first_minute / SLOT_MINUTES), math.ceil(last_minute / SLOT_MINUTES))
+        day += timedelta(days=1)
+    return masks
+
+
+def _cache_window() -> tuple:
+    today = local_now().date()
+    return today, today + timedelta(weeks=settings.AVAILABILITY_WEEKS_AHEAD)
+
+
+def _days(first_day: date, last_day: date) -> List[date]:
+    return [first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1)]
+
+
+# Hubs
+
+def get_hub_ids(db: Session) -> List[str]:
+    """Active Hubs that take 1:1 meetings"""
+    return [hub_id for (hub_id,) in db.query(User.id).filter(
+        User.role == UserRole.HUB,
+        User.status == UserStatus.ACTIVE
+    ).order_by(User.created_at)]
+
+
+def get_hub_or_404(db: Session, hub_id: str) -> User:
+    """Active Hub user, or 404"""
+    hub = db.query(User).filter(User.id == hub_id, User.role == UserRole.HUB).first()
+    if not hub:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hub não encontrado"
+        )
+    return hub
+
+
+# Bitmap computation (SQL)
+
+def compute_bitmaps(db: Session, hub_ids: List[str], first_day: date, last_day: date) -> Dict[str, Dict[date, int]]:
+    """Compute the free bitmaps of the Hubs for every day in [first_day, last_day] (3 queries)"""
+    range_start = datetime.combine(first_day, time.min)
+    range_end = datetime.combine(last_day + timedelta(days=1), time.min)
+
+    # Working hours per weekday (Hubs without a definition use the global business hours)
+    default_hours = _slot_mask(
+        settings.MEETING_BUSINESS_START_HOUR * 60 // SLOT_MINUTES,
+        settings.MEETING_BUSINESS_END_HOUR * 60 // SLOT_MINUTES
+    )
+    weekly = {hub_id: {} for hub_id in hub_ids}
+    for row in db.query(HubWorkingHours).filter(HubWorkingHours.hub_user_id.in_(hub_ids)):
+        # Working slots are rounded inwards
+        mask = _slot_mask(-(-row.start_minute // SLOT_MINUTES), row.end_minute // SLOT_MINUTES)
+        weekly[row.hub_user_id][row.weekday] = weekly[row.hub_user_id].get(row.weekday, 0) | mask
+
+    # Busy slots per Hub, plus those shared by every Hub (None)
+    busy: Dict[Optional[str], Dict[date, int]] = {hub_id: {} for hub_id in hub_ids}
+    busy[None] = {}
+
+    def add_busy(owner: Optional[str], start: datetime, end: datetime):
+        for day, mask in _busy_masks(start, end).items():
+            busy[owner][day] = busy[owner].get(day, 0) | mask
+
+    for period in db.query(HubBlockedPeriod).filter(
+        HubBlockedPeriod.hub_user_id.in_(hub_ids),
+        HubBlockedPeriod.starts_at < range_end,
+        HubBlockedPeriod.ends_at > range_start
+    ):
+        add_busy(period.hub_user_id, period.starts_at, period.ends_at)
+
+    # Assigned meetings block their Hub; unassigned ones (no Hub available when booked) block every Hub
+    for hub_id, start, minutes in db.query(Meeting.assigned_hub_id, Meeting.scheduled_date, Meeting.duration_minutes).filter(
+        Meeting.scheduled_date >= range_start - timedelta(days=1),
+        Meeting.scheduled_date < range_end,
+        Meeting.status.in_(BUSY_STATUSES)
+    ):
+        if hub_id is None or hub_id in busy:
+            add_busy(hub_id, start, start + timedelta(minutes=minutes))
+
+    bitmaps = {}
+    for hub_id in hub_ids:
+        hub_hours = weekly[hub_id]
+        bitmaps[hub_id] = {}
+        for day in _days(first_day, last_day):
+            free = hub_hours.get(day.weekday(), 0) if hub_hours else default_hours
+            taken = busy[hub_id].get(day, 0) | busy[None].get(day, 0)
+            bitmaps[hub_id][day] = free & ~taken & ALL_SLOTS
+    return bitmaps
+
+
+# Cache (Redis)
+
+def _generation_key(hub_id: str, day: date) -> str:
+    return f"availability:{hub_id}:{day.isoformat()}:generation"
+
+
+def _day_end(day: date) -> datetime:
+    return datetime.combine(day + timedelta(days=1), time.min)
+
+
+def _store(bitmaps: Dict[str, Dict[date, int]], generations: Dict[Tuple[str, date], str]) -> None:
+    """
+    Cache the bitmaps that fall inside the window, tagged with the generation read
+    before computing them. A write that raced with an invalidation carries the old
+    generation and is ignored by readers.
+    """
+    window_start, window_end = _cache_window()
+    now = local_now()
+    pipe = get_redis().pipeline(transaction=False)
+    for hub_id, days in bitmaps.items():
+        for day, bitmap in days.items():
+            if window_start <= day <= window_end:
+                expires = min(int((_day_end(day) - now).total_seconds()), settings.AVAILABILITY_CACHE_TTL_SECONDS)
+                pipe.set(
+                    _key(hub_id, day),
+                    f"{generations.get((hub_id, day), '0')}:{bitmap:x}",
+                    ex=max(expires, 1)
+                )
+    pipe.execute()
+
+
+def get_bitmaps(db: Session, hub_ids: List[str], first_day: date, last_day: date) -> Dict[str, Dict[date, int]]:
+    """Free bitmaps from the cache, computing (and caching) only the missing or outdated days"""
+    days = _days(first_day, last_day)
+    keys = [(hub_id, day) for hub_id in hub_ids for day in days]
+    try:
+        # Generations are read before the database, so a change committed after this
+        # point bumps them and the bitmaps computed below are not trusted later
+        cached = get_redis().mget(
+            [_key(hub_id, day) for hub_id, day in keys] + [_generation_key(hub_id, day) for hub_id, day in keys]
+        )
+    except redis.RedisError:
+        return compute_bitmaps(db, hub_ids, first_day, last_day)
+
+    generations = {key: generation or "0" for key, generation in zip(keys, cached[len(keys):])}
+    bitmaps = {hub_id: {} for hub_id in hub_ids}
+    missing: Set[date] = set()
+    for (hub_id, day), value in zip(keys, cached):
+        generation, _, bitmap = (value or "").partition(":")
+        if value is None or generation != generations[(hub_id, day)]:
+            missing.add(day)
+        else:
+            bitmaps[hub_id][day] = int(bitmap, 16)
+
+    if missing:
+        computed = compute_bitmaps(db, hub_ids, min(missing), max(missing))
+        for hub_id in hub_ids:
+            bitmaps[hub_id].update(computed[hub_id])
+        try:
+            _store(computed, generations)
+        except redis.RedisError:
+            pass
+    return bitmaps
+
+
+def invalidate_days(db: Session, days: Iterable[date], hub_ids: Optional[List[str]] = None) -> None:
+    """Drop the cached bitmaps of some days and bump their generation (call after committing the change)"""
+    window_start, window_end = _cache_window()
+    days = sorted(day for day in set(days) if window_start <= day <= window_end)
+    hub_ids = hub_ids if hub_ids is not None else get_hub_ids(db)
+    if not days or not hub_ids:
+        return
+
+    now = local_now()
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for hub_id in hub_ids:
+            for day in days:
+                pipe.incr(_generation_key(hub_id, day))
+                # Outlives every bitmap of the day (those expire by the end of it)
+                pipe.expire(_generation_key(hub_id, day), int((_day_end(day) - now).total_seconds()) + 86400)
+                pipe.delete(_key(hub_id, day))
+        pipe.execute()
+    except redis.RedisError:
+        # Entries expire after AVAILABILITY_CACHE_TTL_SECONDS at most
+        print(f"⚠️  Availability cache not invalidated for {len(days)} day(s)")
+
+
+def invalidate_interval(db: Session, start: datetime, duration_minutes: int) -> None:
+    """Invalidate the days touched by a meeting"""
+    invalidate_intervals(db, [(start, duration_minutes)])
+
+
+def invalidate_intervals(db: Session, intervals: List[Tuple[datetime, int]]) -> None:
+    """Invalidate the days touched by several meetings at once"""
+    days = set()
+    for start, duration_minutes in intervals:
+        days.update(_busy_masks(start, start + timedelta(minutes=duration_minutes)).keys())
+    invalidate_days(db, days)
+
+
+def invalidate_hub(db: Session, hub_id: str) -> None:
+    """Invalidate a Hub's whole window (working hours or blocked periods changed)"""
+    window_start, window_end = _cache_window()
+    invalidate_days(db, _days(window_start, window_end), [hub_id])
+
+
+def rebuild_cache(db: Session) -> Dict[str, int]:
+    """Invalidate the window of every Hub and compute it again"""
+    window_start, window_end = _cache_window()
+    hub_ids = get_hub_ids(db)
+    invalidate_days(db, _days(window_start, window_end), hub_ids)
+    if hub_ids:
+        get_bitmaps(db, hub_ids, window_start, window_end)
+    return {"hubs": len(hub_ids), "days": (window_end - window_start).days + 1}
+
+
+# Queries (bit operations)
+
+def get_available_slots(
+    db: Session,
+    first_day: date,
+    last_day: date,
+    duration_minutes: int,
+    step_minutes: int,
+    hub_id: Optional[str] = None
+) -> Optional[List[datetime]]:
+    """
+    Slot starts where at least one Hub (or the given Hub) is free for the whole duration.
+    Returns None when there are no active Hubs.
+    """
+    if hub_id:
+        get_hub_or_404(db, hub_id)
+        hub_ids = [hub_id]
+    else:
+        hub_ids = get_hub_ids(db)
+    if not hub_ids:
+        return None
+
+    length = -(-duration_minutes // SLOT_MINUTES)
+    step = max(step_minutes // SLOT_MINUTES, 1)
+    starts_mask = sum(1 << slot for slot in range(0, SLOTS_PER_DAY, step))
+
+    bitmaps = get_bitmaps(db, hub_ids, first_day, last_day)
+    slots = []
+    for day in _days(first_day, last_day):
+        fits = 0
+        for hub_id in hub_ids:
+            # Bit i stays set only if slots i..i+length-1 are all free
+            free = bitmaps[hub_id][day]
+            fit = free
+            for offset in range(1, length):
+                fit &= free >> offset
+            fits |= fit
+        fits &= starts_mask
+
+        midnight = datetime.combine(day, time.min)
+        while fits:
+            slot = (fits & -fits).bit_length() - 1
+            slots.append(midnight + timedelta(minutes=slot * SLOT_MINUTES))
+            fits &= fits - 1
+    return slots
+
+
+def get_free_hubs(db: Session, hub_ids: List[str], start: datetime, duration_minutes: int) -> Set[str]:
+    """Hubs free for the whole of [start, start + duration)"""
+    masks = _busy_masks(start, start + timedelta(minutes=duration_minutes))
+    bitmaps = get_bitmaps(db, hub_ids, min(masks), max(masks))
+    return {
+        hub_id for hub_id in hub_ids
+        if all(bitmaps[hub_id][day] & mask == mask for day, mask in masks.items())
+    }
+
+
+def get_free_busy(db: Session, hub_id: str, first_day: date, last_day: date) -> List[Dict[str, Any]]:
+    """A Hub's free/busy bitmap per day"""
+    get_hub_or_404(db, hub_id)
+    bitmaps = get_bitmaps(db, [hub_id], first_day, last_day)[hub_id]
+    return [
+        {
+            "date": day,
+            "slot_minutes": SLOT_MINUTES,
+            "free_bitmap": format(bitmaps[day], f"0{SLOTS_PER_DAY // 4}x"),
+            "free_minutes": bin(bitmaps[day]).count("1") * SLOT_MINUTES
+        }
+        for day in _days(first_day, last_day)
+    ]
+
+
+# Working hours and blocked periods
+
+def get_working_hours(db: Session, hub_id: str) -> List[HubWorkingHours]:
+    """Get a Hub's weekly working hours"""
+    get_hub_or_404(db, hub_id)
+    return db.query(HubWorkingHours).filter(
+        HubWorkingHours.hub_user_id == hub_id
+    ).order_by(HubWorkingHours.weekday, HubWorkingHours.start_minute).all()
+
+
+def set_working_hours(db: Session, hub_id: str, intervals: List[Dict[str, int]]) -> List[HubWorkingHours]:
+    """Replace a Hub's weekly working hours"""
+    get_hub_or_404(db, hub_id)
+    db.query(HubWorkingHours).filter(HubWorkingHours.hub_user_id == hub_id).delete(synchronize_session=False)
+    db.add_all([HubWorkingHours(hub_user_id=hub_id, **interval) for interval in intervals])
+    db.commit()
+
+    invalidate_hub(db, hub_id)
+    return get_working_hours(db, hub_id)
+
+
+def get_blocked_periods(db: Session, hub_id: str, upcoming_only: bool = True) -> List[HubBlockedPeriod]:
+    """Get a Hub's blocked periods"""
+    get_hub_or_404(db, hub_id)
+    query = db.query(HubBlockedPeriod).filter(HubBlockedPeriod.hub_user_id == hub_id)
+    if upcoming_only:
+        query = query.filter(HubBlockedPeriod.ends_at > local_now())
+    return query.order_by(HubBlockedPeriod.starts_at).all()
+
+
+def add_blocked_period(db: Session, hub_id: str, period_data: Dict[str, Any]) -> HubBlockedPeriod:
+    """Block a period in a Hub's calendar"""
+    get_hub_or_404(db, hub_id)
+    if period_data["starts_at"] >= period_data["ends_at"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O início do bloqueio deve ser anterior ao fim"
+        )
+
+    period = HubBlockedPeriod(hub_user_id=hub_id, **period_data)
+    db.add(period)
+    db.commit()
+    db.refresh(period)
+
+    invalidate_days(db, _busy_masks(period.starts_at, period.ends_at).keys(), [hub_id])
+    return period
+
+
+def delete_blocked_period(db: Session, period_id: str, hub_id: Optional[str] = None) -> bool:
+    """Remove a blocked period (hub_id restricts it to the Hub's own periods)"""
+    query = db.query(HubBlockedPeriod).filter(HubBlockedPeriod.id == period_id)
+    if hub_id:
+        query = query.filter(HubBlockedPeriod.hub_user_id == hub_id)
+    period = query.first()
+    if not period:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bloqueio não encontrado"
+        )
+
+    owner, days = period.hub_user_id, _busy_masks(period.starts_at, period.ends_at).keys()
+    db.delete(period)
+    db.commit()
+
+    invalidate_days(db, days, [owner])
+    return True
@@ -0,0 +1,304 @@
+"""
+Calendar Feed Service - Per-member ICS feeds
+
+Feeds are rendered once per change and stored as bytes with an ETag.
+Services that mutate collective meetings, 1:1 meetings or visits call the
+invalidate_* helpers (without committing), and the next poll renders again.
+
+Event dates are local wall-clock times: DTSTART/DTEND carry TZID=APP_TIMEZONE
+and the feed includes the matching VTIMEZONE. DTSTAMP comes from updated_at,
+which is UTC.
+"""
+import hashlib
+import secrets
+from typing import List, Optional, Union
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.sql import Select
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.timezone import local_now, offset_changes, utc_offset
+from app.models.calendar_feed import CalendarFeed
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.visit import Visit, VisitStatus
+from app.models.member import Member
+from app.models.user import User
+from app.services import recurrence
+
+
+# Past events kept in the feed
+FEED_HISTORY_DAYS = 90
+
+# Unmaterialized series occurrences listed ahead
+FEED_SERIES_DAYS_AHEAD = 180
+
+MemberFilter = Union[List[str], Select]
+
+
+# Feed management
+
+def get_or_create_feed(db: Session, member_id: str) -> CalendarFeed:
+    """Get the member's feed, creating it (and its token) on first use"""
+    feed = db.query(CalendarFeed).filter(CalendarFeed.member_id == member_id).first()
+    if not feed:
+        feed = CalendarFeed(member_id=member_id)
+        db.add(feed)
+        db.commit()
+        db.refresh(feed)
+    return feed
+
+
+def rotate_token(db: Session, member_id: str) -> CalendarFeed:
+    """Issue a new feed token, revoking the old URL"""
+    feed = get_or_create_feed(db, member_id)
+    feed.token = secrets.token_urlsafe(32)
+    db.commit()
+    db.refresh(feed)
+    return feed
+
+
+def invalidate_feeds(db: Session, member_filter: MemberFilter) -> None:
+    """Drop the cached render of the members' feeds (list of IDs or a select of IDs), without committing"""
+    db.query(CalendarFeed).filter(
+        CalendarFeed.member_id.in_(member_filter),
+        CalendarFeed.content.isnot(None)
+    ).update({"content": None, "etag": None}, synchronize_session=False)
+
+
+def invalidate_all_feeds(db: Session) -> None:
+    """Drop every cached render (changes that reach all members), without committing"""
+    db.query(CalendarFeed).filter(
+        CalendarFeed.content.isnot(None)
+    ).update({"content": None, "etag": None}, synchronize_session=False)
+
+
+def invalidate_collective_meeting(db: Session, meeting_id: str) -> None:
+    """Invalidate the feeds of everyone invited to a collective meeting"""
+    invalidate_feeds(db, select(meeting_attendees.c.member_id).where(meeting_attendees.c.meeting_id == meeting_id))
+
+
+# Rendering
+
+def _escape(text: Optional[str]) -> str:
+    return (text or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Fold content lines longer than 75 octets (RFC 5545)"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        cut = 75 if not parts else 74
+        # Do not split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    return "\r\n ".join(parts)
+
+
+def _utc_timestamp(value: datetime) -> str:
+    # Audit columns (updated_at) are naive UTC
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _local_timestamp(value: datetime) -> str:
+    # Event dates are naive local times in APP_TIMEZONE
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _offset(value) -> str:
+    minutes = int(value.total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    return f"{sign}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+
+def _vtimezone(start: datetime, end: datetime) -> List[str]:
+    """APP_TIMEZONE observances in effect between two local times"""
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{settings.APP_TIMEZONE}"]
+    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    observances = [(start, utc_offset(start), utc_offset(start))] + offset_changes(start, end)
+    for index, (onset, offset_from, offset_to) in enumerate(observances):
+        # Larger offset than the one before it: daylight time
+        kind = "DAYLIGHT" if index and offset_to > offset_from else "STANDARD"
+        lines += [
+            f"BEGIN:{kind}",
+            f"DTSTART:{_local_timestamp(onset)}",
+            f"TZOFFSETFROM:{_offset(offset_from)}",
+            f"TZOFFSETTO:{_offset(offset_to)}",
+            f"END:{kind}",
+        ]
+    lines.append("END:VTIMEZONE")
+    return lines
+
+
+def _event(
+    uid: str,
+    start: datetime,
+    duration_minutes: int,
+    summary: str,
+    updated_at: datetime,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    url: Optional[str] = None
+) -> List[str]:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{_utc_timestamp(updated_at)}",
+        f"DTSTART;TZID={settings.APP_TIMEZONE}:{_local_timestamp(start)}",
+        f"DTEND;TZID={settings.APP_TIMEZONE}:{_local_timestamp(start + timedelta(minutes=duration_minutes))}",
+        f"SUMMARY:{_escape(summary)}",
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def _series_uid(series_id: str, occurrence_start: datetime) -> str:
+    # Shared by expanded and materialized occurrences, so calendars update the same event
+    # (the trailing "Z" only keeps the UIDs of already subscribed calendars)
+    return f"series-{series_id}-{_utc_timestamp(occurrence_start)}@union"
+
+
+def _minutes(value, default: int = 60) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def render_feed(db: Session, member_id: str) -> bytes:
+    """Render the member's ICS feed: collective meetings, confirmed 1:1 meetings and visits"""
+    now = local_now()
+    since = now - timedelta(days=FEED_HISTORY_DAYS)
+    until = now + timedelta(days=FEED_SERIES_DAYS_AHEAD)
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{settings.APP_NAME}//Agenda//PT-BR",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(settings.APP_NAME)}",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT15M",
+        f"X-WR-TIMEZONE:{settings.APP_TIMEZONE}",
+    ]
+    events: List[str] = []
+
+    collective_meetings = db.query(CollectiveMeeting).join(
+        meeting_attendees, meeting_attendees.c.meeting_id == CollectiveMeeting.id
+    ).filter(
+        meeting_attendees.c.member_id == member_id,
+        CollectiveMeeting.status != CollectiveMeetingStatus.CANCELADA,
+        CollectiveMeeting.scheduled_date >= since
+    ).all()
+    for meeting in collective_meetings:
+        events += _event(
+            _series_uid(meeting.series_id, meeting.occurrence_start) if meeting.series_id and meeting.occurrence_start
+            else f"collective-meeting-{meeting.id}@union",
+            meeting.scheduled_date,
+            _minutes(meeting.duration_minutes),
+            meeting.title,
+            meeting.updated_at,
+            description=meeting.agenda or meeting.description,
+            location=meeting.location or meeting.meeting_link,
+            url=meeting.meeting_link
+        )
+
+    # Series occurrences not materialized yet (members invited to every collective meeting)
+    invited = db.query(Member.id).join(User, Member.user_id == User.id).filter(
+        Member.id == member_id,
+        User.role == "MEMBER",
+        User.status == "ACTIVE"
+    ).first()
+    if invited:
+        for series, occurrence in recurrence.get_unmaterialized_occurrences(db, since, until):
+            events += _event(
+                _series_uid(series.id, occurrence),
+                occurrence,
+                _minutes(series.duration_minutes),
+                series.title,
+                series.updated_at,
+                description=series.agenda or series.description,
+                location=series.location or series.meeting_link,
+                url=series.meeting_link
+            )
+
+    meetings = db.query(Meeting).filter(
+        Meeting.member_id == member_id,
+        Meeting.status.in_([MeetingStatus.CONFIRMED, MeetingStatus.COMPLETED]),
+        Meeting.scheduled_date >= since
+    ).all()
+    for meeting in meetings:
+        events += _event(
+            f"meeting-{meeting.id}@union",
+            meeting.scheduled_date,
+            _minutes(meeting.duration_minutes),
+            "Reunião com o Hub",
+            meeting.updated_at,
+            description=meeting.hub_notes,
+            location=meeting.location or meeting.meeting_link,
+            url=meeting.meeting_link
+        )
+
+    visits = db.query(Visit, Member.company_name).join(
+        Member,
+        Member.id == Visit.visited_id
+    ).filter(
+        or_(Visit.visitor_id == member_id, Visit.visited_id == member_id),
+        Visit.status.in_([VisitStatus.AGENDADA, VisitStatus.REALIZADA]),
+        Visit.visit_date >= since
+    ).all()
+    for visit, visited_company in visits:
+        summary = f"Visita: {visited_company}" if visit.visitor_id == member_id else "Visita recebida"
+        events += _event(
+            f"visit-{visit.id}@union",
+            visit.visit_date,
+            _minutes(visit.duration_minutes),
+            summary,
+            visit.updated_at,
+            description=visit.visitor_notes,
+            location=visit.location
+        )
+
+    # Observances over the whole span of the listed events
+    latest = max(
+        [until]
+        + [meeting.scheduled_date for meeting in collective_meetings]
+        + [meeting.scheduled_date for meeting in meetings]
+        + [visit.visit_date for visit, _ in visits]
+    )
+    lines += _vtimezone(since, latest + timedelta(days=1))
+    lines += events
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
+
+
+def get_rendered_feed(db: Session, token: str) -> CalendarFeed:
+    """Get a feed by its token, rendering it only when it was invalidated"""
+    feed = db.query(CalendarFeed).filter(CalendarFeed.token == token).first()
+    if not feed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Calendário não encontrado"
+        )
+
+    if feed.content is None:
+        content = render_feed(db, feed.member_id)
+        feed.content = content
+        feed.etag = f'"{hashlib.md5(content).hexdigest()}"'
+        feed.rendered_at = datetime.utcnow()
+        db.commit()
+        db.refresh(feed)
+
+    return feed
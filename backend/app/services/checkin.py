@@ -0,0 +1,186 @@
+"""
+Check-in Service - QR check-in for in-person collective meetings
+
+Each scan is recorded in Redis sets (O(1), no database access) and applied to
+meeting_attendees in batches by the check-in worker.
+"""
+from typing import List, Dict, Any
+from datetime import datetime, timedelta
+import redis
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.security import create_checkin_token, decode_token
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
+from app.models.member import Member
+from app.services import attendance as attendance_service
+
+
+# Meetings with check-ins waiting to be flushed to the database
+MEETINGS_KEY = "checkin:meetings"
+KEY_TTL = timedelta(days=2)
+
+
+def _arrived_key(meeting_id: str) -> str:
+    """Everyone who checked in (live count)"""
+    return f"checkin:{meeting_id}:arrived"
+
+
+def _pending_key(meeting_id: str) -> str:
+    """Check-ins not yet written to meeting_attendees"""
+    return f"checkin:{meeting_id}:pending"
+
+
+def _unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Check-in indisponível no momento"
+    )
+
+
+def issue_checkin_token(db: Session, meeting_id: str, member: Member) -> Dict[str, Any]:
+    """Issue the member's signed QR check-in token for a meeting"""
+    meeting = db.query(CollectiveMeeting).filter(CollectiveMeeting.id == meeting_id).first()
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reunião não encontrada"
+        )
+    
+    if meeting.status in [CollectiveMeetingStatus.CANCELADA, CollectiveMeetingStatus.REALIZADA]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Esta reunião não está aberta para check-in"
+        )
+    
+    invited = db.query(meeting_attendees.c.member_id).filter(
+        and_(
+            meeting_attendees.c.meeting_id == meeting_id,
+            meeting_attendees.c.member_id == member.id
+        )
+    ).first()
+    if not invited:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não foi convidado para esta reunião"
+        )
+    
+    expires_at = meeting.scheduled_date + timedelta(hours=settings.CHECKIN_TOKEN_GRACE_HOURS)
+    if expires_at <= datetime.utcnow():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O check-in desta reunião já foi encerrado"
+        )
+    
+    member_name = member.user.full_name or member.user.email
+    token = create_checkin_token(member.id, meeting_id, member_name, expires_at)
+    return {"token": token, "expires_at": expires_at}
+
+
+def check_in(meeting_id: str, token: str) -> Dict[str, Any]:
+    """
+    Record a scanned QR token.
+    The token is verified by signature only and the arrival is stored in Redis,
+    so the door never waits on the database.
+    """
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "checkin" or payload.get("mid") != meeting_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="QR code inválido para esta reunião"
+        )
+    
+    member_id = payload["sub"]
+    try:
+        pipe = get_redis().pipeline()
+        pipe.sadd(_arrived_key(meeting_id), member_id)
+        pipe.sadd(_pending_key(meeting_id), member_id)
+        pipe.sadd(MEETINGS_KEY, meeting_id)
+        pipe.expire(_arrived_key(meeting_id), KEY_TTL)
+        pipe.scard(_arrived_key(meeting_id))
+        added, _, _, _, checked_in = pipe.execute()
+    except redis.RedisError:
+        raise _unavailable()
+    
+    return {
+        "member_id": member_id,
+        "member_name": payload.get("name"),
+        "already_checked_in": not added,
+        "checked_in": checked_in
+    }
+
+
+def get_live_checkins(meeting_id: str) -> Dict[str, Any]:
+    """Live check-in count for the Hub screen (read from Redis)"""
+    try:
+        pipe = get_redis().pipeline()
+        pipe.scard(_arrived_key(meeting_id))
+        pipe.scard(_pending_key(meeting_id))
+        checked_in, pending = pipe.execute()
+    except redis.RedisError:
+        raise _unavailable()
+    
+    return {"meeting_id": meeting_id, "checked_in": checked_in, "pending_flush": pending}
+
+
+def _apply_checkins(db: Session, meeting_id: str, member_ids: List[str]) -> int:
+    """Mark members as attended and add the newly attended ones to total_attended"""
+    result = db.execute(
+        meeting_attendees.update().where(
+            and_(
+                meeting_attendees.c.meeting_id == meeting_id,
+                meeting_attendees.c.member_id.in_(member_ids),
+                meeting_attendees.c.attended.isnot(True)
+            )
+        ).values(attended=True)
+    )
+    if result.rowcount:
+        db.execute(
+            CollectiveMeeting.__table__.update().where(
+                CollectiveMeeting.id == meeting_id
+            ).values(
+                total_attended=func.coalesce(CollectiveMeeting.total_attended, 0) + result.rowcount
+            )
+        )
+    return result.rowcount
+
+
+def flush_checkins(db: Session, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Write up to batch_size pending check-ins to meeting_attendees.
+    Popped check-ins are pushed back to Redis if the database write fails.
+    """
+    r = get_redis()
+    result = {"batch_size": batch_size, "processed": 0, "attended": 0}
+    
+    for meeting_id in r.smembers(MEETINGS_KEY):
+        budget = batch_size - result["processed"]
+        if budget <= 0:
+            break
+        
+        member_ids = r.spop(_pending_key(meeting_id), budget)
+        if not member_ids:
+            r.srem(MEETINGS_KEY, meeting_id)
+            # A check-in may have arrived between SPOP and SREM
+            if r.scard(_pending_key(meeting_id)):
+                r.sadd(MEETINGS_KEY, meeting_id)
+            continue
+        
+        try:
+            attended = _apply_checkins(db, meeting_id, member_ids)
+            if attended:
+                meeting = db.query(CollectiveMeeting).filter(CollectiveMeeting.id == meeting_id).first()
+                if meeting:
+                    attendance_service.refresh_for_meeting(db, meeting)
+            db.commit()
+            result["attended"] += attended
+        except Exception:
+            db.rollback()
+            r.sadd(_pending_key(meeting_id), *member_ids)
+            raise
+        result["processed"] += len(member_ids)
+    
+    return result
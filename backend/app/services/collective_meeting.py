@@ -1,15 +1,45 @@
 """
 Collective Meeting Service
 """
+import hashlib
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, select, literal
 from fastapi import HTTPException, status
 
 from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
 from app.models.member import Member
 from app.models.user import User
+from app.services import attendance as attendance_service
+from app.services import calendar_feed as calendar_feed_service
+from app.services import scheduler as scheduler_service
+
+
+def invite_active_members(db: Session, meeting_id: str) -> int:
+    """
+    Invite all active members with a single INSERT ... SELECT.
+    Members are never loaded into the session; returns the number of invitations.
+    """
+    active_members = select(
+        literal(meeting_id),
+        Member.id,
+        literal(False),
+        literal(False)
+    ).join(
+        User, Member.user_id == User.id
+    ).where(
+        User.role == "MEMBER",
+        User.status == "ACTIVE"
+    )
+    
+    result = db.execute(
+        meeting_attendees.insert().from_select(
+            ["meeting_id", "member_id", "confirmed", "attended"],
+            active_members
+        )
+    )
+    return result.rowcount
 
 
 def create_collective_meeting(db: Session, creator_id: str, meeting_data: Dict[str, Any]) -> CollectiveMeeting:
@@ -23,19 +53,9 @@ def create_collective_meeting(db: Session, creator_id: str, meeting_data: Dict[s
     db.add(meeting)
     db.flush()  # Get meeting ID
     
-    # Get all active members
-    active_members = db.query(Member).join(
-        User, Member.user_id == User.id
-    ).filter(
-        User.role == "MEMBER",
-        User.status == "ACTIVE"
-    ).all()
-    
-    # Add all members as attendees
-    for member in active_members:
-        meeting.attendees.append(member)
-    
-    meeting.total_invited = len(active_members)
+    meeting.total_invited = invite_active_members(db, meeting.id)
+    scheduler_service.schedule_collective_meeting_reminders(db, meeting)
+    calendar_feed_service.invalidate_collective_meeting(db, meeting.id)
     
     db.commit()
     db.refresh(meeting)
@@ -47,6 +67,72 @@ def get_collective_meeting_by_id(db: Session, meeting_id: str) -> Optional[Colle
     return db.query(CollectiveMeeting).filter(CollectiveMeeting.id == meeting_id).first()
 
 
+def get_meeting_etag(meeting: CollectiveMeeting) -> str:
+    """Weak ETag for the meeting header (changes with any update, including the counters)"""
+    version = f"{meeting.id}:{meeting.updated_at.isoformat()}:{meeting.total_confirmed}:{meeting.total_attended}"
+    return f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+
+
+def _roster_query(
+    db: Session,
+    meeting_id: str,
+    confirmed: Optional[bool] = None,
+    attended: Optional[bool] = None
+):
+    """Attendees of a meeting joined to their member and user rows"""
+    query = db.query(
+        meeting_attendees.c.member_id,
+        func.coalesce(User.full_name, User.email).label("member_name"),
+        Member.company_name,
+        meeting_attendees.c.confirmed,
+        meeting_attendees.c.attended,
+        meeting_attendees.c.confirmed_at
+    ).join(
+        Member, Member.id == meeting_attendees.c.member_id
+    ).join(
+        User, User.id == Member.user_id
+    ).filter(
+        meeting_attendees.c.meeting_id == meeting_id
+    )
+    
+    if confirmed is not None:
+        query = query.filter(meeting_attendees.c.confirmed.is_(confirmed))
+    if attended is not None:
+        query = query.filter(meeting_attendees.c.attended.is_(attended))
+    
+    return query
+
+
+def get_attendee_roster(
+    db: Session,
+    meeting_id: str,
+    confirmed: Optional[bool] = None,
+    attended: Optional[bool] = None,
+    skip: int = 0,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Get the attendee roster of a meeting in a single query, ordered by name"""
+    query = _roster_query(db, meeting_id, confirmed, attended).order_by(
+        func.coalesce(User.full_name, User.email),
+        meeting_attendees.c.member_id
+    ).offset(skip)
+    
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return [dict(row._mapping) for row in query.all()]
+
+
+def count_attendees(
+    db: Session,
+    meeting_id: str,
+    confirmed: Optional[bool] = None,
+    attended: Optional[bool] = None
+) -> int:
+    """Count the attendees of a meeting matching the filters"""
+    return _roster_query(db, meeting_id, confirmed, attended).order_by(None).count()
+
+
 def get_all_collective_meetings(
     db: Session,
     status_filter: Optional[CollectiveMeetingStatus] = None,
@@ -112,45 +198,80 @@ def update_collective_meeting(db: Session, meeting_id: str, update_data: Dict[st
         if value is not None and hasattr(meeting, field):
             setattr(meeting, field, value)
     
+    scheduler_service.schedule_collective_meeting_reminders(db, meeting)
+    calendar_feed_service.invalidate_collective_meeting(db, meeting.id)
     db.commit()
     db.refresh(meeting)
     return meeting
 
 
 def confirm_attendance(db: Session, meeting_id: str, member_id: str, confirmed: bool = True) -> bool:
-    """Confirm or decline attendance for a meeting"""
-    meeting = get_collective_meeting_by_id(db, meeting_id)
-    if not meeting:
+    """
+    Confirm or decline attendance for a meeting
+    total_confirmed is adjusted by an atomic +1/-1 only when the member's answer actually changes,
+    so concurrent confirmations never recount the roster nor hold the meeting row for long.
+    """
+    meeting_exists = db.query(CollectiveMeeting.id).filter(CollectiveMeeting.id == meeting_id).first()
+    if not meeting_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reunião não encontrada"
         )
     
-    # Update attendance confirmation
-    stmt = meeting_attendees.update().where(
-        and_(
-            meeting_attendees.c.meeting_id == meeting_id,
-            meeting_attendees.c.member_id == member_id
+    # Update attendance confirmation (no-op when the answer is the same)
+    result = db.execute(
+        meeting_attendees.update().where(
+            and_(
+                meeting_attendees.c.meeting_id == meeting_id,
+                meeting_attendees.c.member_id == member_id,
+                meeting_attendees.c.confirmed.is_distinct_from(confirmed)
+            )
+        ).values(
+            confirmed=confirmed,
+            confirmed_at=datetime.utcnow() if confirmed else None
         )
-    ).values(
-        confirmed=confirmed,
-        confirmed_at=datetime.utcnow() if confirmed else None
     )
     
-    db.execute(stmt)
+    if result.rowcount:
+        db.execute(
+            CollectiveMeeting.__table__.update().where(
+                CollectiveMeeting.id == meeting_id
+            ).values(
+                total_confirmed=func.greatest(
+                    func.coalesce(CollectiveMeeting.total_confirmed, 0) + (1 if confirmed else -1),
+                    0
+                )
+            )
+        )
     
-    # Update total confirmed count
-    confirmed_count = db.query(func.count()).select_from(meeting_attendees).filter(
-        and_(
-            meeting_attendees.c.meeting_id == meeting_id,
-            meeting_attendees.c.confirmed == True
+    db.commit()
+    return True
+
+
+def recount_attendance(db: Session, meeting_id: str) -> CollectiveMeeting:
+    """Recompute the meeting's invited/confirmed/attended counters from the roster"""
+    meeting = get_collective_meeting_by_id(db, meeting_id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reunião não encontrada"
         )
-    ).scalar()
     
-    meeting.total_confirmed = confirmed_count
+    invited, confirmed, attended = db.query(
+        func.count(),
+        func.count().filter(meeting_attendees.c.confirmed == True),
+        func.count().filter(meeting_attendees.c.attended == True)
+    ).select_from(meeting_attendees).filter(
+        meeting_attendees.c.meeting_id == meeting_id
+    ).one()
+    
+    meeting.total_invited = invited
+    meeting.total_confirmed = confirmed
+    meeting.total_attended = attended
     
     db.commit()
-    return True
+    db.refresh(meeting)
+    return meeting
 
 
 def mark_attendance(db: Session, meeting_id: str, member_ids: List[str]) -> CollectiveMeeting:
@@ -181,6 +302,7 @@ def mark_attendance(db: Session, meeting_id: str, member_ids: List[str]) -> Coll
         )
     
     meeting.total_attended = len(member_ids)
+    attendance_service.refresh_for_meeting(db, meeting)
     
     db.commit()
     db.refresh(meeting)
@@ -205,6 +327,8 @@ def complete_meeting(db: Session, meeting_id: str, notes: Optional[str] = None)
     meeting.mark_as_completed()
     if notes:
         meeting.notes = notes
+    attendance_service.refresh_for_meeting(db, meeting)
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_COLLECTIVE_MEETING_REMINDER, [meeting.id])
     
     db.commit()
     db.refresh(meeting)
@@ -227,6 +351,8 @@ def cancel_meeting(db: Session, meeting_id: str) -> CollectiveMeeting:
         )
     
     meeting.cancel()
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_COLLECTIVE_MEETING_REMINDER, [meeting.id])
+    calendar_feed_service.invalidate_collective_meeting(db, meeting.id)
     
     db.commit()
     db.refresh(meeting)
@@ -242,7 +368,18 @@ def delete_meeting(db: Session, meeting_id: str) -> bool:
             detail="Reunião não encontrada"
         )
     
+    completed = meeting.status == CollectiveMeetingStatus.REALIZADA
+    if completed:
+        member_ids = [member_id for (member_id,) in db.query(meeting_attendees.c.member_id).filter(
+            meeting_attendees.c.meeting_id == meeting_id
+        )]
+    
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_COLLECTIVE_MEETING_REMINDER, [meeting.id])
+    calendar_feed_service.invalidate_collective_meeting(db, meeting.id)
     db.delete(meeting)
+    if completed and member_ids:
+        db.flush()
+        attendance_service.refresh_members(db, member_ids, meeting.scheduled_date)
     db.commit()
     return True
 
@@ -265,20 +402,12 @@ def get_meeting_stats(db: Session) -> Dict[str, Any]:
     ).count()
     
     # Calculate average attendance rate
-    completed_meetings = db.query(CollectiveMeeting).filter(
+    avg_attendance = db.query(
+        func.avg(CollectiveMeeting.total_attended * 100.0 / CollectiveMeeting.total_invited)
+    ).filter(
         CollectiveMeeting.status == CollectiveMeetingStatus.REALIZADA,
         CollectiveMeeting.total_invited > 0
-    ).all()
-    
-    if completed_meetings:
-        attendance_rates = [
-            (m.total_attended / m.total_invited * 100) 
-            for m in completed_meetings 
-            if m.total_invited > 0
-        ]
-        avg_attendance = sum(attendance_rates) / len(attendance_rates) if attendance_rates else None
-    else:
-        avg_attendance = None
+    ).scalar()
     
     return {
         "total_meetings": total,
@@ -0,0 +1,372 @@
+"""
+Delivery Service - Email and web push delivery of notifications
+"""
+import threading
+import time
+from collections import deque
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, func, inspect, exists
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.models.notification import Notification, NotificationPriority
+from app.models.notification_delivery import (
+    NotificationDelivery, NotificationPreference, PushSubscription, DeliveryChannel, DeliveryStatus
+)
+from app.models.user import User
+from app.schemas.notification_delivery import NotificationPreferenceUpdate, PushSubscriptionCreate
+from app.services import delivery_providers
+
+
+PRIORITY_RANK = {
+    NotificationPriority.LOW: 0,
+    NotificationPriority.NORMAL: 1,
+    NotificationPriority.HIGH: 2,
+    NotificationPriority.URGENT: 3,
+}
+
+# Window used to compute throughput in the metrics
+THROUGHPUT_WINDOW_SECONDS = 60
+
+
+# Preferences
+
+def _default_preferences(user_id: str) -> NotificationPreference:
+    return NotificationPreference(
+        user_id=user_id,
+        email_enabled=True,
+        push_enabled=True,
+        min_priority=NotificationPriority(settings.DELIVERY_DEFAULT_MIN_PRIORITY)
+    )
+
+
+def get_preferences(db: Session, user_id: str) -> NotificationPreference:
+    """Get the user's delivery preferences (defaults when never saved)"""
+    preferences = db.query(NotificationPreference).filter(
+        NotificationPreference.user_id == user_id
+    ).first()
+    return preferences or _default_preferences(user_id)
+
+
+def update_preferences(
+    db: Session,
+    user_id: str,
+    preferences_data: NotificationPreferenceUpdate
+) -> NotificationPreference:
+    """Update the user's delivery preferences"""
+    preferences = db.query(NotificationPreference).filter(
+        NotificationPreference.user_id == user_id
+    ).first()
+    if not preferences:
+        preferences = _default_preferences(user_id)
+        db.add(preferences)
+
+    for field, value in preferences_data.model_dump(exclude_unset=True).items():
+        setattr(preferences, field, value)
+
+    db.commit()
+    db.refresh(preferences)
+    return preferences
+
+
+def add_push_subscription(db: Session, user_id: str, subscription_data: PushSubscriptionCreate) -> PushSubscription:
+    """Register a browser for web push (re-registering an endpoint moves it to this user)"""
+    subscription = db.query(PushSubscription).filter(
+        PushSubscription.endpoint == subscription_data.endpoint
+    ).first()
+    if not subscription:
+        subscription = PushSubscription(endpoint=subscription_data.endpoint)
+        db.add(subscription)
+
+    subscription.user_id = user_id
+    subscription.p256dh = subscription_data.p256dh
+    subscription.auth = subscription_data.auth
+
+    db.commit()
+    db.refresh(subscription)
+    return subscription
+
+
+def delete_push_subscription(db: Session, user_id: str, subscription_id: str) -> bool:
+    """Remove one of the user's push subscriptions"""
+    subscription = db.query(PushSubscription).filter(
+        PushSubscription.id == subscription_id,
+        PushSubscription.user_id == user_id
+    ).first()
+    if not subscription:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Inscrição não encontrada"
+        )
+
+    db.delete(subscription)
+    db.commit()
+    return True
+
+
+# Scheduling
+
+def schedule_deliveries(db: Session, notifications: List[Optional[Notification]]) -> List[NotificationDelivery]:
+    """
+    Add deliveries for notifications that should leave the app, without committing.
+    One query loads every user's preferences and push subscription flag. Pending
+    deliveries are only looked up for notifications already in the database
+    (coalesced notifications are sent once, with the newest content). New
+    notifications need no flush: deliveries are attached through the relationship.
+    """
+    notifications = [notification for notification in notifications if notification is not None]
+    if not notifications:
+        return []
+
+    channels = delivery_providers.enabled_channels()
+    if not channels:
+        return []
+
+    user_ids = list({notification.user_id for notification in notifications})
+    has_push = exists().where(PushSubscription.user_id == User.id)
+    preferences: Dict[str, Optional[NotificationPreference]] = {}
+    push_users = set()
+    for user_id, preference, push in db.query(User.id, NotificationPreference, has_push).outerjoin(
+        NotificationPreference, NotificationPreference.user_id == User.id
+    ).filter(User.id.in_(user_ids)):
+        preferences[user_id] = preference
+        if push and DeliveryChannel.WEB_PUSH in channels:
+            push_users.add(user_id)
+
+    stored_ids = [notification.id for notification in notifications if inspect(notification).has_identity]
+    already_pending = set(db.query(
+        NotificationDelivery.notification_id,
+        NotificationDelivery.channel
+    ).filter(
+        NotificationDelivery.notification_id.in_(stored_ids),
+        NotificationDelivery.status == DeliveryStatus.PENDING
+    ).all()) if stored_ids else set()
+
+    default_min_priority = NotificationPriority(settings.DELIVERY_DEFAULT_MIN_PRIORITY)
+    deliveries = []
+    queued = set()
+    for notification in notifications:
+        preference = preferences.get(notification.user_id)
+        min_priority = preference.min_priority if preference else default_min_priority
+        priority = notification.priority or NotificationPriority.NORMAL
+        if PRIORITY_RANK[NotificationPriority(priority)] < PRIORITY_RANK[NotificationPriority(min_priority)]:
+            continue
+
+        wanted = []
+        if DeliveryChannel.EMAIL in channels and (preference is None or preference.email_enabled):
+            wanted.append(DeliveryChannel.EMAIL)
+        if notification.user_id in push_users and (preference is None or preference.push_enabled):
+            wanted.append(DeliveryChannel.WEB_PUSH)
+
+        for channel in wanted:
+            if (notification.id, channel) in already_pending or (id(notification), channel) in queued:
+                continue
+            queued.add((id(notification), channel))
+            deliveries.append(NotificationDelivery(
+                notification=notification,
+                user_id=notification.user_id,
+                channel=channel,
+                status=DeliveryStatus.PENDING,
+                attempts=0,
+                next_attempt_at=datetime.utcnow()
+            ))
+
+    db.add_all(deliveries)
+    return deliveries
+
+
+# Worker steps
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for failed deliveries"""
+    return timedelta(seconds=settings.DELIVERY_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+
+def claim_batch(db: Session, batch_size: int = 200) -> Dict[str, Any]:
+    """
+    Claim a batch of due deliveries and load everything needed to send them.
+    Claimed rows are marked SENDING and committed, so no lock is held while providers are called.
+    Deliveries left SENDING by a crashed worker are claimed again after DELIVERY_CLAIM_TIMEOUT_SECONDS.
+    """
+    now = datetime.utcnow()
+    stale_claim = now - timedelta(seconds=settings.DELIVERY_CLAIM_TIMEOUT_SECONDS)
+    deliveries = db.query(NotificationDelivery).filter(
+        or_(
+            and_(
+                NotificationDelivery.status == DeliveryStatus.PENDING,
+                NotificationDelivery.next_attempt_at <= now
+            ),
+            and_(
+                NotificationDelivery.status == DeliveryStatus.SENDING,
+                NotificationDelivery.claimed_at < stale_claim
+            )
+        )
+    ).order_by(
+        NotificationDelivery.next_attempt_at
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    result = {"batch_size": batch_size, "processed": len(deliveries), "messages": []}
+    if not deliveries:
+        db.commit()
+        return result
+
+    for delivery in deliveries:
+        delivery.status = DeliveryStatus.SENDING
+        delivery.claimed_at = now
+        delivery.attempts += 1
+
+    rows = db.query(
+        NotificationDelivery.id,
+        NotificationDelivery.channel,
+        NotificationDelivery.user_id,
+        Notification.title,
+        Notification.message,
+        Notification.action_url,
+        Notification.action_label,
+        User.email,
+        User.full_name
+    ).join(
+        Notification, Notification.id == NotificationDelivery.notification_id
+    ).join(
+        User, User.id == NotificationDelivery.user_id
+    ).filter(
+        NotificationDelivery.id.in_([delivery.id for delivery in deliveries])
+    ).all()
+
+    push_user_ids = list({row.user_id for row in rows if row.channel == DeliveryChannel.WEB_PUSH})
+    subscriptions: Dict[str, List[Dict[str, str]]] = {}
+    if push_user_ids:
+        for subscription in db.query(PushSubscription).filter(PushSubscription.user_id.in_(push_user_ids)):
+            subscriptions.setdefault(subscription.user_id, []).append({
+                "endpoint": subscription.endpoint,
+                "p256dh": subscription.p256dh,
+                "auth": subscription.auth,
+            })
+
+    db.commit()
+
+    for row in rows:
+        message = {
+            "delivery_id": row.id,
+            "channel": row.channel,
+            "email": row.email,
+            "full_name": row.full_name,
+            "title": row.title,
+            "message": row.message,
+            "action_url": row.action_url,
+            "action_label": row.action_label,
+        }
+        if row.channel == DeliveryChannel.WEB_PUSH:
+            message["subscriptions"] = subscriptions.get(row.user_id, [])
+        result["messages"].append(message)
+    return result
+
+
+def record_results(db: Session, results: List[Tuple[str, Optional[str]]]) -> Dict[str, int]:
+    """
+    Store the outcome of a send: (delivery_id, error) pairs, error None on success.
+    Failures are retried with exponential backoff until DELIVERY_MAX_ATTEMPTS.
+    """
+    now = datetime.utcnow()
+    sent_ids = [delivery_id for delivery_id, error in results if error is None]
+    errors = {delivery_id: error for delivery_id, error in results if error is not None}
+    summary = {"sent": 0, "retried": 0, "failed": 0}
+
+    if sent_ids:
+        summary["sent"] = db.query(NotificationDelivery).filter(
+            NotificationDelivery.id.in_(sent_ids)
+        ).update({
+            "status": DeliveryStatus.SENT,
+            "sent_at": now,
+            "last_error": None
+        }, synchronize_session=False)
+
+    if errors:
+        for delivery in db.query(NotificationDelivery).filter(NotificationDelivery.id.in_(list(errors))):
+            delivery.last_error = errors[delivery.id]
+            if delivery.attempts >= settings.DELIVERY_MAX_ATTEMPTS:
+                delivery.status = DeliveryStatus.FAILED
+                summary["failed"] += 1
+            else:
+                delivery.status = DeliveryStatus.PENDING
+                delivery.next_attempt_at = now + _retry_delay(delivery.attempts)
+                summary["retried"] += 1
+
+    db.commit()
+    return summary
+
+
+def retry_failed_deliveries(db: Session) -> int:
+    """Move failed deliveries back to the queue"""
+    count = db.query(NotificationDelivery).filter(
+        NotificationDelivery.status == DeliveryStatus.FAILED
+    ).update({
+        "status": DeliveryStatus.PENDING,
+        "attempts": 0,
+        "next_attempt_at": datetime.utcnow()
+    })
+    db.commit()
+    return count
+
+
+# Metrics (in-process: they describe the delivery worker running in this process)
+
+_metrics_lock = threading.Lock()
+_metrics: Dict[str, Any] = {"started_at": datetime.utcnow(), "channels": {}}
+
+
+def record_send(channel: DeliveryChannel, sent: int, failed: int, seconds: float) -> None:
+    """Record a provider call made by the worker"""
+    with _metrics_lock:
+        stats = _metrics["channels"].setdefault(channel.value, {
+            "sent": 0, "failed": 0, "batches": 0, "send_seconds": 0.0, "recent": deque()
+        })
+        stats["sent"] += sent
+        stats["failed"] += failed
+        stats["batches"] += 1
+        stats["send_seconds"] += seconds
+        now = time.monotonic()
+        stats["recent"].append((now, sent))
+        while stats["recent"] and stats["recent"][0][0] < now - THROUGHPUT_WINDOW_SECONDS:
+            stats["recent"].popleft()
+
+
+def get_delivery_metrics(db: Session) -> Dict[str, Any]:
+    """Get the delivery backlog and the worker's throughput"""
+    backlog = db.query(
+        NotificationDelivery.channel,
+        NotificationDelivery.status,
+        func.count(NotificationDelivery.id)
+    ).group_by(NotificationDelivery.channel, NotificationDelivery.status).all()
+    oldest_pending = db.query(func.min(NotificationDelivery.created_at)).filter(
+        NotificationDelivery.status == DeliveryStatus.PENDING
+    ).scalar()
+
+    channels = {
+        channel.value: {"pending": 0, "sending": 0, "sent": 0, "failed": 0}
+        for channel in DeliveryChannel
+    }
+    for channel, status_, count in backlog:
+        channels[channel.value][status_.value.lower()] = count
+
+    now = time.monotonic()
+    with _metrics_lock:
+        for channel, stats in _metrics["channels"].items():
+            recent_sent = sum(sent for at, sent in stats["recent"] if at >= now - THROUGHPUT_WINDOW_SECONDS)
+            channels[channel].update({
+                "worker_sent": stats["sent"],
+                "worker_failed": stats["failed"],
+                "worker_batches": stats["batches"],
+                "avg_batch_seconds": round(stats["send_seconds"] / stats["batches"], 4) if stats["batches"] else None,
+                "sent_per_second": round(recent_sent / THROUGHPUT_WINDOW_SECONDS, 2),
+            })
+        started_at = _metrics["started_at"]
+
+    return {
+        "backend": delivery_providers.backend_name(),
+        "worker_started_at": started_at,
+        "oldest_pending_at": oldest_pending,
+        "channels": channels
+    }
@@ -0,0 +1,182 @@
+"""
+Delivery Providers - Email and web push senders used by the delivery worker
+
+Every provider sends a whole batch per call and returns one error (or None) per message,
+in the same order as the messages it received.
+"""
+import json
+from collections import deque
+from html import escape
+from typing import Dict, List, Optional, Any
+
+from app.core.config import settings
+from app.models.notification_delivery import DeliveryChannel
+
+
+Message = Dict[str, Any]
+
+SINK_MAX_BATCHES = 1000  # Lotes guardados em memória pelo SinkProvider sem DELIVERY_SINK_URL
+
+
+def _absolute_url(action_url: Optional[str]) -> str:
+    if not action_url:
+        return settings.APP_URL
+    if action_url.startswith("http"):
+        return action_url
+    return settings.APP_URL.rstrip("/") + action_url
+
+
+def render_email(message: Message) -> Dict[str, Any]:
+    """Build the Resend email params for a notification"""
+    link = _absolute_url(message.get("action_url"))
+    label = message.get("action_label") or "Abrir o Union"
+    body = escape(message["message"]).replace("\n", "<br>")
+    return {
+        "from": settings.EMAIL_FROM,
+        "to": [message["email"]],
+        "subject": message["title"],
+        "html": (
+            f"<p>Olá {escape(message.get('full_name') or '')},</p>"
+            f"<p>{body}</p>"
+            f'<p><a href="{escape(link)}">{escape(label)}</a></p>'
+        ),
+        "text": f"{message['message']}\n\n{label}: {link}",
+    }
+
+
+def render_push(message: Message) -> str:
+    """Build the web push payload for a notification"""
+    return json.dumps({
+        "title": message["title"],
+        "body": message["message"],
+        "url": _absolute_url(message.get("action_url")),
+    })
+
+
+class ResendEmailProvider:
+    """Email through the Resend batch API (up to 100 emails per request)"""
+    channel = DeliveryChannel.EMAIL
+    max_batch_size = 100
+
+    def __init__(self):
+        import resend
+        resend.api_key = settings.RESEND_API_KEY
+        self._resend = resend
+
+    def send_batch(self, messages: List[Message]) -> List[Optional[str]]:
+        # The batch endpoint is all-or-nothing: an exception fails every message
+        self._resend.Batch.send([render_email(message) for message in messages])
+        return [None] * len(messages)
+
+
+class WebPushProvider:
+    """Web push through pywebpush (optional dependency), one request per subscription"""
+    channel = DeliveryChannel.WEB_PUSH
+    max_batch_size = 50
+
+    def __init__(self):
+        from pywebpush import webpush, WebPushException
+        self._webpush = webpush
+        self._error = WebPushException
+
+    def send_batch(self, messages: List[Message]) -> List[Optional[str]]:
+        errors = []
+        for message in messages:
+            payload = render_push(message)
+            failures = []
+            for subscription in message["subscriptions"]:
+                try:
+                    self._webpush(
+                        subscription_info={
+                            "endpoint": subscription["endpoint"],
+                            "keys": {"p256dh": subscription["p256dh"], "auth": subscription["auth"]},
+                        },
+                        data=payload,
+                        vapid_private_key=settings.VAPID_PRIVATE_KEY,
+                        vapid_claims={"sub": f"mailto:{settings.VAPID_CLAIMS_EMAIL}"},
+                    )
+                except self._error as e:
+                    failures.append(str(e))
+            # Delivered if at least one of the user's browsers accepted it
+            if failures and len(failures) == len(message["subscriptions"]):
+                errors.append("; ".join(failures))
+            else:
+                errors.append(None)
+        return errors
+
+
+class SinkProvider:
+    """
+    Fake provider for development and tests (only with DELIVERY_BACKEND=sink).
+    Posts each batch to DELIVERY_SINK_URL when set, otherwise keeps the latest
+    SINK_MAX_BATCHES batches in memory (SinkProvider.sent).
+    """
+    max_batch_size = 100
+    sent: deque = deque(maxlen=SINK_MAX_BATCHES)
+
+    def __init__(self, channel: DeliveryChannel):
+        self.channel = channel
+
+    def send_batch(self, messages: List[Message]) -> List[Optional[str]]:
+        if self.channel == DeliveryChannel.EMAIL:
+            rendered = [render_email(message) for message in messages]
+        else:
+            rendered = [json.loads(render_push(message)) for message in messages]
+        batch = {"channel": self.channel.value, "messages": rendered}
+
+        if settings.DELIVERY_SINK_URL:
+            import httpx
+            response = httpx.post(settings.DELIVERY_SINK_URL, json=batch, timeout=10)
+            response.raise_for_status()
+        else:
+            SinkProvider.sent.append(batch)
+        return [None] * len(messages)
+
+
+def backend_name() -> str:
+    """
+    Email backend in use: resend, sink or none.
+    "auto" only means resend when RESEND_API_KEY is set; without it email is disabled
+    (never the sink, which would mark deliveries as sent without sending anything).
+    """
+    if settings.DELIVERY_BACKEND != "auto":
+        return settings.DELIVERY_BACKEND
+    return "resend" if settings.RESEND_API_KEY else "none"
+
+
+def _push_available() -> bool:
+    if not settings.VAPID_PRIVATE_KEY:
+        return False
+    try:
+        import pywebpush  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def enabled_channels() -> List[DeliveryChannel]:
+    """Channels the configured backend can deliver to (no deliveries are queued for the others)"""
+    backend = backend_name()
+    if backend == "sink":
+        return [DeliveryChannel.EMAIL, DeliveryChannel.WEB_PUSH]
+    channels = []
+    if backend == "resend":
+        channels.append(DeliveryChannel.EMAIL)
+    if _push_available():
+        channels.append(DeliveryChannel.WEB_PUSH)
+    return channels
+
+
+def get_providers() -> Dict[DeliveryChannel, Any]:
+    """Providers for the configured backend, keyed by channel"""
+    backend = backend_name()
+    if backend == "sink":
+        return {channel: SinkProvider(channel) for channel in DeliveryChannel}
+    providers: Dict[DeliveryChannel, Any] = {}
+    if backend == "resend":
+        providers[DeliveryChannel.EMAIL] = ResendEmailProvider()
+    else:
+        print(f"⚠️  Email delivery disabled (DELIVERY_BACKEND={settings.DELIVERY_BACKEND}, RESEND_API_KEY not set)")
+    if _push_available():
+        providers[DeliveryChannel.WEB_PUSH] = WebPushProvider()
+    return providers
@@ -0,0 +1,286 @@
+"""
+Export Service - Hub reports as CSV, NDJSON, XLSX or Parquet
+
+Rows are read through a server-side cursor (yield_per) EXPORT_BATCH_SIZE at a
+time and written out batch by batch, so memory does not grow with the report.
+CSV and NDJSON go straight to the response. XLSX (openpyxl, write-only mode) and
+Parquet (pyarrow) are optional dependencies; both formats need the complete file
+before it can be read, so they are written to a temporary file batch by batch and
+streamed from there.
+"""
+import csv
+import io
+import json
+import os
+import tempfile
+from enum import Enum
+from typing import Any, Iterator, List, Optional, Sequence
+from datetime import datetime
+from sqlalchemy import Boolean, DateTime, Float, Integer, select
+from sqlalchemy.orm import aliased
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.meeting import Meeting, MeetingStatus, MeetingType
+from app.models.member import Member, MemberStatus, BusinessCategory
+from app.models.payment import Payment, PaymentStatus, PaymentType
+from app.models.user import User
+from app.models.visit import VisitStatus, VisitPurpose
+from app.schemas.export import ExportFormat
+from app.services import meeting as meeting_service
+from app.services import visit as visit_service
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+XLSX_MAX_ROWS = 1048575  # Linhas de dados por planilha (mais o cabeçalho)
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def check_format(export_format: ExportFormat) -> None:
+    """Reject formats whose library is not installed (before the response starts)"""
+    try:
+        if export_format == ExportFormat.XLSX:
+            import openpyxl  # noqa: F401
+        elif export_format == ExportFormat.PARQUET:
+            import pyarrow  # noqa: F401
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Exportação em {export_format.value.upper()} não está disponível neste servidor. Use CSV ou NDJSON."
+        )
+
+
+def filename(report: str, export_format: ExportFormat) -> str:
+    return f"{report}_{datetime.utcnow():%Y%m%d_%H%M}.{export_format.value}"
+
+
+# Reports
+
+def visits_select(
+    status_filter: Optional[VisitStatus] = None,
+    purpose_filter: Optional[VisitPurpose] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Same rows and filters as GET /visits/all/visits"""
+    return visit_service.all_visits_select(status_filter, purpose_filter, date_from, date_to)
+
+
+def meetings_select(
+    status_filter: Optional[MeetingStatus] = None,
+    meeting_type_filter: Optional[MeetingType] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Same rows and filters as GET /meetings/all"""
+    hub = aliased(User)
+    statement = select(
+        Meeting.id, Meeting.member_id, Member.company_name.label("member_company"),
+        Member.business_category, User.full_name.label("user_name"), User.email.label("user_email"),
+        Meeting.meeting_type, Meeting.scheduled_date, Meeting.duration_minutes, Meeting.location,
+        Meeting.meeting_link, Meeting.status, Meeting.member_notes, Meeting.hub_notes,
+        Meeting.cancellation_reason, Meeting.assigned_hub_id, hub.full_name.label("assigned_hub_name"),
+        Meeting.created_at, Meeting.confirmed_at, Meeting.cancelled_at, Meeting.completed_at
+    ).join(
+        Member, Member.id == Meeting.member_id
+    ).join(
+        User, User.id == Member.user_id
+    ).outerjoin(
+        hub, hub.id == Meeting.assigned_hub_id
+    )
+    return meeting_service.filter_meetings(statement, status_filter, meeting_type_filter, date_from, date_to)
+
+
+def payments_select(
+    status_filter: Optional[PaymentStatus] = None,
+    payment_type_filter: Optional[PaymentType] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Payments, newest first (dates filter on creation)"""
+    verifier = aliased(User)
+    statement = select(
+        Payment.id, Payment.user_id, User.full_name.label("user_name"), User.email.label("user_email"),
+        Payment.payment_type, Payment.amount, Payment.status, Payment.reference_month, Payment.due_date,
+        Payment.payment_date, Payment.payment_proof_url, Payment.verified_by,
+        verifier.full_name.label("verified_by_name"), Payment.verified_at, Payment.rejection_reason,
+        Payment.created_at
+    ).join(
+        User, User.id == Payment.user_id
+    ).outerjoin(
+        verifier, verifier.id == Payment.verified_by
+    )
+
+    if status_filter:
+        statement = statement.where(Payment.status == status_filter)
+
+    if payment_type_filter:
+        statement = statement.where(Payment.payment_type == payment_type_filter)
+
+    if date_from:
+        statement = statement.where(Payment.created_at >= date_from)
+
+    if date_to:
+        statement = statement.where(Payment.created_at <= date_to)
+
+    return statement.order_by(Payment.created_at.desc())
+
+
+def members_select(
+    status_filter: Optional[MemberStatus] = None,
+    category_filter: Optional[BusinessCategory] = None,
+    city: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Members with their user, by company name (dates filter on creation)"""
+    statement = select(
+        Member.id, Member.user_id, User.full_name.label("user_name"), User.email.label("user_email"),
+        User.phone.label("user_phone"), Member.company_name, Member.business_category, Member.status,
+        Member.business_phone, Member.business_email, Member.website, Member.city, Member.state,
+        Member.reputation_score, Member.total_referrals_given, Member.total_referrals_received,
+        Member.total_deals_closed, Member.approved_at, Member.created_at
+    ).join(
+        User, User.id == Member.user_id
+    )
+
+    if status_filter:
+        statement = statement.where(Member.status == status_filter)
+
+    if category_filter:
+        statement = statement.where(Member.business_category == category_filter)
+
+    if city:
+        statement = statement.where(Member.city.ilike(city))
+
+    if date_from:
+        statement = statement.where(Member.created_at >= date_from)
+
+    if date_to:
+        statement = statement.where(Member.created_at <= date_to)
+
+    return statement.order_by(Member.company_name.asc(), Member.id.asc())
+
+
+# Streaming
+
+def _batches(statement) -> Iterator[Sequence[Any]]:
+    """Rows in EXPORT_BATCH_SIZE batches from a server-side cursor (own session: the response outlives the request)"""
+    db = SessionLocal()
+    try:
+        result = db.execute(statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        for rows in result.partitions():
+            yield rows
+    finally:
+        db.close()
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _text(value: Any) -> Any:
+    value = _plain(value)
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv(columns: List[str], statement) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM: Excel opens the accents correctly
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    for rows in _batches(statement):
+        writer.writerows([_text(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson(columns: List[str], statement) -> Iterator[bytes]:
+    for rows in _batches(statement):
+        yield "".join(
+            json.dumps(dict(zip(columns, map(_plain, row))), ensure_ascii=False, default=_text) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def _xlsx(columns: List[str], statement, path: str) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet, written = None, XLSX_MAX_ROWS
+    for rows in _batches(statement):
+        for row in rows:
+            if written == XLSX_MAX_ROWS:
+                sheet, written = workbook.create_sheet(), 0
+                sheet.append(columns)
+            sheet.append([_plain(value) for value in row])
+            written += 1
+    if sheet is None:
+        workbook.create_sheet().append(columns)
+    workbook.save(path)
+
+
+def _arrow_type(column_type):
+    import pyarrow as pa
+
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _parquet(columns: List[str], statement, path: str) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Schema from the column types: a batch of only nulls must not change it
+    schema = pa.schema([
+        (name, _arrow_type(column.type)) for name, column in zip(columns, statement.selected_columns)
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in _batches(statement):
+            writer.write_table(pa.Table.from_pylist(
+                [dict(zip(columns, map(_plain, row))) for row in rows], schema=schema
+            ))
+
+
+def _from_file(build, columns: List[str], statement) -> Iterator[bytes]:
+    handle, path = tempfile.mkstemp(prefix="export_")
+    os.close(handle)
+    try:
+        build(columns, statement, path)
+        with open(path, "rb") as exported:
+            while chunk := exported.read(FILE_CHUNK_SIZE):
+                yield chunk
+    finally:
+        os.remove(path)
+
+
+def stream(statement, export_format: ExportFormat) -> Iterator[bytes]:
+    """The report's bytes, produced as the client reads them"""
+    columns: List[str] = list(statement.selected_columns.keys())
+    if export_format == ExportFormat.CSV:
+        return _csv(columns, statement)
+    if export_format == ExportFormat.NDJSON:
+        return _ndjson(columns, statement)
+    if export_format == ExportFormat.XLSX:
+        return _from_file(_xlsx, columns, statement)
+    return _from_file(_parquet, columns, statement)
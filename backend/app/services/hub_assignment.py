@@ -0,0 +1,249 @@
+"""
+Hub Assignment Service - Distributes 1:1 meetings across Hubs
+
+Each process keeps the Hubs' load (upcoming PENDING/CONFIRMED meetings) in an
+in-memory min-heap. Before every assignment it is synced from the database:
+only Hubs with meetings changed since the last sync are recounted, and the whole
+heap is rebuilt every ASSIGNMENT_REBUILD_SECONDS (deletions, new Hubs, time passing).
+Candidates are the least-loaded Hubs that take the meeting type, have capacity and
+are free at the slot; the member's business category breaks ties. The per-Hub
+exclusion constraint stays the final guard against two processes racing for a slot.
+"""
+import heapq
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.timezone import local_now
+from app.models.availability import HubProfile
+from app.models.meeting import Meeting, MeetingStatus, MeetingType
+from app.models.user import User
+from app.services import availability as availability_service
+
+
+# Meetings that count towards a Hub's load
+ACTIVE_STATUSES = [MeetingStatus.PENDING, MeetingStatus.CONFIRMED]
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [item.strip().upper() for item in (value or "").split(",") if item.strip()]
+
+
+def _count_loads(db: Session, hub_ids: Optional[List[str]] = None) -> Dict[str, int]:
+    """Upcoming active meetings per Hub (one GROUP BY)"""
+    query = db.query(Meeting.assigned_hub_id, func.count(Meeting.id)).filter(
+        Meeting.assigned_hub_id.isnot(None),
+        Meeting.status.in_(ACTIVE_STATUSES),
+        Meeting.scheduled_date >= local_now()
+    )
+    if hub_ids is not None:
+        query = query.filter(Meeting.assigned_hub_id.in_(hub_ids))
+    return dict(query.group_by(Meeting.assigned_hub_id).all())
+
+
+class HubLoadQueue:
+    """Min-heap of (load, hub_id) with lazy invalidation of outdated entries"""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, str]] = []
+        self._loads: Dict[str, int] = {}
+        self._synced_at: Optional[datetime] = None
+        self._rebuilt_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def _set(self, hub_id: str, load: int) -> None:
+        if self._loads.get(hub_id) != load:
+            self._loads[hub_id] = load
+            heapq.heappush(self._heap, (load, hub_id))
+
+    def rebuild(self, db: Session) -> None:
+        """Reload every Hub's load"""
+        now = datetime.utcnow()
+        hub_ids = availability_service.get_hub_ids(db)
+        loads = _count_loads(db)
+        with self._lock:
+            self._loads = {hub_id: loads.get(hub_id, 0) for hub_id in hub_ids}
+            self._heap = [(load, hub_id) for hub_id, load in self._loads.items()]
+            heapq.heapify(self._heap)
+            self._synced_at = self._rebuilt_at = now
+
+    def sync(self, db: Session) -> None:
+        """Recount only the Hubs whose meetings changed since the last sync"""
+        now = datetime.utcnow()
+        if self._rebuilt_at is None or (now - self._rebuilt_at).total_seconds() >= settings.ASSIGNMENT_REBUILD_SECONDS:
+            self.rebuild(db)
+            return
+
+        touched = [hub_id for (hub_id,) in db.query(Meeting.assigned_hub_id).filter(
+            Meeting.updated_at >= self._synced_at,
+            Meeting.assigned_hub_id.isnot(None)
+        ).distinct()]
+        loads = _count_loads(db, touched) if touched else {}
+        with self._lock:
+            for hub_id in touched:
+                if hub_id in self._loads:
+                    self._set(hub_id, loads.get(hub_id, 0))
+            self._synced_at = now
+
+    def adjust(self, hub_id: str, delta: int) -> None:
+        """Apply a change made by this process right away"""
+        with self._lock:
+            if hub_id in self._loads:
+                self._set(hub_id, max(self._loads[hub_id] + delta, 0))
+
+    def ordered(self) -> List[Tuple[int, str]]:
+        """Hubs from least to most loaded (the heap is left intact)"""
+        with self._lock:
+            entries, seen = [], set()
+            while self._heap:
+                load, hub_id = heapq.heappop(self._heap)
+                # Entries superseded by a newer load are dropped for good
+                if self._loads.get(hub_id) == load and hub_id not in seen:
+                    seen.add(hub_id)
+                    entries.append((load, hub_id))
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+            return entries
+
+
+hub_queue = HubLoadQueue()
+
+
+def _refusal(profile: Optional[HubProfile], meeting_type: MeetingType, load: int) -> Optional[str]:
+    """Why a Hub's profile refuses a new meeting (None: it takes it)"""
+    if not profile:
+        return None
+    types = _split(profile.meeting_types)
+    if not profile.accepting_meetings:
+        return "Este Hub não está aceitando novas reuniões"
+    if types and MeetingType(meeting_type).value not in types:
+        return f"Este Hub não atende reuniões do tipo {MeetingType(meeting_type).value}"
+    if profile.max_active_meetings is not None and load >= profile.max_active_meetings:
+        return "Este Hub atingiu o limite de reuniões ativas"
+    return None
+
+
+def check_takes_meeting(db: Session, hub_id: str, meeting_type: MeetingType) -> None:
+    """409 when the Hub's profile refuses a new meeting (not accepting, type or capacity)"""
+    profile = db.query(HubProfile).filter(HubProfile.hub_user_id == hub_id).first()
+    load = _count_loads(db, [hub_id]).get(hub_id, 0) if profile and profile.max_active_meetings is not None else 0
+    reason = _refusal(profile, meeting_type, load)
+    if reason:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=reason
+        )
+
+
+def pick_hubs(
+    db: Session,
+    meeting_type: MeetingType,
+    business_category: Optional[str],
+    start: datetime,
+    duration_minutes: int
+) -> Optional[List[str]]:
+    """
+    Hubs that can take a meeting, best first.
+    Returns None when there are no active Hubs (meetings stay unassigned).
+    """
+    hub_queue.sync(db)
+    ordered = hub_queue.ordered()
+    if not ordered:
+        return None
+
+    profiles = {profile.hub_user_id: profile for profile in db.query(HubProfile).filter(
+        HubProfile.hub_user_id.in_([hub_id for _, hub_id in ordered])
+    )}
+
+    eligible = [
+        (load, hub_id) for load, hub_id in ordered
+        if _refusal(profiles.get(hub_id), meeting_type, load) is None
+    ]
+    free = availability_service.get_free_hubs(db, [hub_id for _, hub_id in eligible], start, duration_minutes) if eligible else set()
+
+    def skill_match(hub_id: str) -> bool:
+        profile = profiles.get(hub_id)
+        return bool(profile and business_category and business_category in _split(profile.business_categories))
+
+    # Least loaded first; same load: Hubs preferring the member's category first (stable for the rest)
+    return [
+        hub_id for _, _, hub_id in sorted(
+            (load, not skill_match(hub_id), hub_id) for load, hub_id in eligible if hub_id in free
+        )
+    ]
+
+
+# Per-Hub queues
+
+def get_hub_queue(db: Session, hub_id: str, status_filter: Optional[MeetingStatus] = None) -> List[Meeting]:
+    """Upcoming meetings assigned to a Hub (pending and confirmed by default)"""
+    statuses = [status_filter] if status_filter else ACTIVE_STATUSES
+    return db.query(Meeting).filter(
+        Meeting.assigned_hub_id == hub_id,
+        Meeting.status.in_(statuses),
+        Meeting.scheduled_date >= local_now()
+    ).order_by(Meeting.scheduled_date.asc()).all()
+
+
+def get_queue_summary(db: Session) -> List[Dict[str, Any]]:
+    """Load of every active Hub, plus the unassigned queue (hub_id None)"""
+    counts: Dict[Optional[str], Dict[str, int]] = {}
+    for hub_id, meeting_status, count in db.query(
+        Meeting.assigned_hub_id, Meeting.status, func.count(Meeting.id)
+    ).filter(
+        Meeting.status.in_(ACTIVE_STATUSES),
+        Meeting.scheduled_date >= local_now()
+    ).group_by(Meeting.assigned_hub_id, Meeting.status):
+        counts.setdefault(hub_id, {})[meeting_status.value] = count
+
+    hub_ids = availability_service.get_hub_ids(db)
+    names = dict(db.query(User.id, User.full_name).filter(User.id.in_(hub_ids)).all()) if hub_ids else {}
+    profiles = {profile.hub_user_id: profile for profile in db.query(HubProfile).filter(HubProfile.hub_user_id.in_(hub_ids))} if hub_ids else {}
+
+    summary = []
+    for hub_id in hub_ids + [None]:
+        hub_counts = counts.get(hub_id, {})
+        if hub_id is None and not hub_counts:
+            continue
+        profile = profiles.get(hub_id)
+        summary.append({
+            "hub_id": hub_id,
+            "hub_name": names.get(hub_id),
+            "pending": hub_counts.get(MeetingStatus.PENDING.value, 0),
+            "confirmed": hub_counts.get(MeetingStatus.CONFIRMED.value, 0),
+            "load": sum(hub_counts.values()),
+            "accepting_meetings": profile.accepting_meetings if profile else hub_id is not None,
+            "max_active_meetings": profile.max_active_meetings if profile else None
+        })
+    return summary
+
+
+# Profiles
+
+def get_profile(db: Session, hub_id: str) -> HubProfile:
+    """A Hub's assignment profile (defaults when never set, not persisted)"""
+    availability_service.get_hub_or_404(db, hub_id)
+    profile = db.query(HubProfile).filter(HubProfile.hub_user_id == hub_id).first()
+    return profile or HubProfile(hub_user_id=hub_id, accepting_meetings=True, updated_at=datetime.utcnow())
+
+
+def set_profile(db: Session, hub_id: str, profile_data: Dict[str, Any]) -> HubProfile:
+    """Replace a Hub's assignment profile"""
+    availability_service.get_hub_or_404(db, hub_id)
+    profile = db.query(HubProfile).filter(HubProfile.hub_user_id == hub_id).first()
+    if not profile:
+        profile = HubProfile(hub_user_id=hub_id)
+        db.add(profile)
+
+    profile.meeting_types = ",".join(profile_data.get("meeting_types") or []) or None
+    profile.business_categories = ",".join(profile_data.get("business_categories") or []) or None
+    profile.accepting_meetings = profile_data.get("accepting_meetings", True)
+    profile.max_active_meetings = profile_data.get("max_active_meetings")
+
+    db.commit()
+    db.refresh(profile)
+    return profile
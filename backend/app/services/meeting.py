@@ -1,20 +1,104 @@
 """
 Meeting Service
 """
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, time, timedelta
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, update
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
-from app.models.meeting import Meeting, MeetingStatus, MeetingType
+from app.core.config import settings
+from app.models.meeting import Meeting, MeetingStatus, MeetingType, OVERLAP_CONSTRAINT, PENDING_CONSTRAINT
 from app.models.member import Member
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.services import notification as notification_service
+from app.services import calendar_feed as calendar_feed_service
+from app.services import availability as availability_service
+from app.services import scheduler as scheduler_service
+from app.services import agenda as agenda_service
+from app.services import hub_assignment as hub_assignment_service
 
 
-def create_meeting(db: Session, member_id: str, user_id: str, meeting_data: Dict[str, Any]) -> Meeting:
-    """Create a new meeting"""
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    return getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+
+
+def _commit_booking(db: Session, retry_overlap: bool = False) -> bool:
+    """
+    Commit a new or moved meeting, reporting constraint violations as 409 Conflict.
+    With retry_overlap, an overlap returns False instead (the caller tries another Hub).
+    """
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        constraint = _violated_constraint(e)
+        if constraint == OVERLAP_CONSTRAINT:
+            if retry_overlap:
+                return False
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Este horário já está reservado. Escolha outro horário."
+            )
+        if constraint == PENDING_CONSTRAINT:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Você já possui uma reunião pendente. Aguarde a confirmação ou cancele a anterior."
+            )
+        raise
+    return True
+
+
+def _assigned_hub_error(assigned_hub_id: Optional[str], user: User) -> Optional[str]:
+    """Hubs act on their own (or unassigned) meetings; admins act on any"""
+    if user.role == UserRole.ADMIN or assigned_hub_id in (None, user.id):
+        return None
+    return "Esta reunião está atribuída a outro Hub"
+
+
+def _check_assigned_hub(meeting: Meeting, user: User) -> None:
+    error = _assigned_hub_error(meeting.assigned_hub_id, user)
+    if error:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=error
+        )
+
+
+def _hubs_for(db: Session, member: Member, meeting_data: Dict[str, Any]) -> List[Optional[str]]:
+    """Hubs to try for a new meeting, best first ([None] = leave it unassigned)"""
+    if not settings.MEETING_AUTO_ASSIGN:
+        return [None]
+    hub_ids = hub_assignment_service.pick_hubs(
+        db,
+        meeting_data.get('meeting_type') or MeetingType.ONLINE,
+        member.business_category,
+        meeting_data['scheduled_date'],
+        meeting_data.get('duration_minutes') or 60
+    )
+    if hub_ids is None:
+        return [None]
+    if not hub_ids:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Nenhum Hub disponível neste horário. Escolha outro horário."
+        )
+    return hub_ids
+
+
+def create_meeting(
+    db: Session,
+    member_id: str,
+    user_id: str,
+    meeting_data: Dict[str, Any],
+    check_conflicts: bool = True,
+    hub_id: Optional[str] = None
+) -> Meeting:
+    """
+    Create a new meeting (rejected with 409 when it overlaps the member's agenda, unless check_conflicts is off).
+    It is assigned to hub_id when given, otherwise to the least-loaded free Hub.
+    """
     # Verify member exists
     member = db.query(Member).filter(Member.id == member_id).first()
     if not member:
@@ -23,30 +107,30 @@ def create_meeting(db: Session, member_id: str, user_id: str, meeting_data: Dict
             detail="Membro não encontrado"
         )
     
-    # Check if member already has a pending meeting
-    existing_pending = db.query(Meeting).filter(
-        and_(
-            Meeting.member_id == member_id,
-            Meeting.status == MeetingStatus.PENDING
+    if check_conflicts:
+        agenda_service.check_conflicts(
+            db, member_id, meeting_data['scheduled_date'], meeting_data.get('duration_minutes')
         )
-    ).first()
     
-    if existing_pending:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Você já possui uma reunião pendente. Aguarde a confirmação ou cancele a anterior."
+    # Overlapping slots of a Hub and a second pending meeting are rejected by the database;
+    # a Hub taken meanwhile by another request is skipped for the next candidate
+    hub_ids = [hub_id] if hub_id else _hubs_for(db, member, meeting_data)
+    for position, candidate in enumerate(hub_ids):
+        meeting = Meeting(
+            member_id=member_id,
+            scheduled_by_id=user_id,
+            assigned_hub_id=candidate,
+            assigned_at=datetime.utcnow() if candidate else None,
+            **meeting_data
         )
-    
-    # Create meeting
-    meeting = Meeting(
-        member_id=member_id,
-        scheduled_by_id=user_id,
-        **meeting_data
-    )
-    
-    db.add(meeting)
-    db.commit()
+        db.add(meeting)
+        if _commit_booking(db, retry_overlap=position < len(hub_ids) - 1):
+            break
     db.refresh(meeting)
+    
+    if meeting.assigned_hub_id:
+        hub_assignment_service.hub_queue.adjust(meeting.assigned_hub_id, 1)
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
     return meeting
 
 
@@ -80,7 +164,18 @@ def get_all_meetings(
     query = db.query(Meeting).options(
         joinedload(Meeting.member).joinedload(Member.user)
     )
-    
+    query = filter_meetings(query, status_filter, meeting_type_filter, date_from, date_to)
+    return query.offset(skip).limit(limit).all()
+
+
+def filter_meetings(
+    query,
+    status_filter: Optional[MeetingStatus] = None,
+    meeting_type_filter: Optional[MeetingType] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Filters and order of the Hub listing, for a Query or a select() over meetings"""
     if status_filter:
         query = query.filter(Meeting.status == status_filter)
     
@@ -93,7 +188,7 @@ def get_all_meetings(
     if date_to:
         query = query.filter(Meeting.scheduled_date <= date_to)
     
-    return query.order_by(Meeting.scheduled_date.asc()).offset(skip).limit(limit).all()
+    return query.order_by(Meeting.scheduled_date.asc())
 
 
 def update_meeting(db: Session, meeting_id: str, meeting_data: Dict[str, Any]) -> Meeting:
@@ -112,22 +207,28 @@ def update_meeting(db: Session, meeting_id: str, meeting_data: Dict[str, Any]) -
             detail=f"Não é possível atualizar uma reunião {meeting.status.value.lower()}"
         )
     
+    previous_start, previous_duration = meeting.scheduled_date, meeting.duration_minutes
     for field, value in meeting_data.items():
         if value is not None and hasattr(meeting, field):
             setattr(meeting, field, value)
     
-    db.commit()
+    scheduler_service.schedule_meeting_reminders(db, meeting)
+    calendar_feed_service.invalidate_feeds(db, [meeting.member_id])
+    _commit_booking(db)
     db.refresh(meeting)
+    
+    availability_service.invalidate_interval(db, previous_start, previous_duration)
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
     return meeting
 
 
 def confirm_meeting(
     db: Session,
     meeting_id: str,
-    confirmed_by_id: str,
+    confirmed_by: User,
     confirm_data: Dict[str, Any]
 ) -> Meeting:
-    """Confirm a meeting"""
+    """Confirm a meeting (a Hub confirming an unassigned meeting takes it over)"""
     meeting = get_meeting_by_id(db, meeting_id)
     if not meeting:
         raise HTTPException(
@@ -140,9 +241,14 @@ def confirm_meeting(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Apenas reuniões pendentes podem ser confirmadas"
         )
+    _check_assigned_hub(meeting, confirmed_by)
     
+    claimed = meeting.assigned_hub_id is None and confirmed_by.role == UserRole.HUB
+    if claimed:
+        meeting.assigned_hub_id = confirmed_by.id
+        meeting.assigned_at = datetime.utcnow()
     meeting.status = MeetingStatus.CONFIRMED
-    meeting.confirmed_by_id = confirmed_by_id
+    meeting.confirmed_by_id = confirmed_by.id
     meeting.confirmed_at = datetime.utcnow()
     
     # Update optional fields
@@ -153,24 +259,27 @@ def confirm_meeting(
     if confirm_data.get('hub_notes'):
         meeting.hub_notes = confirm_data['hub_notes']
     
-    db.commit()
-    db.refresh(meeting)
+    # Queue notification (committed together with the confirmation)
+    notification_service.queue_notification(
+        db,
+        notification_service.meeting_confirmed_data(
+            meeting.member.user_id,
+            meeting.id,
+            meeting.scheduled_date.strftime('%d/%m/%Y às %H:%M'),
+            meeting.meeting_link,
+            meeting.location
+        )
+    )
+    scheduler_service.schedule_meeting_reminders(db, meeting)
+    calendar_feed_service.invalidate_feeds(db, [meeting.member_id])
     
-    # Send notification
-    try:
-        user = db.query(User).join(Member).filter(Member.id == meeting.member_id).first()
-        if user:
-            notification_service.notify_meeting_confirmed(
-                db,
-                user.id,
-                meeting.id,
-                meeting.scheduled_date.strftime('%d/%m/%Y às %H:%M'),
-                meeting.meeting_link,
-                meeting.location
-            )
-    except Exception as e:
-        print(f"Error sending notification: {e}")
+    # The Hub taking over may be busy at the slot (409)
+    _commit_booking(db)
+    db.refresh(meeting)
     
+    if claimed:
+        hub_assignment_service.hub_queue.adjust(confirmed_by.id, 1)
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
     return meeting
 
 
@@ -196,15 +305,20 @@ def cancel_meeting(
     meeting.status = MeetingStatus.CANCELLED
     meeting.cancellation_reason = cancellation_reason
     meeting.cancelled_at = datetime.utcnow()
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_MEETING_REMINDER, [meeting.id])
+    calendar_feed_service.invalidate_feeds(db, [meeting.member_id])
     
     db.commit()
     db.refresh(meeting)
+    
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
     return meeting
 
 
 def complete_meeting(
     db: Session,
     meeting_id: str,
+    completed_by: User,
     hub_notes: Optional[str] = None
 ) -> Meeting:
     """Mark meeting as completed"""
@@ -220,6 +334,7 @@ def complete_meeting(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Apenas reuniões confirmadas podem ser marcadas como concluídas"
         )
+    _check_assigned_hub(meeting, completed_by)
     
     meeting.status = MeetingStatus.COMPLETED
     meeting.completed_at = datetime.utcnow()
@@ -227,8 +342,12 @@ def complete_meeting(
     if hub_notes:
         meeting.hub_notes = hub_notes
     
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_MEETING_REMINDER, [meeting.id])
+    calendar_feed_service.invalidate_feeds(db, [meeting.member_id])
     db.commit()
     db.refresh(meeting)
+    
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
     return meeting
 
 
@@ -241,11 +360,261 @@ def delete_meeting(db: Session, meeting_id: str) -> bool:
             detail="Reunião não encontrada"
         )
     
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_MEETING_REMINDER, [meeting.id])
+    calendar_feed_service.invalidate_feeds(db, [meeting.member_id])
+    slot = (meeting.scheduled_date, meeting.duration_minutes)
+    hub_id = meeting.assigned_hub_id if meeting.status in hub_assignment_service.ACTIVE_STATUSES else None
     db.delete(meeting)
     db.commit()
+    
+    # Deletions leave no updated_at behind for the load queue sync
+    if hub_id:
+        hub_assignment_service.hub_queue.adjust(hub_id, -1)
+    availability_service.invalidate_interval(db, *slot)
     return True
 
 
+def assign_meeting(db: Session, meeting_id: str, hub_id: str, assigned_by: User, override: bool = False) -> Meeting:
+    """
+    Hand an upcoming meeting over to another Hub (409 when that Hub is busy at the slot).
+    Hubs hand over their own or unassigned meetings; the target Hub's profile must take
+    the meeting unless an admin overrides it.
+    """
+    meeting = get_meeting_by_id(db, meeting_id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reunião não encontrada"
+        )
+    
+    if meeting.status not in hub_assignment_service.ACTIVE_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Não é possível atribuir uma reunião {meeting.status.value.lower()}"
+        )
+    
+    _check_assigned_hub(meeting, assigned_by)
+    availability_service.get_hub_or_404(db, hub_id)
+    previous_hub_id = meeting.assigned_hub_id
+    if previous_hub_id == hub_id:
+        return meeting
+    if not (override and assigned_by.role == UserRole.ADMIN):
+        hub_assignment_service.check_takes_meeting(db, hub_id, meeting.meeting_type)
+    
+    meeting.assigned_hub_id = hub_id
+    meeting.assigned_at = datetime.utcnow()
+    _commit_booking(db)
+    db.refresh(meeting)
+    
+    if previous_hub_id:
+        hub_assignment_service.hub_queue.adjust(previous_hub_id, -1)
+    hub_assignment_service.hub_queue.adjust(hub_id, 1)
+    availability_service.invalidate_interval(db, meeting.scheduled_date, meeting.duration_minutes)
+    return meeting
+
+
+# Batch Hub actions
+
+def _lock_batch(db: Session, meeting_ids: List[str]) -> Dict[str, Any]:
+    """Current state of the batch's meetings in one query, locked until commit"""
+    rows = db.query(
+        Meeting.id,
+        Meeting.status,
+        Meeting.assigned_hub_id,
+        Meeting.member_id,
+        Member.user_id,
+        Meeting.scheduled_date,
+        Meeting.duration_minutes,
+        Meeting.meeting_link,
+        Meeting.location
+    ).join(
+        Member, Member.id == Meeting.member_id
+    ).filter(
+        Meeting.id.in_(meeting_ids)
+    ).with_for_update(of=Meeting).all()
+    return {row.id: row for row in rows}
+
+
+def _validate_batch(
+    db: Session,
+    items: List[Dict[str, Any]],
+    allowed: List[MeetingStatus],
+    invalid_detail: Callable[[MeetingStatus], str],
+    user: Optional[User] = None
+) -> Tuple[List[Tuple[Dict[str, Any], Any]], List[Dict[str, Any]]]:
+    """
+    Check every transition at once (with user, also that a Hub only acts on its own meetings).
+    Returns the valid (item, row) pairs and the per-item report, in request order.
+    """
+    rows = _lock_batch(db, [item["meeting_id"] for item in items])
+    valid, results, seen = [], [], set()
+    
+    for item in items:
+        meeting_id = item["meeting_id"]
+        row = rows.get(meeting_id)
+        error = None
+        if meeting_id in seen:
+            error, row = "Reunião repetida no lote", None
+        elif not row:
+            error = "Reunião não encontrada"
+        elif row.status not in allowed:
+            error = invalid_detail(row.status)
+        elif user is not None:
+            error = _assigned_hub_error(row.assigned_hub_id, user)
+        seen.add(meeting_id)
+        
+        results.append({
+            "meeting_id": meeting_id,
+            "success": error is None,
+            "status": row.status if row else None,
+            "error": error
+        })
+        if error is None:
+            valid.append((item, row))
+    
+    return valid, results
+
+
+def _batch_report(results: List[Dict[str, Any]], new_status: MeetingStatus) -> Dict[str, Any]:
+    for result in results:
+        if result["success"]:
+            result["status"] = new_status
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "requested": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+
+
+def _claim_batch(db: Session, hub_id: str, valid: List[Tuple[Dict[str, Any], Any]], results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Assign the batch's unassigned meetings to the Hub, each in a savepoint: a meeting
+    that overlaps one of the Hub's own is reported and dropped from valid.
+    Returns the IDs of the claimed meetings.
+    """
+    claimed, now = [], datetime.utcnow()
+    for item, row in list(valid):
+        if row.assigned_hub_id is not None:
+            continue
+        try:
+            with db.begin_nested():
+                db.execute(update(Meeting).where(Meeting.id == row.id).values(assigned_hub_id=hub_id, assigned_at=now))
+        except IntegrityError as e:
+            if _violated_constraint(e) != OVERLAP_CONSTRAINT:
+                raise
+            valid.remove((item, row))
+            result = next(result for result in results if result["meeting_id"] == row.id)
+            result.update(success=False, error="Você já tem outra reunião neste horário")
+            continue
+        claimed.append(row.id)
+    return claimed
+
+
+def confirm_meetings(db: Session, confirmed_by: User, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Confirm several meetings in one transaction (items: meeting_id plus MeetingConfirm fields).
+    A Hub confirming unassigned meetings takes them over.
+    """
+    valid, results = _validate_batch(
+        db, items, [MeetingStatus.PENDING],
+        lambda current: "Apenas reuniões pendentes podem ser confirmadas",
+        confirmed_by
+    )
+    claimed = _claim_batch(db, confirmed_by.id, valid, results) if confirmed_by.role == UserRole.HUB else []
+    
+    if valid:
+        now = datetime.utcnow()
+        db.execute(update(Meeting), [
+            {
+                "id": row.id,
+                "status": MeetingStatus.CONFIRMED,
+                "confirmed_by_id": confirmed_by.id,
+                "confirmed_at": now,
+                "updated_at": now,
+                **{field: item[field] for field in ("meeting_link", "location", "hub_notes") if item.get(field)}
+            }
+            for item, row in valid
+        ])
+        notification_service.queue_notifications(db, [
+            notification_service.meeting_confirmed_data(
+                row.user_id,
+                row.id,
+                row.scheduled_date.strftime('%d/%m/%Y às %H:%M'),
+                item.get("meeting_link") or row.meeting_link,
+                item.get("location") or row.location
+            )
+            for item, row in valid
+        ])
+        scheduler_service.schedule_confirmed_meetings(db, {row.id: row.scheduled_date for _, row in valid})
+        calendar_feed_service.invalidate_feeds(db, list({row.member_id for _, row in valid}))
+    
+    db.commit()
+    if claimed:
+        hub_assignment_service.hub_queue.adjust(confirmed_by.id, len(claimed))
+        # Unassigned meetings blocked every Hub; now they only block this one
+        availability_service.invalidate_intervals(
+            db, [(row.scheduled_date, row.duration_minutes) for _, row in valid if row.id in claimed]
+        )
+    return _batch_report(results, MeetingStatus.CONFIRMED)
+
+
+def complete_meetings(db: Session, completed_by: User, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Mark several meetings as completed in one transaction (items: meeting_id plus hub_notes)"""
+    valid, results = _validate_batch(
+        db, items, [MeetingStatus.CONFIRMED],
+        lambda current: "Apenas reuniões confirmadas podem ser marcadas como concluídas",
+        completed_by
+    )
+    
+    if valid:
+        now = datetime.utcnow()
+        db.execute(update(Meeting), [
+            {
+                "id": row.id,
+                "status": MeetingStatus.COMPLETED,
+                "completed_at": now,
+                "updated_at": now,
+                **({"hub_notes": item["hub_notes"]} if item.get("hub_notes") else {})
+            }
+            for item, row in valid
+        ])
+        scheduler_service.cancel_jobs(db, scheduler_service.JOB_MEETING_REMINDER, [row.id for _, row in valid])
+        calendar_feed_service.invalidate_feeds(db, list({row.member_id for _, row in valid}))
+    
+    db.commit()
+    availability_service.invalidate_intervals(db, [(row.scheduled_date, row.duration_minutes) for _, row in valid])
+    return _batch_report(results, MeetingStatus.COMPLETED)
+
+
+def cancel_meetings(db: Session, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Cancel several meetings in one transaction (items: meeting_id plus cancellation_reason)"""
+    valid, results = _validate_batch(
+        db, items, [MeetingStatus.PENDING, MeetingStatus.CONFIRMED],
+        lambda current: f"Não é possível cancelar uma reunião {current.value.lower()}"
+    )
+    
+    if valid:
+        now = datetime.utcnow()
+        db.execute(update(Meeting), [
+            {
+                "id": row.id,
+                "status": MeetingStatus.CANCELLED,
+                "cancellation_reason": item["cancellation_reason"],
+                "cancelled_at": now,
+                "updated_at": now
+            }
+            for item, row in valid
+        ])
+        scheduler_service.cancel_jobs(db, scheduler_service.JOB_MEETING_REMINDER, [row.id for _, row in valid])
+        calendar_feed_service.invalidate_feeds(db, list({row.member_id for _, row in valid}))
+    
+    db.commit()
+    availability_service.invalidate_intervals(db, [(row.scheduled_date, row.duration_minutes) for _, row in valid])
+    return _batch_report(results, MeetingStatus.CANCELLED)
+
+
 def get_meeting_stats(db: Session) -> Dict[str, int]:
     """Get meeting statistics"""
     total = db.query(Meeting).count()
@@ -278,47 +647,95 @@ def get_meeting_stats(db: Session) -> Dict[str, int]:
     }
 
 
-def get_available_slots(db: Session, date: datetime, duration_minutes: int = 60) -> List[datetime]:
+def _merge_intervals(intervals: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    """Merge overlapping busy intervals (input sorted by start)"""
+    merged: List[Tuple[datetime, datetime]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_free_slots(
+    busy: List[Tuple[datetime, datetime]],
+    start_date: date,
+    end_date: date,
+    duration_minutes: int,
+    open_hour: int,
+    close_hour: int,
+    step_minutes: int
+) -> List[datetime]:
+    """
+    Free slots of every day in [start_date, end_date] with a single sweep
+    over the sorted, merged busy intervals (O(slots + meetings))
+    """
+    duration = timedelta(minutes=duration_minutes)
+    step = timedelta(minutes=step_minutes)
+    busy = _merge_intervals(busy)
+    slots = []
+    index = 0
+
+    day = start_date
+    while day <= end_date:
+        opens = datetime.combine(day, time(hour=open_hour))
+        closes = datetime.combine(day, time(hour=close_hour))
+        current = opens
+        while current + duration <= closes:
+            # Skip intervals that ended before this slot
+            while index < len(busy) and busy[index][1] <= current:
+                index += 1
+            if index < len(busy) and busy[index][0] < current + duration:
+                # Jump to the first step after the blocking interval
+                steps = -(-(busy[index][1] - opens) // step)
+                current = opens + steps * step
+                continue
+            slots.append(current)
+            current += step
+        day += timedelta(days=1)
+
+    return slots
+
+
+def get_available_slots(
+    db: Session,
+    date: datetime,
+    duration_minutes: int = 60,
+    end_date: Optional[datetime] = None,
+    hub_id: Optional[str] = None
+) -> List[datetime]:
     """
-    Get available time slots for a given date
-    This is a simple implementation - can be enhanced with business hours, etc.
+    Get available time slots from date to end_date (inclusive, default: the same day)
+    Uses the Hubs' cached free/busy bitmaps; without active Hubs, falls back to
+    the global business hours (MEETING_* settings)
     """
-    # Get all meetings for the date
-    start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = start_of_day + timedelta(days=1)
+    first_day = date.date()
+    last_day = (end_date or date).date()
     
-    existing_meetings = db.query(Meeting).filter(
-        and_(
-            Meeting.scheduled_date >= start_of_day,
-            Meeting.scheduled_date < end_of_day,
-            or_(
-                Meeting.status == MeetingStatus.PENDING,
-                Meeting.status == MeetingStatus.CONFIRMED
-            )
-        )
-    ).all()
-    
-    # Business hours: 9:00 - 18:00
-    available_slots = []
-    current_time = start_of_day.replace(hour=9, minute=0)
-    end_time = start_of_day.replace(hour=18, minute=0)
-    
-    while current_time < end_time:
-        # Check if slot is available
-        is_available = True
-        for meeting in existing_meetings:
-            meeting_end = meeting.scheduled_date + timedelta(minutes=int(meeting.duration_minutes))
-            slot_end = current_time + timedelta(minutes=duration_minutes)
-            
-            # Check for overlap
-            if not (slot_end <= meeting.scheduled_date or current_time >= meeting_end):
-                is_available = False
-                break
-        
-        if is_available:
-            available_slots.append(current_time)
-        
-        # Move to next slot (30 minutes intervals)
-        current_time += timedelta(minutes=30)
+    slots = availability_service.get_available_slots(
+        db, first_day, last_day, duration_minutes, settings.MEETING_SLOT_MINUTES, hub_id=hub_id
+    )
+    if slots is not None:
+        return slots
     
-    return available_slots
+    range_start = datetime.combine(first_day, time.min)
+    range_end = datetime.combine(last_day + timedelta(days=1), time.min)
+
+    # One query for the whole range; meetings from the previous day may run past midnight
+    busy = db.query(Meeting.scheduled_date, Meeting.duration_minutes).filter(
+        Meeting.scheduled_date >= range_start - timedelta(days=1),
+        Meeting.scheduled_date < range_end,
+        Meeting.status.in_([MeetingStatus.PENDING, MeetingStatus.CONFIRMED])
+    ).order_by(Meeting.scheduled_date).all()
+
+    return find_free_slots(
+        [(start, start + timedelta(minutes=minutes)) for start, minutes in busy],
+        first_day,
+        last_day,
+        duration_minutes,
+        settings.MEETING_BUSINESS_START_HOUR,
+        settings.MEETING_BUSINESS_END_HOUR,
+        settings.MEETING_SLOT_MINUTES
+    )
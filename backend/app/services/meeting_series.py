@@ -0,0 +1,235 @@
+"""
+Meeting Series Service - Recurring collective meetings
+
+A series stores the template and the recurrence rule. Occurrences are expanded on
+read and only materialized as CollectiveMeeting rows (with their invitations) when
+they enter the SERIES_MATERIALIZE_DAYS_AHEAD window. A series whose rule has no
+occurrences left (COUNT used up or UNTIL passed) is deactivated once its last
+occurrence is materialized. Dates are local wall-clock times (APP_TIMEZONE).
+"""
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, select
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.timezone import local_now
+from app.models.collective_meeting import (
+    CollectiveMeeting,
+    CollectiveMeetingSeries,
+    CollectiveMeetingStatus,
+    SeriesFrequency
+)
+from app.services import collective_meeting as meeting_service
+from app.services import calendar_feed as calendar_feed_service
+from app.services import scheduler as scheduler_service
+from app.services import recurrence
+
+
+# Template fields copied to every occurrence
+TEMPLATE_FIELDS = ["title", "description", "meeting_type", "duration_minutes", "location", "meeting_link", "agenda"]
+
+
+def _horizon() -> datetime:
+    """End of the materialization window, aligned to midnight so series come due once a day"""
+    today = local_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=settings.SERIES_MATERIALIZE_DAYS_AHEAD + 1)
+
+
+def materialize_series(db: Session, series: CollectiveMeetingSeries, horizon: datetime) -> int:
+    """Create the series' meetings up to the horizon, without committing; returns how many were created"""
+    start = recurrence.pending_window_start(series)
+    if horizon <= start:
+        return 0
+
+    occurrences = list(recurrence.expand_occurrences(series, start, horizon))
+    existing = {
+        occurrence_start for (occurrence_start,) in db.query(CollectiveMeeting.occurrence_start).filter(
+            CollectiveMeeting.series_id == series.id,
+            CollectiveMeeting.occurrence_start >= start,
+            CollectiveMeeting.occurrence_start < horizon
+        )
+    }
+
+    created = 0
+    for occurrence in occurrences:
+        if occurrence in existing:
+            continue
+        meeting = CollectiveMeeting(
+            series_id=series.id,
+            occurrence_start=occurrence,
+            scheduled_date=occurrence,
+            created_by_id=series.created_by_id,
+            **{field: getattr(series, field) for field in TEMPLATE_FIELDS}
+        )
+        db.add(meeting)
+        db.flush()  # Get meeting ID
+        meeting.total_invited = meeting_service.invite_active_members(db, meeting.id)
+        scheduler_service.schedule_collective_meeting_reminders(db, meeting)
+        calendar_feed_service.invalidate_collective_meeting(db, meeting.id)
+        created += 1
+
+    series.materialized_until = horizon
+    if not recurrence.has_occurrences_from(series, horizon):
+        # Rule exhausted: nothing left for the worker or the feeds
+        series.is_active = False
+    return created
+
+
+def materialize_due_series(db: Session, batch_size: int = 20) -> Dict[str, int]:
+    """Materialize the occurrences of series entering the window (worker task)"""
+    horizon = _horizon()
+    series_list = db.query(CollectiveMeetingSeries).filter(
+        CollectiveMeetingSeries.is_active == True,
+        or_(
+            CollectiveMeetingSeries.materialized_until.is_(None),
+            CollectiveMeetingSeries.materialized_until < horizon
+        )
+    ).order_by(
+        CollectiveMeetingSeries.materialized_until.asc().nulls_first()
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    created = sum(materialize_series(db, series, horizon) for series in series_list)
+    db.commit()
+    return {"batch_size": batch_size, "processed": len(series_list), "meetings_created": created}
+
+
+def create_series(db: Session, creator_id: str, series_data: Dict[str, Any]) -> CollectiveMeetingSeries:
+    """Create a series and materialize the occurrences already inside the window"""
+    if series_data.get("until") and series_data.get("count"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Informe a data final ou o número de ocorrências, não ambos"
+        )
+    if series_data.get("by_weekday") and series_data.get("frequency") != SeriesFrequency.WEEKLY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Dias da semana só podem ser usados em séries semanais"
+        )
+    
+    series = CollectiveMeetingSeries(created_by_id=creator_id, **series_data)
+    db.add(series)
+    db.flush()
+
+    materialize_series(db, series, _horizon())
+    # Unmaterialized occurrences appear in every invited member's feed
+    calendar_feed_service.invalidate_all_feeds(db)
+
+    db.commit()
+    db.refresh(series)
+    return series
+
+
+def get_series_by_id(db: Session, series_id: str) -> Optional[CollectiveMeetingSeries]:
+    """Get series by ID"""
+    return db.query(CollectiveMeetingSeries).filter(CollectiveMeetingSeries.id == series_id).first()
+
+
+def _get_series_or_404(db: Session, series_id: str) -> CollectiveMeetingSeries:
+    series = get_series_by_id(db, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Série não encontrada"
+        )
+    return series
+
+
+def get_all_series(db: Session, active_only: bool = True) -> List[CollectiveMeetingSeries]:
+    """Get all series"""
+    query = db.query(CollectiveMeetingSeries)
+    if active_only:
+        query = query.filter(CollectiveMeetingSeries.is_active == True)
+    return query.order_by(CollectiveMeetingSeries.starts_at).all()
+
+
+def _upcoming_occurrences(series_id: str):
+    """Materialized occurrences that have not happened yet"""
+    return and_(
+        CollectiveMeeting.series_id == series_id,
+        CollectiveMeeting.status.in_([CollectiveMeetingStatus.AGENDADA, CollectiveMeetingStatus.CONFIRMADA]),
+        CollectiveMeeting.scheduled_date >= local_now()
+    )
+
+
+def update_series(db: Session, series_id: str, update_data: Dict[str, Any]) -> CollectiveMeetingSeries:
+    """Update the template of a series (also applied to its upcoming materialized meetings)"""
+    series = _get_series_or_404(db, series_id)
+    # Ended series (inactive, not cancelled) can still edit their upcoming meetings
+    if series.cancelled_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Não é possível editar uma série cancelada"
+        )
+
+    changes = {field: value for field, value in update_data.items() if value is not None and field in TEMPLATE_FIELDS}
+    for field, value in changes.items():
+        setattr(series, field, value)
+
+    if changes:
+        db.query(CollectiveMeeting).filter(_upcoming_occurrences(series.id)).update(
+            {**changes, "updated_at": datetime.utcnow()}, synchronize_session=False
+        )
+        calendar_feed_service.invalidate_all_feeds(db)
+
+    db.commit()
+    db.refresh(series)
+    return series
+
+
+def cancel_series(db: Session, series_id: str) -> CollectiveMeetingSeries:
+    """Stop a series and cancel its upcoming materialized meetings"""
+    series = _get_series_or_404(db, series_id)
+    now = datetime.utcnow()
+
+    series.is_active = False
+    series.cancelled_at = now
+    scheduler_service.cancel_jobs(
+        db,
+        scheduler_service.JOB_COLLECTIVE_MEETING_REMINDER,
+        select(CollectiveMeeting.id).where(_upcoming_occurrences(series.id))
+    )
+    db.query(CollectiveMeeting).filter(_upcoming_occurrences(series.id)).update(
+        {"status": CollectiveMeetingStatus.CANCELADA, "cancelled_at": now, "updated_at": now},
+        synchronize_session=False
+    )
+    calendar_feed_service.invalidate_all_feeds(db)
+
+    db.commit()
+    db.refresh(series)
+    return series
+
+
+def get_occurrences(db: Session, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """Collective meetings in [start, end): materialized meetings plus expanded series occurrences"""
+    meetings = db.query(CollectiveMeeting).filter(
+        CollectiveMeeting.scheduled_date >= start,
+        CollectiveMeeting.scheduled_date < end
+    ).all()
+
+    occurrences = [
+        {
+            "id": meeting.id,
+            "series_id": meeting.series_id,
+            "materialized": True,
+            "scheduled_date": meeting.scheduled_date,
+            "status": meeting.status,
+            **{field: getattr(meeting, field) for field in TEMPLATE_FIELDS}
+        }
+        for meeting in meetings
+    ]
+    occurrences += [
+        {
+            "id": None,
+            "series_id": series.id,
+            "materialized": False,
+            "scheduled_date": occurrence,
+            "status": CollectiveMeetingStatus.AGENDADA,
+            **{field: getattr(series, field) for field in TEMPLATE_FIELDS}
+        }
+        for series, occurrence in recurrence.get_unmaterialized_occurrences(db, start, end)
+    ]
+
+    occurrences.sort(key=lambda occurrence: occurrence["scheduled_date"])
+    return occurrences
@@ -53,15 +53,15 @@ def approve_visitor_to_member(db: Session, user_id: str) -> User:
     user.role = UserRole.MEMBER
     user.status = UserStatus.ACTIVE
     
+    # Queue notification (committed together with the promotion)
+    notification_service.queue_notification(
+        db,
+        notification_service.member_approved_data(user.id, user.full_name or user.email)
+    )
+    
     db.commit()
     db.refresh(user)
     
-    # Send notification
-    try:
-        notification_service.notify_member_approved(db, user.id, user.full_name or user.email)
-    except Exception as e:
-        print(f"Error sending notification: {e}")
-    
     return user
 
 
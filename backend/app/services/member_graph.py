@@ -0,0 +1,336 @@
+"""
+Member Graph Service - Business relationships between members (visits and referrals)
+
+Members are nodes and visitor→visited / referrer→referred pairs are directed edges,
+stored as CSR arrays (offsets + targets, outgoing and incoming) with the number of
+visits and referrals per edge. Each process keeps one graph: before answering, only
+the pairs of visits/referrals changed since the last sync are recounted, and the whole
+graph is reloaded every GRAPH_REBUILD_SECONDS (deleted rows). Queries then walk the
+arrays in memory instead of joining the tables.
+"""
+import threading
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import func, tuple_
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.models.member import Member, MemberStatus
+from app.models.visit import Visit, VisitStatus
+from app.models.referral import Referral, ReferralStatus
+from app.schemas.graph import GraphMetric
+
+
+# Edge counters per (source, target) node pair: [visits, referrals]
+EdgeCounts = Dict[Tuple[int, int], List[int]]
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITERATIONS = 100
+PAGERANK_TOLERANCE = 1e-8
+
+
+def _csr(node_count: int, edges: EdgeCounts, reverse: bool = False) -> Tuple[array, array, array, array]:
+    """Offsets, neighbours, visit counts and referral counts, grouped by source (or target)"""
+    pairs = sorted(((target, source) if reverse else (source, target), counts) for (source, target), counts in edges.items())
+    offsets = array('l', [0]) * (node_count + 1)
+    for (node, _), _ in pairs:
+        offsets[node + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    return (
+        offsets,
+        array('l', (neighbour for (_, neighbour), _ in pairs)),
+        array('l', (counts[0] for _, counts in pairs)),
+        array('l', (counts[1] for _, counts in pairs)),
+    )
+
+
+class MemberGraph:
+    """Immutable snapshot of the graph (node attributes are lists aligned by node index)"""
+
+    def __init__(self, ids: List[str], companies: List[str], categories: List[str], active: bytearray, edges: EdgeCounts):
+        self.ids = ids
+        self.index = {member_id: node for node, member_id in enumerate(ids)}
+        self.companies = companies
+        self.categories = categories
+        self.active = active
+        self.edge_count = len(edges)
+        self.built_at = datetime.utcnow()
+        self.out_offsets, self.out_targets, self.out_visits, self.out_referrals = _csr(len(ids), edges)
+        self.in_offsets, self.in_sources, self.in_visits, self.in_referrals = _csr(len(ids), edges, reverse=True)
+        self._pagerank: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def out_degree(self, node: int) -> int:
+        return self.out_offsets[node + 1] - self.out_offsets[node]
+
+    def in_degree(self, node: int) -> int:
+        return self.in_offsets[node + 1] - self.in_offsets[node]
+
+    def neighbours(self, node: int, visits_only: bool = False) -> Set[int]:
+        """Members linked to the node in either direction"""
+        result = set()
+        for start, end, others, visits in (
+            (self.out_offsets[node], self.out_offsets[node + 1], self.out_targets, self.out_visits),
+            (self.in_offsets[node], self.in_offsets[node + 1], self.in_sources, self.in_visits),
+        ):
+            for position in range(start, end):
+                if not visits_only or visits[position]:
+                    result.add(others[position])
+        return result
+
+    def pagerank(self) -> List[float]:
+        """Weighted PageRank (interactions per edge), computed once per snapshot"""
+        if self._pagerank is not None:
+            return self._pagerank
+
+        count = len(self.ids)
+        if not count:
+            self._pagerank = []
+            return self._pagerank
+        weights = [self.out_visits[position] + self.out_referrals[position] for position in range(len(self.out_targets))]
+        out_weight = [sum(weights[self.out_offsets[node]:self.out_offsets[node + 1]]) for node in range(count)]
+
+        rank = [1.0 / count] * count
+        for _ in range(PAGERANK_MAX_ITERATIONS):
+            # Members without outgoing edges spread their rank evenly
+            dangling = sum(rank[node] for node in range(count) if not out_weight[node])
+            base = (1 - PAGERANK_DAMPING + PAGERANK_DAMPING * dangling) / count
+            new_rank = [base] * count
+            for node in range(count):
+                if out_weight[node]:
+                    share = PAGERANK_DAMPING * rank[node] / out_weight[node]
+                    for position in range(self.out_offsets[node], self.out_offsets[node + 1]):
+                        new_rank[self.out_targets[position]] += share * weights[position]
+            delta = sum(abs(new_rank[node] - rank[node]) for node in range(count))
+            rank = new_rank
+            if delta < PAGERANK_TOLERANCE:
+                break
+
+        self._pagerank = rank
+        return rank
+
+
+def _visit_edges(db: Session, pairs: Optional[List[Tuple[str, str]]] = None):
+    query = db.query(Visit.visitor_id, Visit.visited_id, func.count(Visit.id)).filter(
+        Visit.status != VisitStatus.CANCELADA
+    )
+    if pairs is not None:
+        query = query.filter(tuple_(Visit.visitor_id, Visit.visited_id).in_(pairs))
+    return query.group_by(Visit.visitor_id, Visit.visited_id)
+
+
+def _referral_edges(db: Session, pairs: Optional[List[Tuple[str, str]]] = None):
+    query = db.query(Referral.from_member_id, Referral.to_member_id, func.count(Referral.id)).filter(
+        Referral.status != ReferralStatus.CANCELLED
+    )
+    if pairs is not None:
+        query = query.filter(tuple_(Referral.from_member_id, Referral.to_member_id).in_(pairs))
+    return query.group_by(Referral.from_member_id, Referral.to_member_id)
+
+
+class GraphCache:
+    """Mutable edge counters and node attributes behind the current snapshot"""
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._companies: List[str] = []
+        self._categories: List[str] = []
+        self._active = bytearray()
+        self._edges: EdgeCounts = {}
+        self._graph: Optional[MemberGraph] = None
+        self._synced_at: Optional[datetime] = None
+        self._rebuilt_at: Optional[datetime] = None
+        self._lock = threading.RLock()
+
+    def _set_member(self, member_id: str, company_name: str, category, member_status) -> None:
+        node = self._index.get(member_id)
+        if node is None:
+            node = self._index[member_id] = len(self._ids)
+            self._ids.append(member_id)
+            self._companies.append(company_name)
+            self._categories.append(category.value)
+            self._active.append(member_status == MemberStatus.ACTIVE)
+            return
+        self._companies[node] = company_name
+        self._categories[node] = category.value
+        self._active[node] = member_status == MemberStatus.ACTIVE
+
+    def _set_edges(self, rows, kind: int) -> None:
+        for source, target, count in rows:
+            pair = (self._index[source], self._index[target])
+            counts = self._edges.setdefault(pair, [0, 0])
+            counts[kind] = count
+            if not any(counts):
+                del self._edges[pair]
+
+    def _members(self, db: Session, since: Optional[datetime] = None):
+        query = db.query(Member.id, Member.company_name, Member.business_category, Member.status)
+        if since is not None:
+            query = query.filter(Member.updated_at >= since)
+        return query.order_by(Member.created_at, Member.id)
+
+    def _snapshot(self) -> MemberGraph:
+        self._graph = MemberGraph(
+            list(self._ids), list(self._companies), list(self._categories), bytearray(self._active), self._edges
+        )
+        return self._graph
+
+    def rebuild(self, db: Session) -> MemberGraph:
+        """Reload the whole graph"""
+        now = datetime.utcnow()
+        with self._lock:
+            self._ids, self._index, self._companies, self._categories = [], {}, [], []
+            self._active, self._edges = bytearray(), {}
+            for row in self._members(db):
+                self._set_member(*row)
+            self._set_edges(_visit_edges(db), 0)
+            self._set_edges(_referral_edges(db), 1)
+            self._synced_at = self._rebuilt_at = now
+            return self._snapshot()
+
+    def get(self, db: Session) -> MemberGraph:
+        """Current graph, after applying the visits, referrals and members changed since the last sync"""
+        now = datetime.utcnow()
+        if self._graph is None or (now - self._rebuilt_at).total_seconds() >= settings.GRAPH_REBUILD_SECONDS:
+            return self.rebuild(db)
+
+        with self._lock:
+            since = self._synced_at
+            members = self._members(db, since).all()
+            visit_pairs = db.query(Visit.visitor_id, Visit.visited_id).filter(Visit.updated_at >= since).distinct().all()
+            referral_pairs = db.query(Referral.from_member_id, Referral.to_member_id).filter(Referral.updated_at >= since).distinct().all()
+            if not (members or visit_pairs or referral_pairs):
+                self._synced_at = now
+                return self._graph
+
+            for row in members:
+                self._set_member(*row)
+            if any(source not in self._index or target not in self._index for source, target in visit_pairs + referral_pairs):
+                # A member committed after the previous sync with an older updated_at
+                return self.rebuild(db)
+            if visit_pairs:
+                visit_pairs = [tuple(pair) for pair in visit_pairs]
+                # Pairs whose visits were all cancelled come back with no row
+                self._set_edges([(source, target, 0) for source, target in visit_pairs], 0)
+                self._set_edges(_visit_edges(db, visit_pairs), 0)
+            if referral_pairs:
+                referral_pairs = [tuple(pair) for pair in referral_pairs]
+                self._set_edges([(source, target, 0) for source, target in referral_pairs], 1)
+                self._set_edges(_referral_edges(db, referral_pairs), 1)
+            self._synced_at = now
+            return self._snapshot()
+
+
+graph_cache = GraphCache()
+
+
+# Queries
+
+def _member(graph: MemberGraph, node: int, **extra) -> Dict[str, Any]:
+    return {
+        "id": graph.ids[node],
+        "company_name": graph.companies[node],
+        "business_category": graph.categories[node],
+        **extra
+    }
+
+
+def _node_or_404(graph: MemberGraph, member_id: str) -> int:
+    node = graph.index.get(member_id)
+    if node is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Membro não encontrado"
+        )
+    return node
+
+
+def _active_nodes(graph: MemberGraph, exclude: Set[int]) -> Iterator[int]:
+    return (node for node in range(len(graph)) if graph.active[node] and node not in exclude)
+
+
+def get_stats(db: Session) -> Dict[str, Any]:
+    """Size of the graph"""
+    graph = graph_cache.get(db)
+    active = [node for node in range(len(graph)) if graph.active[node]]
+    isolated = sum(1 for node in active if not graph.out_degree(node) and not graph.in_degree(node))
+    possible = len(graph) * (len(graph) - 1)
+    return {
+        "members": len(graph),
+        "active_members": len(active),
+        "edges": graph.edge_count,
+        "visits": sum(graph.out_visits),
+        "referrals": sum(graph.out_referrals),
+        "isolated_members": isolated,
+        "density": graph.edge_count / possible if possible else 0.0,
+        "built_at": graph.built_at
+    }
+
+
+def get_never_met(db: Session, member_id: str, skip: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+    """Active members with no visit to or from the member"""
+    graph = graph_cache.get(db)
+    node = _node_or_404(graph, member_id)
+    met = graph.neighbours(node, visits_only=True) | {node}
+    nodes = islice(_active_nodes(graph, met), skip, skip + limit)
+    return [_member(graph, other) for other in nodes]
+
+
+def get_second_degree(db: Session, member_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+    """Active members two steps away (not direct contacts), by number of mutual contacts"""
+    graph = graph_cache.get(db)
+    node = _node_or_404(graph, member_id)
+    direct = graph.neighbours(node)
+    mutual: Dict[int, int] = {}
+    for contact in direct:
+        for other in graph.neighbours(contact):
+            if other != node and other not in direct and graph.active[other]:
+                mutual[other] = mutual.get(other, 0) + 1
+    ranked = sorted(mutual.items(), key=lambda item: (-item[1], graph.companies[item[0]]))[:limit]
+    return [_member(graph, other, mutual_connections=count) for other, count in ranked]
+
+
+def get_rankings(db: Session, metric: GraphMetric = GraphMetric.DEGREE, limit: int = 20) -> List[Dict[str, Any]]:
+    """Active members ranked by degree or PageRank centrality"""
+    graph = graph_cache.get(db)
+    ranks = graph.pagerank() if metric == GraphMetric.PAGERANK else None
+    score = {
+        GraphMetric.DEGREE: lambda node: len(graph.neighbours(node)),
+        GraphMetric.IN_DEGREE: graph.in_degree,
+        GraphMetric.OUT_DEGREE: graph.out_degree,
+        GraphMetric.PAGERANK: lambda node: ranks[node],
+    }[metric]
+
+    ranked = sorted(_active_nodes(graph, set()), key=lambda node: (-score(node), graph.companies[node]))[:limit]
+    return [
+        _member(
+            graph, node,
+            score=float(score(node)),
+            in_degree=graph.in_degree(node),
+            out_degree=graph.out_degree(node)
+        )
+        for node in ranked
+    ]
+
+
+def get_isolated(db: Session, skip: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+    """Active members without any visit or referral"""
+    graph = graph_cache.get(db)
+    isolated = (
+        node for node in _active_nodes(graph, set())
+        if not graph.out_degree(node) and not graph.in_degree(node)
+    )
+    return [_member(graph, node) for node in islice(isolated, skip, skip + limit)]
+
+
+def rebuild(db: Session) -> Dict[str, Any]:
+    """Reload the graph from the database"""
+    graph_cache.rebuild(db)
+    return get_stats(db)
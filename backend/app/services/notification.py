@@ -1,35 +1,199 @@
 """
 Notification Service
 """
+import hashlib
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from fastapi import HTTPException, status
 
-from app.models.notification import Notification, NotificationType, NotificationPriority
+from app.core.config import settings
+from app.models.notification import Notification, NotificationType, NotificationPriority, PendingDigestItem
 from app.models.user import User
+from app.services import outbox as outbox_service
+from app.services import delivery as delivery_service
 
 
-def create_notification(db: Session, notification_data: Dict[str, Any]) -> Notification:
-    """Create a new notification"""
+# Types merged into an existing unread notification when repeated within the coalescing window
+COALESCIBLE_TYPES = {
+    NotificationType.NEW_VIDEO,
+    NotificationType.MEETING_CONFIRMED,
+    NotificationType.MEETING_CANCELLED,
+    NotificationType.MEETING_REMINDER,
+}
+
+# Fields refreshed from the newest notification when merging
+MERGED_FIELDS = ["priority", "title", "message", "action_url", "action_label", "related_entity_id", "expires_at"]
+
+DIGEST_MAX_TITLES = 5
+
+
+def _is_coalescible(notification_data: Dict[str, Any]) -> bool:
+    return (
+        settings.NOTIFICATION_COALESCE_WINDOW_MINUTES > 0
+        and NotificationType(notification_data["type"]) in COALESCIBLE_TYPES
+    )
+
+
+def _is_digestible(notification_data: Dict[str, Any]) -> bool:
+    priority = notification_data.get("priority", NotificationPriority.NORMAL)
+    return (
+        settings.NOTIFICATION_DIGEST_ENABLED
+        and NotificationPriority(priority) == NotificationPriority.LOW
+        and NotificationType(notification_data["type"]) != NotificationType.DIGEST
+    )
+
+
+def _coalescible_query(db: Session, notification_type: NotificationType, related_entity_type: Optional[str]):
+    """Unread notifications of the same kind inside the coalescing window"""
+    window_start = datetime.utcnow() - timedelta(minutes=settings.NOTIFICATION_COALESCE_WINDOW_MINUTES)
+    return db.query(Notification).filter(
+        Notification.type == notification_type,
+        Notification.related_entity_type.is_not_distinct_from(related_entity_type),
+        Notification.is_read == False,
+        Notification.created_at >= window_start
+    )
+
+
+def _merge_notification(notification: Notification, notification_data: Dict[str, Any]) -> Notification:
+    """Merge a new notification into an existing row, keeping the newest content"""
+    notification.group_count = (notification.group_count or 1) + 1
+    for field in MERGED_FIELDS:
+        if field in notification_data:
+            setattr(notification, field, notification_data[field])
+    # Bump to the top of the inbox
+    notification.created_at = datetime.utcnow()
+    return notification
+
+
+def _stage_digest_item(db: Session, notification_data: Dict[str, Any]) -> PendingDigestItem:
+    item = PendingDigestItem(
+        user_id=notification_data["user_id"],
+        type=notification_data["type"],
+        title=notification_data["title"],
+        message=notification_data["message"],
+        action_url=notification_data.get("action_url"),
+        related_entity_type=notification_data.get("related_entity_type"),
+        related_entity_id=notification_data.get("related_entity_id")
+    )
+    db.add(item)
+    return item
+
+
+def add_notification(
+    db: Session,
+    notification_data: Dict[str, Any],
+    coalesce: bool = True
+) -> Optional[Notification]:
+    """
+    Add a notification to the session without committing.
+    With coalesce enabled, repeated notifications are merged into the user's unread row,
+    and LOW priority ones are staged for the daily digest (returns None) when digests are enabled.
+    Email/push deliveries are queued according to the user's preferences.
+    """
+    if coalesce and _is_digestible(notification_data):
+        _stage_digest_item(db, notification_data)
+        return None
+    
+    if coalesce and _is_coalescible(notification_data):
+        existing = _coalescible_query(
+            db,
+            NotificationType(notification_data["type"]),
+            notification_data.get("related_entity_type")
+        ).filter(
+            Notification.user_id == notification_data["user_id"]
+        ).order_by(Notification.created_at.desc()).with_for_update().first()
+        if existing:
+            notification = _merge_notification(existing, notification_data)
+            delivery_service.schedule_deliveries(db, [notification])
+            return notification
+    
     notification = Notification(**notification_data)
     db.add(notification)
+    delivery_service.schedule_deliveries(db, [notification])
+    return notification
+
+
+def create_notification(
+    db: Session,
+    notification_data: Dict[str, Any],
+    coalesce: bool = True
+) -> Optional[Notification]:
+    """Create a new notification"""
+    notification = add_notification(db, notification_data, coalesce)
     db.commit()
-    db.refresh(notification)
+    if notification:
+        db.refresh(notification)
     return notification
 
 
+def add_bulk_notifications(db: Session, notifications_data: List[Dict[str, Any]]) -> List[Notification]:
+    """
+    Add multiple notifications to the session without committing.
+    Coalescing runs set-based: one lookup per (type, related entity type) group.
+    """
+    created = []
+    merged = {}
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    
+    for data in notifications_data:
+        if _is_digestible(data):
+            _stage_digest_item(db, data)
+        elif _is_coalescible(data):
+            key = (NotificationType(data["type"]), data.get("related_entity_type"))
+            groups.setdefault(key, []).append(data)
+        else:
+            created.append(Notification(**data))
+    
+    for (notification_type, related_entity_type), group in groups.items():
+        user_ids = list({data["user_id"] for data in group})
+        existing = _coalescible_query(db, notification_type, related_entity_type).filter(
+            Notification.user_id.in_(user_ids)
+        ).order_by(
+            Notification.user_id,
+            Notification.created_at.desc()
+        ).distinct(Notification.user_id).all()
+        existing_by_user = {notification.user_id: notification for notification in existing}
+        
+        for data in group:
+            current = existing_by_user.get(data["user_id"])
+            if current:
+                _merge_notification(current, data)
+                merged[id(current)] = current
+            else:
+                current = Notification(**data)
+                created.append(current)
+                existing_by_user[data["user_id"]] = current
+    
+    db.add_all(created)
+    notifications = created + [n for n in merged.values() if n not in created]
+    delivery_service.schedule_deliveries(db, notifications)
+    return notifications
+
+
 def create_bulk_notifications(db: Session, notifications_data: List[Dict[str, Any]]) -> List[Notification]:
     """Create multiple notifications at once"""
-    notifications = [Notification(**data) for data in notifications_data]
-    db.add_all(notifications)
+    notifications = add_bulk_notifications(db, notifications_data)
     db.commit()
     for notification in notifications:
         db.refresh(notification)
     return notifications
 
 
+def queue_notification(db: Session, notification_data: Dict[str, Any]) -> None:
+    """
+    Queue a notification in the outbox without committing.
+    It is delivered by the outbox worker once the caller's transaction commits.
+    """
+    outbox_service.enqueue_event(db, outbox_service.EVENT_NOTIFICATION, notification_data)
+
+
+def queue_notifications(db: Session, notifications_data: List[Dict[str, Any]]) -> None:
+    """Queue several notifications in the outbox without committing"""
+    outbox_service.enqueue_events(db, outbox_service.EVENT_NOTIFICATION, notifications_data)
+
+
 def get_notification_by_id(db: Session, notification_id: str) -> Optional[Notification]:
     """Get notification by ID"""
     return db.query(Notification).filter(Notification.id == notification_id).first()
@@ -59,6 +223,27 @@ def get_user_notifications(
     return query.order_by(Notification.created_at.desc()).offset(offset).limit(limit).all()
 
 
+def get_notifications_etag(db: Session, user_id: str) -> str:
+    """
+    Weak ETag for the user's inbox.
+    Changes whenever a live notification is created, merged, read, deleted or expires.
+    """
+    total, last_created, last_updated = db.query(
+        func.count(Notification.id),
+        func.max(Notification.created_at),
+        func.max(Notification.updated_at)
+    ).filter(
+        Notification.user_id == user_id,
+        or_(
+            Notification.expires_at.is_(None),
+            Notification.expires_at > datetime.utcnow()
+        )
+    ).one()
+    
+    version = f"{user_id}:{total}:{last_created}:{last_updated}"
+    return f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+
+
 def mark_as_read(db: Session, notification_id: str) -> Notification:
     """Mark a notification as read"""
     notification = get_notification_by_id(db, notification_id)
@@ -89,6 +274,30 @@ def mark_all_as_read(db: Session, user_id: str) -> int:
     return count
 
 
+def mark_many_as_read(db: Session, user_id: str, notification_ids: List[str]) -> int:
+    """Mark a list of the user's notifications as read in a single UPDATE"""
+    count = db.query(Notification).filter(
+        Notification.id.in_(notification_ids),
+        Notification.user_id == user_id,
+        Notification.is_read == False
+    ).update({
+        "is_read": True,
+        "read_at": datetime.utcnow()
+    }, synchronize_session=False)
+    db.commit()
+    return count
+
+
+def delete_many(db: Session, user_id: str, notification_ids: List[str]) -> int:
+    """Delete a list of the user's notifications in a single DELETE"""
+    count = db.query(Notification).filter(
+        Notification.id.in_(notification_ids),
+        Notification.user_id == user_id
+    ).delete(synchronize_session=False)
+    db.commit()
+    return count
+
+
 def delete_notification(db: Session, notification_id: str) -> bool:
     """Delete a notification"""
     notification = get_notification_by_id(db, notification_id)
@@ -103,6 +312,23 @@ def delete_notification(db: Session, notification_id: str) -> bool:
     return True
 
 
+def sweep_expired_notifications(db: Session, batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Delete a batch of expired notifications.
+    Keeps expired rows out of the inbox indexes, so reads stay fast regardless of volume.
+    """
+    expired_ids = db.query(Notification.id).filter(
+        Notification.expires_at.isnot(None),
+        Notification.expires_at <= datetime.utcnow()
+    ).limit(batch_size).with_for_update(skip_locked=True).scalar_subquery()
+    
+    count = db.query(Notification).filter(
+        Notification.id.in_(expired_ids)
+    ).delete(synchronize_session=False)
+    db.commit()
+    return {"batch_size": batch_size, "processed": count}
+
+
 def delete_old_notifications(db: Session, days: int = 30) -> int:
     """Delete notifications older than X days"""
     cutoff_date = datetime.utcnow() - timedelta(days=days)
@@ -113,6 +339,60 @@ def delete_old_notifications(db: Session, days: int = 30) -> int:
     return count
 
 
+def build_digests(db: Session, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Fold staged LOW priority notifications into one DIGEST notification per user.
+    A user's digest is emitted once their oldest staged item is older than the digest interval.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=settings.NOTIFICATION_DIGEST_INTERVAL_HOURS)
+    due_users = db.query(PendingDigestItem.user_id).group_by(
+        PendingDigestItem.user_id
+    ).having(
+        func.min(PendingDigestItem.created_at) <= cutoff
+    ).limit(batch_size).all()
+    user_ids = [user_id for (user_id,) in due_users]
+    
+    result = {"batch_size": batch_size, "processed": len(user_ids), "items": 0}
+    if not user_ids:
+        return result
+    
+    items = db.query(PendingDigestItem).filter(
+        PendingDigestItem.user_id.in_(user_ids)
+    ).order_by(
+        PendingDigestItem.user_id,
+        PendingDigestItem.created_at.desc()
+    ).with_for_update(skip_locked=True).all()
+    
+    items_by_user: Dict[str, List[PendingDigestItem]] = {}
+    for item in items:
+        items_by_user.setdefault(item.user_id, []).append(item)
+    
+    digests = []
+    for user_id, user_items in items_by_user.items():
+        lines = [f"• {item.title}" for item in user_items[:DIGEST_MAX_TITLES]]
+        if len(user_items) > DIGEST_MAX_TITLES:
+            lines.append(f"... e mais {len(user_items) - DIGEST_MAX_TITLES}")
+        
+        digests.append(Notification(
+            user_id=user_id,
+            type=NotificationType.DIGEST,
+            priority=NotificationPriority.LOW,
+            title=f"📬 Resumo: {len(user_items)} novidades",
+            message="\n".join(lines),
+            group_count=len(user_items)
+        ))
+    
+    db.add_all(digests)
+    delivery_service.schedule_deliveries(db, digests)
+    db.query(PendingDigestItem).filter(
+        PendingDigestItem.id.in_([item.id for item in items])
+    ).delete(synchronize_session=False)
+    db.commit()
+    
+    result["items"] = len(items)
+    return result
+
+
 def get_notification_stats(db: Session, user_id: str) -> Dict[str, Any]:
     """Get notification statistics for a user"""
     total = db.query(Notification).filter(Notification.user_id == user_id).count()
@@ -143,9 +423,9 @@ def get_notification_stats(db: Session, user_id: str) -> Dict[str, Any]:
 
 # Helper functions to create specific notification types
 
-def notify_member_approved(db: Session, user_id: str, member_name: str) -> Notification:
-    """Create notification for member approval"""
-    return create_notification(db, {
+def member_approved_data(user_id: str, member_name: str) -> Dict[str, Any]:
+    """Build notification data for member approval"""
+    return {
         "user_id": user_id,
         "type": NotificationType.MEMBER_APPROVED,
         "priority": NotificationPriority.HIGH,
@@ -153,7 +433,12 @@ def notify_member_approved(db: Session, user_id: str, member_name: str) -> Notif
         "message": f"Parabéns {member_name}! Seu cadastro foi aprovado. Agora você é um membro oficial do Grupo Union!",
         "action_url": "/dashboard",
         "action_label": "Ir para Dashboard"
-    })
+    }
+
+
+def notify_member_approved(db: Session, user_id: str, member_name: str) -> Notification:
+    """Create notification for member approval"""
+    return create_notification(db, member_approved_data(user_id, member_name))
 
 
 def notify_member_rejected(db: Session, user_id: str, member_name: str, reason: Optional[str] = None) -> Notification:
@@ -171,22 +456,21 @@ def notify_member_rejected(db: Session, user_id: str, member_name: str, reason:
     })
 
 
-def notify_meeting_confirmed(
-    db: Session,
+def meeting_confirmed_data(
     user_id: str,
     meeting_id: str,
     meeting_date: str,
     meeting_link: Optional[str] = None,
     location: Optional[str] = None
-) -> Notification:
-    """Create notification for meeting confirmation"""
+) -> Dict[str, Any]:
+    """Build notification data for meeting confirmation"""
     message = f"Sua reunião foi confirmada para {meeting_date}."
     if meeting_link:
         message += f" Link: {meeting_link}"
     elif location:
         message += f" Local: {location}"
     
-    return create_notification(db, {
+    return {
         "user_id": user_id,
         "type": NotificationType.MEETING_CONFIRMED,
         "priority": NotificationPriority.HIGH,
@@ -196,7 +480,98 @@ def notify_meeting_confirmed(
         "action_label": "Ver Reunião",
         "related_entity_type": "meeting",
         "related_entity_id": meeting_id
-    })
+    }
+
+
+def notify_meeting_confirmed(
+    db: Session,
+    user_id: str,
+    meeting_id: str,
+    meeting_date: str,
+    meeting_link: Optional[str] = None,
+    location: Optional[str] = None
+) -> Notification:
+    """Create notification for meeting confirmation"""
+    return create_notification(db, meeting_confirmed_data(
+        user_id, meeting_id, meeting_date, meeting_link, location
+    ))
+
+
+def meeting_reminder_data(
+    user_id: str,
+    meeting_id: str,
+    meeting_date: str,
+    meeting_link: Optional[str] = None,
+    location: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build notification data for a 1:1 meeting reminder"""
+    message = f"Lembrete: sua reunião com o Hub é em {meeting_date}."
+    if meeting_link:
+        message += f" Link: {meeting_link}"
+    elif location:
+        message += f" Local: {location}"
+    
+    return {
+        "user_id": user_id,
+        "type": NotificationType.MEETING_REMINDER,
+        "priority": NotificationPriority.HIGH,
+        "title": "⏰ Lembrete de Reunião",
+        "message": message,
+        "action_url": "/meetings/schedule",
+        "action_label": "Ver Reunião",
+        "related_entity_type": "meeting",
+        "related_entity_id": meeting_id
+    }
+
+
+def collective_meeting_reminder_data(
+    user_id: str,
+    meeting_id: str,
+    title: str,
+    meeting_date: str,
+    location: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build notification data for a collective meeting reminder"""
+    message = f"Lembrete: \"{title}\" acontece em {meeting_date}."
+    if location:
+        message += f" Local: {location}"
+    
+    return {
+        "user_id": user_id,
+        "type": NotificationType.MEETING_REMINDER,
+        "priority": NotificationPriority.NORMAL,
+        "title": "⏰ Lembrete de Reunião Coletiva",
+        "message": message,
+        "action_url": "/dashboard",
+        "action_label": "Ver Reunião",
+        "related_entity_type": "collective_meeting",
+        "related_entity_id": meeting_id
+    }
+
+
+def visit_follow_up_data(
+    user_id: str,
+    visit_id: str,
+    company_name: str,
+    follow_up_date: str,
+    follow_up_needed: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build notification data for a visit follow-up reminder"""
+    message = f"Follow-up da sua visita a {company_name} previsto para {follow_up_date}."
+    if follow_up_needed:
+        message += f" Ações: {follow_up_needed}"
+    
+    return {
+        "user_id": user_id,
+        "type": NotificationType.VISIT_FOLLOW_UP,
+        "priority": NotificationPriority.NORMAL,
+        "title": "🔁 Follow-up de Visita",
+        "message": message,
+        "action_url": "/visits",
+        "action_label": "Ver Visita",
+        "related_entity_type": "visit",
+        "related_entity_id": visit_id
+    }
 
 
 def notify_meeting_cancelled(
@@ -251,17 +626,48 @@ def notify_referral_approved(db: Session, user_id: str, referred_name: str) -> N
     })
 
 
-def notify_payment_confirmed(db: Session, user_id: str, amount: float) -> Notification:
-    """Create notification for payment confirmation"""
-    return create_notification(db, {
+def payment_confirmed_data(user_id: str, amount: float, payment_id: Optional[str] = None) -> Dict[str, Any]:
+    """Build notification data for payment confirmation"""
+    return {
         "user_id": user_id,
         "type": NotificationType.PAYMENT_CONFIRMED,
         "priority": NotificationPriority.HIGH,
         "title": "💰 Pagamento Confirmado",
         "message": f"Seu pagamento de R$ {amount:.2f} foi confirmado!",
         "action_url": "/dashboard",
-        "action_label": "Ver Dashboard"
-    })
+        "action_label": "Ver Dashboard",
+        "related_entity_type": "payment",
+        "related_entity_id": payment_id
+    }
+
+
+def notify_payment_confirmed(db: Session, user_id: str, amount: float) -> Notification:
+    """Create notification for payment confirmation"""
+    return create_notification(db, payment_confirmed_data(user_id, amount))
+
+
+def payment_rejected_data(
+    user_id: str,
+    amount: float,
+    payment_id: Optional[str] = None,
+    reason: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build notification data for payment rejection"""
+    message = f"Seu comprovante de pagamento de R$ {amount:.2f} não foi aceito."
+    if reason:
+        message += f" Motivo: {reason}"
+    
+    return {
+        "user_id": user_id,
+        "type": NotificationType.PAYMENT_REJECTED,
+        "priority": NotificationPriority.HIGH,
+        "title": "⚠️ Pagamento Não Confirmado",
+        "message": message,
+        "action_url": "/onboarding/payment",
+        "action_label": "Enviar Novo Comprovante",
+        "related_entity_type": "payment",
+        "related_entity_id": payment_id
+    }
 
 
 def notify_system_announcement(db: Session, user_ids: List[str], title: str, message: str) -> List[Notification]:
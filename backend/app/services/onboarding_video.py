@@ -4,7 +4,8 @@ Onboarding Video Service
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.models.onboarding_video import OnboardingVideo
@@ -122,7 +123,12 @@ def mark_video_started(db: Session, user_id: str, video_id: str) -> VideoProgres
     )
     
     db.add(progress)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Started at the same time by another request
+        db.rollback()
+        return get_user_progress(db, user_id, video_id)
     db.refresh(progress)
     return progress
 
@@ -140,50 +146,62 @@ def mark_video_completed(db: Session, user_id: str, video_id: str) -> VideoProgr
             completed_at=datetime.utcnow()
         )
         db.add(progress)
-    else:
-        # Update existing progress
-        progress.completed = True
-        progress.completed_at = datetime.utcnow()
+        try:
+            db.commit()
+        except IntegrityError:
+            # Created meanwhile by another request: complete that one
+            db.rollback()
+            progress = get_user_progress(db, user_id, video_id)
+        else:
+            db.refresh(progress)
+            return progress
+    
+    # Update existing progress
+    progress.completed = True
+    progress.completed_at = datetime.utcnow()
     
     db.commit()
     db.refresh(progress)
     return progress
 
 
+# Payload fields of OnboardingVideoWithProgress and of its user_progress
+VIDEO_COLUMNS = [
+    OnboardingVideo.id, OnboardingVideo.title, OnboardingVideo.description, OnboardingVideo.video_url,
+    OnboardingVideo.provider, OnboardingVideo.thumbnail_url, OnboardingVideo.duration_minutes,
+    OnboardingVideo.order, OnboardingVideo.is_active, OnboardingVideo.created_at, OnboardingVideo.updated_at
+]
+PROGRESS_COLUMNS = [
+    VideoProgress.id, VideoProgress.user_id, VideoProgress.video_id, VideoProgress.completed,
+    VideoProgress.completed_at, VideoProgress.started_at, VideoProgress.updated_at
+]
+
+
 def get_videos_with_progress(db: Session, user_id: str) -> List[Dict[str, Any]]:
-    """Get all videos with user progress"""
-    videos = get_all_videos(db, include_inactive=False)
+    """
+    Get all active videos with the user's progress (None when never started).
+    One query: the progress is LEFT JOINed for this user only (unique per user and video).
+    """
+    statement = select(
+        *VIDEO_COLUMNS,
+        *[column.label(f"progress_{column.key}") for column in PROGRESS_COLUMNS]
+    ).outerjoin(
+        VideoProgress,
+        and_(
+            VideoProgress.video_id == OnboardingVideo.id,
+            VideoProgress.user_id == user_id
+        )
+    ).where(
+        OnboardingVideo.is_active == True
+    ).order_by(OnboardingVideo.order)
+
     result = []
-    
-    for video in videos:
-        progress = get_user_progress(db, user_id, video.id)
-        
-        video_dict = {
-            "id": video.id,
-            "title": video.title,
-            "description": video.description,
-            "video_url": video.video_url,
-            "provider": video.provider.value,
-            "thumbnail_url": video.thumbnail_url,
-            "duration_minutes": video.duration_minutes,
-            "order": video.order,
-            "is_active": video.is_active,
-            "created_at": video.created_at,
-            "updated_at": video.updated_at,
-            "user_progress": None
-        }
-        
-        if progress:
-            video_dict["user_progress"] = {
-                "id": progress.id,
-                "user_id": progress.user_id,
-                "video_id": progress.video_id,
-                "completed": progress.completed,
-                "completed_at": progress.completed_at,
-                "started_at": progress.started_at,
-                "updated_at": progress.updated_at
-            }
-        
+    for row in db.execute(statement).mappings():
+        video_dict = {column.key: row[column.key] for column in VIDEO_COLUMNS}
+        video_dict["provider"] = row["provider"].value
+        video_dict["user_progress"] = {
+            column.key: row[f"progress_{column.key}"] for column in PROGRESS_COLUMNS
+        } if row["progress_id"] else None
         result.append(video_dict)
     
     return result
@@ -0,0 +1,153 @@
+"""
+Outbox Service - Transactional outbox for side effects
+"""
+from typing import Callable, Dict, Any, List
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.models.outbox import OutboxEvent, OutboxStatus
+
+
+# Event types
+EVENT_NOTIFICATION = "notification.create"
+
+
+def enqueue_event(db: Session, event_type: str, payload: Dict[str, Any]) -> OutboxEvent:
+    """
+    Add an event to the outbox without committing.
+    The event is persisted by the caller's commit, together with the business change.
+    """
+    event = OutboxEvent(
+        event_type=event_type,
+        payload=jsonable_encoder(payload),
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        available_at=datetime.utcnow()
+    )
+    db.add(event)
+    return event
+
+
+def enqueue_events(db: Session, event_type: str, payloads: List[Dict[str, Any]]) -> List[OutboxEvent]:
+    """Add several events of the same type to the outbox without committing"""
+    now = datetime.utcnow()
+    events = [
+        OutboxEvent(
+            event_type=event_type,
+            payload=jsonable_encoder(payload),
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            available_at=now
+        )
+        for payload in payloads
+    ]
+    db.add_all(events)
+    return events
+
+
+def _handle_notification(db: Session, payload: Dict[str, Any]) -> None:
+    from app.services import notification as notification_service
+    notification_service.add_notification(db, payload)
+
+
+HANDLERS: Dict[str, Callable[[Session, Dict[str, Any]], None]] = {
+    EVENT_NOTIFICATION: _handle_notification,
+}
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for failed events"""
+    return timedelta(seconds=settings.OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+
+def process_batch(db: Session, batch_size: int = 100) -> Dict[str, int]:
+    """
+    Claim and process a batch of pending events.
+    Rows are locked with SKIP LOCKED, so several workers can drain the outbox concurrently.
+    Each event runs in a savepoint: a failing handler does not undo the rest of the batch.
+    """
+    now = datetime.utcnow()
+    events = db.query(OutboxEvent).filter(
+        OutboxEvent.status == OutboxStatus.PENDING,
+        OutboxEvent.available_at <= now
+    ).order_by(
+        OutboxEvent.available_at
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    result = {"batch_size": batch_size, "processed": 0, "succeeded": 0, "retried": 0, "dead": 0}
+
+    for event in events:
+        result["processed"] += 1
+        handler = HANDLERS.get(event.event_type)
+        try:
+            if handler is None:
+                raise ValueError(f"Tipo de evento desconhecido: {event.event_type}")
+            with db.begin_nested():
+                handler(db, event.payload)
+        except Exception as e:
+            event.attempts += 1
+            event.last_error = str(e)
+            if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS or handler is None:
+                event.status = OutboxStatus.DEAD
+                event.processed_at = now
+                result["dead"] += 1
+            else:
+                event.available_at = now + _retry_delay(event.attempts)
+                result["retried"] += 1
+            continue
+
+        event.attempts += 1
+        event.status = OutboxStatus.DONE
+        event.processed_at = now
+        result["succeeded"] += 1
+
+    db.commit()
+    return result
+
+
+def retry_dead_events(db: Session) -> int:
+    """Move dead events back to the pending queue"""
+    count = db.query(OutboxEvent).filter(
+        OutboxEvent.status == OutboxStatus.DEAD
+    ).update({
+        "status": OutboxStatus.PENDING,
+        "attempts": 0,
+        "available_at": datetime.utcnow(),
+        "processed_at": None
+    })
+    db.commit()
+    return count
+
+
+def delete_processed_events(db: Session, days: int = 7) -> int:
+    """Delete successfully processed events older than X days"""
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    count = db.query(OutboxEvent).filter(
+        OutboxEvent.status == OutboxStatus.DONE,
+        OutboxEvent.processed_at < cutoff_date
+    ).delete()
+    db.commit()
+    return count
+
+
+def get_outbox_stats(db: Session) -> Dict[str, Any]:
+    """Get outbox statistics"""
+    by_status = db.query(
+        OutboxEvent.status,
+        func.count(OutboxEvent.id)
+    ).group_by(OutboxEvent.status).all()
+    counts = {status_.value: count for status_, count in by_status}
+
+    oldest_pending = db.query(func.min(OutboxEvent.created_at)).filter(
+        OutboxEvent.status == OutboxStatus.PENDING
+    ).scalar()
+
+    return {
+        "pending_events": counts.get(OutboxStatus.PENDING.value, 0),
+        "done_events": counts.get(OutboxStatus.DONE.value, 0),
+        "dead_events": counts.get(OutboxStatus.DEAD.value, 0),
+        "oldest_pending_at": oldest_pending
+    }
@@ -10,6 +10,7 @@ from app.models.user import User, UserRole, UserStatus
 from app.models.member import Member, MemberStatus
 from app.models.payment import Payment, PaymentStatus, PaymentType
 from app.schemas.payment import ApplicationSubmit, PaymentProofUpload, PaymentVerify
+from app.services import notification as notification_service
 
 
 # PIX Configuration
@@ -158,6 +159,10 @@ def verify_payment(db: Session, payment_id: str, verify_data: PaymentVerify, ver
             member.status = MemberStatus.APPROVED
             member.approved_at = datetime.utcnow()
             member.approved_by = verifier_id
+        
+        notification_service.queue_notification(db, notification_service.payment_confirmed_data(
+            payment.user_id, payment.amount, payment.id
+        ))
     else:
         # Reject payment
         payment.status = PaymentStatus.REJECTED
@@ -169,6 +174,10 @@ def verify_payment(db: Session, payment_id: str, verify_data: PaymentVerify, ver
         member = db.query(Member).filter(Member.user_id == payment.user_id).first()
         if member:
             member.status = MemberStatus.PAYMENT_PENDING
+        
+        notification_service.queue_notification(db, notification_service.payment_rejected_data(
+            payment.user_id, payment.amount, payment.id, verify_data.rejection_reason
+        ))
     
     db.commit()
     db.refresh(payment)
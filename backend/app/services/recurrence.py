@@ -0,0 +1,116 @@
+"""
+Recurrence Service - Expands collective meeting series into occurrences
+
+Expansion happens on read; only occurrences inside the materialization window
+become CollectiveMeeting rows (see meeting_series.materialize_series).
+Rules are evaluated on local wall-clock times (APP_TIMEZONE), like scheduled dates.
+"""
+import calendar
+from typing import Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import or_
+
+from app.core.timezone import to_local
+from app.models.collective_meeting import CollectiveMeetingSeries, SeriesFrequency, WEEKDAYS
+
+
+def parse_weekdays(by_weekday: Optional[str]) -> List[int]:
+    """Parse "MO,TH" into weekday numbers (Monday = 0)"""
+    if not by_weekday:
+        return []
+    return sorted({WEEKDAYS.index(day.strip().upper()) for day in by_weekday.split(",") if day.strip()})
+
+
+def _add_months(value: datetime, months: int) -> Optional[datetime]:
+    """Same day and time N months later (None when that month is too short)"""
+    year, month = divmod(value.month - 1 + months, 12)
+    year += value.year
+    if value.day > calendar.monthrange(year, month + 1)[1]:
+        return None
+    return value.replace(year=year, month=month + 1)
+
+
+def _iter_rule(series: CollectiveMeetingSeries, skip_to: Optional[datetime] = None) -> Iterator[datetime]:
+    """Endless iterator over the rule's slots, optionally jumping close to skip_to"""
+    dtstart = series.starts_at
+    interval = max(series.interval or 1, 1)
+    period = 0
+
+    if series.frequency == SeriesFrequency.DAILY:
+        if skip_to and skip_to > dtstart:
+            period = (skip_to - dtstart).days // interval
+        while True:
+            yield dtstart + timedelta(days=period * interval)
+            period += 1
+
+    elif series.frequency == SeriesFrequency.WEEKLY:
+        weekdays = parse_weekdays(series.by_weekday) or [dtstart.weekday()]
+        week_start = dtstart - timedelta(days=dtstart.weekday())
+        if skip_to and skip_to > dtstart:
+            period = max((skip_to - week_start).days // (7 * interval) - 1, 0)
+        while True:
+            for weekday in weekdays:
+                occurrence = week_start + timedelta(weeks=period * interval, days=weekday)
+                if occurrence >= dtstart:
+                    yield occurrence
+            period += 1
+
+    else:
+        if skip_to and skip_to > dtstart:
+            months = (skip_to.year - dtstart.year) * 12 + skip_to.month - dtstart.month
+            period = max(months // interval - 1, 0)
+        while True:
+            occurrence = _add_months(dtstart, period * interval)
+            if occurrence:
+                yield occurrence
+            period += 1
+
+
+def expand_occurrences(series: CollectiveMeetingSeries, start: datetime, end: datetime) -> Iterator[datetime]:
+    """Occurrence starts of a series in [start, end)"""
+    # COUNT is relative to DTSTART, so those rules are walked from the beginning
+    slots = _iter_rule(series, skip_to=start if series.count is None else None)
+    for position, occurrence in enumerate(slots, start=1):
+        if occurrence >= end or (series.until and occurrence > series.until):
+            return
+        if series.count is not None and position > series.count:
+            return
+        if occurrence >= start:
+            yield occurrence
+
+
+def has_occurrences_from(series: CollectiveMeetingSeries, start: datetime) -> bool:
+    """False once the rule has nothing left at or after start (COUNT used up or UNTIL passed)"""
+    if series.count is None and series.until is None:
+        return True
+    return next(expand_occurrences(series, start, datetime.max), None) is not None
+
+
+def pending_window_start(series: CollectiveMeetingSeries) -> datetime:
+    """Occurrences from this instant on are not materialized yet"""
+    if series.materialized_until:
+        return series.materialized_until
+    # created_at is UTC; occurrences are local times
+    return to_local(series.created_at or datetime.utcnow())
+
+
+def get_unmaterialized_occurrences(
+    db: Session,
+    start: datetime,
+    end: datetime
+) -> List[Tuple[CollectiveMeetingSeries, datetime]]:
+    """Occurrences of active series in [start, end) that do not exist as meetings yet"""
+    series_list = db.query(CollectiveMeetingSeries).filter(
+        CollectiveMeetingSeries.is_active == True,
+        CollectiveMeetingSeries.starts_at < end,
+        or_(CollectiveMeetingSeries.until.is_(None), CollectiveMeetingSeries.until >= start)
+    ).all()
+
+    occurrences = []
+    for series in series_list:
+        lower = max(start, pending_window_start(series))
+        occurrences += [(series, occurrence) for occurrence in expand_occurrences(series, lower, end)]
+
+    occurrences.sort(key=lambda item: item[1])
+    return occurrences
@@ -0,0 +1,225 @@
+"""
+Scheduler Service - Due-time reminders for meetings, collective meetings and visit follow-ups
+
+Services call the schedule_* helpers (without committing) whenever an event is created,
+moved or cancelled; each call replaces the entity's pending jobs. The scheduler worker
+claims due jobs in batches with SKIP LOCKED and checks the entity again before notifying,
+so a job that became obsolete is simply dropped.
+
+Event dates are local wall-clock times (APP_TIMEZONE); run_at is UTC, like the
+worker's clock and the retry backoff, so events are converted before queueing.
+"""
+from typing import Callable, Dict, List, Optional, Union
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.core.timezone import local_now, to_utc
+from app.models.scheduled_job import ScheduledJob, ScheduledJobStatus
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.collective_meeting import CollectiveMeeting, CollectiveMeetingStatus, meeting_attendees
+from app.models.visit import Visit, VisitStatus
+from app.models.member import Member
+from app.models.user import User
+from app.services import notification as notification_service
+
+
+# Job types
+JOB_MEETING_REMINDER = "meeting.reminder"
+JOB_COLLECTIVE_MEETING_REMINDER = "collective_meeting.reminder"
+JOB_VISIT_FOLLOW_UP = "visit.follow_up"
+
+EntityFilter = Union[List[str], Select]
+
+DATE_FORMAT = "%d/%m/%Y às %H:%M"
+
+
+def parse_offsets(value: str) -> List[int]:
+    """Parse "1440,60" into minute offsets"""
+    return sorted({int(offset) for offset in value.split(",") if offset.strip()}, reverse=True)
+
+
+# Queue management
+
+def cancel_jobs(db: Session, job_type: str, entity_filter: EntityFilter) -> None:
+    """Drop the pending jobs of the entities (list of IDs or a select of IDs), without committing"""
+    db.query(ScheduledJob).filter(
+        ScheduledJob.job_type == job_type,
+        ScheduledJob.entity_id.in_(entity_filter),
+        ScheduledJob.status == ScheduledJobStatus.PENDING
+    ).delete(synchronize_session=False)
+
+
+def schedule_many(db: Session, job_type: str, events: Dict[str, Optional[datetime]], offsets: List[int]) -> None:
+    """
+    Replace the entities' pending jobs with one per offset before each event (local
+    time, None: no event), without committing
+    """
+    cancel_jobs(db, job_type, list(events))
+
+    now = datetime.utcnow()
+    db.add_all([
+        ScheduledJob(job_type=job_type, entity_id=entity_id, run_at=run_at, status=ScheduledJobStatus.PENDING, attempts=0)
+        for entity_id, event_at in events.items() if event_at is not None
+        for run_at in (to_utc(event_at) - timedelta(minutes=offset) for offset in offsets) if run_at > now
+    ])
+
+
+def schedule_jobs(db: Session, job_type: str, entity_id: str, event_at: Optional[datetime], offsets: List[int]) -> None:
+    """Replace the entity's pending jobs with one per offset before event_at, without committing"""
+    schedule_many(db, job_type, {entity_id: event_at}, offsets)
+
+
+def schedule_meeting_reminders(db: Session, meeting: Meeting) -> None:
+    """Reminders for a 1:1 meeting while it is confirmed"""
+    event_at = meeting.scheduled_date if meeting.status == MeetingStatus.CONFIRMED else None
+    schedule_jobs(
+        db, JOB_MEETING_REMINDER, meeting.id, event_at,
+        parse_offsets(settings.REMINDER_MEETING_OFFSETS_MINUTES)
+    )
+
+
+def schedule_confirmed_meetings(db: Session, scheduled_dates: Dict[str, datetime]) -> None:
+    """Reminders for several 1:1 meetings that were just confirmed (meeting ID -> date)"""
+    schedule_many(
+        db, JOB_MEETING_REMINDER, scheduled_dates,
+        parse_offsets(settings.REMINDER_MEETING_OFFSETS_MINUTES)
+    )
+
+
+def schedule_collective_meeting_reminders(db: Session, meeting: CollectiveMeeting) -> None:
+    """Reminders for a collective meeting while it is upcoming"""
+    upcoming = meeting.status in [CollectiveMeetingStatus.AGENDADA, CollectiveMeetingStatus.CONFIRMADA]
+    schedule_jobs(
+        db, JOB_COLLECTIVE_MEETING_REMINDER, meeting.id, meeting.scheduled_date if upcoming else None,
+        parse_offsets(settings.REMINDER_COLLECTIVE_OFFSETS_MINUTES)
+    )
+
+
+def schedule_visit_follow_up(db: Session, visit: Visit) -> None:
+    """Follow-up reminder for the visitor, when the visit has a follow-up date"""
+    event_at = visit.follow_up_date if visit.status != VisitStatus.CANCELADA and not visit.follow_up_completed_at else None
+    schedule_jobs(
+        db, JOB_VISIT_FOLLOW_UP, visit.id, event_at,
+        parse_offsets(settings.REMINDER_FOLLOW_UP_OFFSETS_MINUTES)
+    )
+
+
+# Handlers (run at due time; obsolete jobs notify nobody)
+
+def _run_meeting_reminder(db: Session, job: ScheduledJob) -> None:
+    row = db.query(Meeting, Member.user_id).join(
+        Member, Member.id == Meeting.member_id
+    ).filter(Meeting.id == job.entity_id).first()
+    if not row:
+        return
+    meeting, user_id = row
+    if meeting.status != MeetingStatus.CONFIRMED or meeting.scheduled_date <= local_now():
+        return
+
+    notification_service.add_notification(db, notification_service.meeting_reminder_data(
+        user_id,
+        meeting.id,
+        meeting.scheduled_date.strftime(DATE_FORMAT),
+        meeting.meeting_link,
+        meeting.location
+    ))
+
+
+def _run_collective_meeting_reminder(db: Session, job: ScheduledJob) -> None:
+    meeting = db.query(CollectiveMeeting).filter(CollectiveMeeting.id == job.entity_id).first()
+    if not meeting or meeting.scheduled_date <= local_now():
+        return
+    if meeting.status not in [CollectiveMeetingStatus.AGENDADA, CollectiveMeetingStatus.CONFIRMADA]:
+        return
+
+    user_ids = db.query(Member.user_id).join(
+        meeting_attendees, meeting_attendees.c.member_id == Member.id
+    ).join(
+        User, Member.user_id == User.id
+    ).filter(
+        meeting_attendees.c.meeting_id == meeting.id,
+        User.status == "ACTIVE"
+    )
+    meeting_date = meeting.scheduled_date.strftime(DATE_FORMAT)
+    notification_service.add_bulk_notifications(db, [
+        notification_service.collective_meeting_reminder_data(
+            user_id, meeting.id, meeting.title, meeting_date, meeting.location or meeting.meeting_link
+        )
+        for (user_id,) in user_ids
+    ])
+
+
+def _run_visit_follow_up(db: Session, job: ScheduledJob) -> None:
+    row = db.query(Visit, Member.user_id).join(
+        Member, Member.id == Visit.visitor_id
+    ).filter(Visit.id == job.entity_id).first()
+    if not row:
+        return
+    visit, user_id = row
+    if visit.status == VisitStatus.CANCELADA or not visit.follow_up_date or visit.follow_up_completed_at:
+        return
+
+    visited_company = db.query(Member.company_name).filter(Member.id == visit.visited_id).scalar()
+    notification_service.add_notification(db, notification_service.visit_follow_up_data(
+        user_id,
+        visit.id,
+        visited_company,
+        visit.follow_up_date.strftime("%d/%m/%Y"),
+        visit.follow_up_needed
+    ))
+
+
+HANDLERS: Dict[str, Callable[[Session, ScheduledJob], None]] = {
+    JOB_MEETING_REMINDER: _run_meeting_reminder,
+    JOB_COLLECTIVE_MEETING_REMINDER: _run_collective_meeting_reminder,
+    JOB_VISIT_FOLLOW_UP: _run_visit_follow_up,
+}
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for failed jobs"""
+    return timedelta(seconds=settings.SCHEDULER_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+
+
+def run_due_jobs(db: Session, batch_size: int = 100) -> Dict[str, int]:
+    """
+    Claim and run a batch of due jobs (worker task).
+    Only the pending run_at index is scanned, and rows are locked with SKIP LOCKED,
+    so several workers can share the queue. Each job runs in a savepoint.
+    """
+    now = datetime.utcnow()
+    jobs = db.query(ScheduledJob).filter(
+        ScheduledJob.status == ScheduledJobStatus.PENDING,
+        ScheduledJob.run_at <= now
+    ).order_by(
+        ScheduledJob.run_at
+    ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    result = {"batch_size": batch_size, "processed": 0, "succeeded": 0, "retried": 0, "dead": 0}
+
+    for job in jobs:
+        result["processed"] += 1
+        handler = HANDLERS.get(job.job_type)
+        try:
+            if handler is None:
+                raise ValueError(f"Tipo de tarefa desconhecido: {job.job_type}")
+            with db.begin_nested():
+                handler(db, job)
+        except Exception as e:
+            job.attempts += 1
+            job.last_error = str(e)
+            if job.attempts >= settings.SCHEDULER_MAX_ATTEMPTS or handler is None:
+                job.status = ScheduledJobStatus.DEAD
+                result["dead"] += 1
+            else:
+                job.run_at = now + _retry_delay(job.attempts)
+                result["retried"] += 1
+            continue
+
+        db.delete(job)
+        result["succeeded"] += 1
+
+    db.commit()
+    return result
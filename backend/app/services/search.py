@@ -0,0 +1,125 @@
+"""
+Search Service - Ranked full-text search over members, visits and collective meetings
+
+Each table has a generated Portuguese tsvector (accents stripped) with a GIN index.
+The sources are ranked together with UNION ALL; headlines are only computed for the
+rows of the requested page, on the unaccented text, and then mapped back to the
+original characters.
+"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, union_all, literal, func, or_, null, cast
+
+from app.core.search import SEARCH_CONFIG, UNACCENT_FUNCTION, HIGHLIGHT_START, HIGHLIGHT_STOP, restore_accents
+from app.models.member import Member, MemberStatus
+from app.models.visit import Visit, VisitStatus
+from app.models.collective_meeting import CollectiveMeeting
+from app.schemas.search import SearchResultType
+
+
+HEADLINE_OPTIONS = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxWords=30, MinWords=10"
+
+
+def _document(*columns):
+    """Searchable text of a row, for headlines"""
+    return func.concat_ws(" ", *columns)
+
+
+def _members(query, public_only: bool):
+    statement = select(
+        literal(SearchResultType.MEMBER.value).label("type"),
+        Member.id.label("id"),
+        Member.company_name.label("title"),
+        cast(null(), Member.created_at.type).label("date"),
+        func.ts_rank_cd(Member.search_vector, query).label("rank"),
+        _document(Member.company_name, Member.city, Member.company_description, Member.skills, Member.interests, Member.bio).label("document")
+    ).where(Member.search_vector.op("@@")(query))
+    if public_only:
+        statement = statement.where(Member.status == MemberStatus.ACTIVE)
+    return statement
+
+
+def _visits(query, member_id: Optional[str]):
+    visitor = aliased(Member)
+    visited = aliased(Member)
+    statement = select(
+        literal(SearchResultType.VISIT.value).label("type"),
+        Visit.id.label("id"),
+        func.concat(visitor.company_name, " → ", visited.company_name).label("title"),
+        Visit.visit_date.label("date"),
+        func.ts_rank_cd(Visit.search_vector, query).label("rank"),
+        _document(Visit.services_learned, Visit.potential_referrals, Visit.visit_summary, Visit.follow_up_needed, Visit.visitor_notes).label("document")
+    ).join(
+        visitor, visitor.id == Visit.visitor_id
+    ).join(
+        visited, visited.id == Visit.visited_id
+    ).where(
+        Visit.search_vector.op("@@")(query),
+        Visit.status != VisitStatus.CANCELADA
+    )
+    if member_id:
+        statement = statement.where(or_(Visit.visitor_id == member_id, Visit.visited_id == member_id))
+    return statement
+
+
+def _collective_meetings(query):
+    return select(
+        literal(SearchResultType.COLLECTIVE_MEETING.value).label("type"),
+        CollectiveMeeting.id.label("id"),
+        CollectiveMeeting.title.label("title"),
+        CollectiveMeeting.scheduled_date.label("date"),
+        func.ts_rank_cd(CollectiveMeeting.search_vector, query).label("rank"),
+        _document(CollectiveMeeting.title, CollectiveMeeting.description, CollectiveMeeting.agenda, CollectiveMeeting.notes).label("document")
+    ).where(CollectiveMeeting.search_vector.op("@@")(query))
+
+
+def search(
+    db: Session,
+    text: str,
+    types: Optional[List[SearchResultType]] = None,
+    member_id: Optional[str] = None,
+    full_access: bool = False,
+    skip: int = 0,
+    limit: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Ranked results for a web-style query ("contabilidade goiânia", "\"plano de saúde\" -odonto").
+    Without full_access only active members, the member's own visits (member_id) and
+    collective meetings are searched.
+    """
+    unaccent = getattr(func, UNACCENT_FUNCTION)
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, unaccent(text))
+    types = types or list(SearchResultType)
+
+    sources = []
+    if SearchResultType.MEMBER in types:
+        sources.append(_members(query, public_only=not full_access))
+    if SearchResultType.VISIT in types and (full_access or member_id):
+        sources.append(_visits(query, None if full_access else member_id))
+    if SearchResultType.COLLECTIVE_MEETING in types:
+        sources.append(_collective_meetings(query))
+    if not sources:
+        return []
+
+    ranked = union_all(*sources).subquery("ranked")
+    page = select(ranked).order_by(
+        ranked.c.rank.desc(), ranked.c.type, ranked.c.id
+    ).offset(skip).limit(limit).subquery("page")
+
+    rows = db.execute(
+        select(
+            page.c.type, page.c.id, page.c.title, page.c.date, page.c.rank, page.c.document,
+            func.ts_headline(SEARCH_CONFIG, unaccent(page.c.document), query, HEADLINE_OPTIONS).label("headline")
+        ).order_by(page.c.rank.desc(), page.c.type, page.c.id)
+    )
+    return [
+        {
+            "type": row.type,
+            "id": row.id,
+            "title": row.title,
+            "date": row.date,
+            "rank": row.rank,
+            "headline": restore_accents(row.headline, row.document)
+        }
+        for row in rows
+    ]
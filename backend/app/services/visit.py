@@ -1,19 +1,32 @@
 """
 Visit Service
 """
-from typing import List, Optional, Dict, Any
+import base64
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, func, tuple_, select
 from fastapi import HTTPException, status
 
 from app.models.visit import Visit, VisitStatus, VisitPurpose
 from app.models.member import Member
 from app.models.user import User
+from app.services import calendar_feed as calendar_feed_service
+from app.services import scheduler as scheduler_service
+from app.services import agenda as agenda_service
 
 
-def create_visit(db: Session, visitor_id: str, visit_data: Dict[str, Any]) -> Visit:
-    """Create a new visit"""
+# Visit columns of the Hub listing (VisitResponse)
+VISIT_LIST_COLUMNS = [
+    Visit.id, Visit.visitor_id, Visit.visited_id, Visit.purpose, Visit.visit_date, Visit.duration_minutes,
+    Visit.location, Visit.visitor_notes, Visit.status, Visit.visit_summary, Visit.services_learned,
+    Visit.potential_referrals, Visit.networking_quality, Visit.follow_up_needed, Visit.follow_up_date,
+    Visit.follow_up_completed_at, Visit.created_at, Visit.updated_at, Visit.completed_at
+]
+
+
+def create_visit(db: Session, visitor_id: str, visit_data: Dict[str, Any], check_conflicts: bool = True) -> Visit:
+    """Create a new visit (rejected with 409 when it overlaps either member's agenda, unless check_conflicts is off)"""
     # Verify both members exist
     visitor = db.query(Member).filter(Member.id == visitor_id).first()
     if not visitor:
@@ -36,6 +49,11 @@ def create_visit(db: Session, visitor_id: str, visit_data: Dict[str, Any]) -> Vi
             detail="Você não pode registrar uma visita a si mesmo"
         )
     
+    if check_conflicts:
+        start, duration = visit_data['visit_date'], visit_data.get('duration_minutes')
+        agenda_service.check_conflicts(db, visitor_id, start, duration)
+        agenda_service.check_conflicts(db, visit_data['visited_id'], start, duration, own_agenda=False)
+    
     # Create visit
     visit = Visit(
         visitor_id=visitor_id,
@@ -43,6 +61,7 @@ def create_visit(db: Session, visitor_id: str, visit_data: Dict[str, Any]) -> Vi
     )
     
     db.add(visit)
+    calendar_feed_service.invalidate_feeds(db, [visit.visitor_id, visit.visited_id])
     db.commit()
     db.refresh(visit)
     return visit
@@ -73,34 +92,68 @@ def get_member_visits(
     return query.order_by(Visit.visit_date.desc()).offset(skip).limit(limit).all()
 
 
-def get_all_visits(
-    db: Session,
+def _member_name(user):
+    """User's full name, or e-mail when it is empty"""
+    return func.coalesce(func.nullif(user.full_name, ''), user.email)
+
+
+def all_visits_select(
     status_filter: Optional[VisitStatus] = None,
     purpose_filter: Optional[VisitPurpose] = None,
     date_from: Optional[datetime] = None,
-    date_to: Optional[datetime] = None,
-    skip: int = 0,
-    limit: int = 100
-) -> List[Visit]:
-    """Get all visits with filters (Hub/Admin)"""
-    query = db.query(Visit).options(
-        joinedload(Visit.visitor),
-        joinedload(Visit.visited)
+    date_to: Optional[datetime] = None
+):
+    """Hub listing statement: visit columns plus visitor and visited names and companies, newest first"""
+    visitor = aliased(Member)
+    visited = aliased(Member)
+    visitor_user = aliased(User)
+    visited_user = aliased(User)
+    statement = select(
+        *VISIT_LIST_COLUMNS,
+        _member_name(visitor_user).label("visitor_name"),
+        visitor.company_name.label("visitor_company"),
+        _member_name(visited_user).label("visited_name"),
+        visited.company_name.label("visited_company")
+    ).join(
+        visitor, visitor.id == Visit.visitor_id
+    ).join(
+        visitor_user, visitor_user.id == visitor.user_id
+    ).join(
+        visited, visited.id == Visit.visited_id
+    ).join(
+        visited_user, visited_user.id == visited.user_id
     )
     
     if status_filter:
-        query = query.filter(Visit.status == status_filter)
+        statement = statement.where(Visit.status == status_filter)
     
     if purpose_filter:
-        query = query.filter(Visit.purpose == purpose_filter)
+        statement = statement.where(Visit.purpose == purpose_filter)
     
     if date_from:
-        query = query.filter(Visit.visit_date >= date_from)
+        statement = statement.where(Visit.visit_date >= date_from)
     
     if date_to:
-        query = query.filter(Visit.visit_date <= date_to)
+        statement = statement.where(Visit.visit_date <= date_to)
     
-    return query.order_by(Visit.visit_date.desc()).offset(skip).limit(limit).all()
+    return statement.order_by(Visit.visit_date.desc())
+
+
+def get_all_visits(
+    db: Session,
+    status_filter: Optional[VisitStatus] = None,
+    purpose_filter: Optional[VisitPurpose] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Dict[str, Any]]:
+    """
+    Get all visits with filters (Hub/Admin), with visitor and visited names and companies.
+    One query selecting only the listed columns (no ORM objects, no per-row loads).
+    """
+    statement = all_visits_select(status_filter, purpose_filter, date_from, date_to).offset(skip).limit(limit)
+    return [dict(row) for row in db.execute(statement).mappings()]
 
 
 def update_visit(db: Session, visit_id: str, update_data: Dict[str, Any]) -> Visit:
@@ -119,10 +172,13 @@ def update_visit(db: Session, visit_id: str, update_data: Dict[str, Any]) -> Vis
             detail="Não é possível editar uma visita já realizada"
         )
     
+    previous_visited_id = visit.visited_id
     for field, value in update_data.items():
         if value is not None and hasattr(visit, field):
             setattr(visit, field, value)
     
+    scheduler_service.schedule_visit_follow_up(db, visit)
+    calendar_feed_service.invalidate_feeds(db, [visit.visitor_id, visit.visited_id, previous_visited_id])
     db.commit()
     db.refresh(visit)
     return visit
@@ -151,6 +207,12 @@ def complete_visit(db: Session, visit_id: str, completion_data: Dict[str, Any])
         if value is not None and hasattr(visit, field):
             setattr(visit, field, value)
     
+    # Follow-ups without a date are due right away
+    if visit.follow_up_needed and not visit.follow_up_date:
+        visit.follow_up_date = visit.completed_at
+    
+    scheduler_service.schedule_visit_follow_up(db, visit)
+    calendar_feed_service.invalidate_feeds(db, [visit.visitor_id, visit.visited_id])
     db.commit()
     db.refresh(visit)
     return visit
@@ -172,6 +234,8 @@ def cancel_visit(db: Session, visit_id: str) -> Visit:
         )
     
     visit.status = VisitStatus.CANCELADA
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_VISIT_FOLLOW_UP, [visit.id])
+    calendar_feed_service.invalidate_feeds(db, [visit.visitor_id, visit.visited_id])
     db.commit()
     db.refresh(visit)
     return visit
@@ -186,11 +250,104 @@ def delete_visit(db: Session, visit_id: str) -> bool:
             detail="Visita não encontrada"
         )
     
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_VISIT_FOLLOW_UP, [visit.id])
+    calendar_feed_service.invalidate_feeds(db, [visit.visitor_id, visit.visited_id])
     db.delete(visit)
     db.commit()
     return True
 
 
+# Follow-up queue
+
+def _encode_cursor(follow_up_date: datetime, visit_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{follow_up_date.isoformat()}|{visit_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        follow_up_date, visit_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(follow_up_date), visit_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor inválido"
+        )
+
+
+def get_follow_up_queue(
+    db: Session,
+    visitor_id: Optional[str] = None,
+    due_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50
+) -> Dict[str, Any]:
+    """
+    Open follow-ups ordered by due date (overdue first), for one visitor or everyone.
+    Keyset pagination on (follow_up_date, id) over the partial follow-up indexes.
+    """
+    visitor = aliased(Member)
+    visited = aliased(Member)
+    query = db.query(
+        Visit.id, Visit.visitor_id, Visit.visited_id, Visit.visit_date, Visit.follow_up_needed, Visit.follow_up_date,
+        visitor.company_name.label("visitor_company"),
+        visited.company_name.label("visited_company")
+    ).join(
+        visitor, visitor.id == Visit.visitor_id
+    ).join(
+        visited, visited.id == Visit.visited_id
+    ).filter(
+        Visit.status == VisitStatus.REALIZADA,
+        Visit.follow_up_needed.isnot(None),
+        Visit.follow_up_completed_at.is_(None),
+        Visit.follow_up_date.isnot(None)
+    )
+    
+    if visitor_id:
+        query = query.filter(Visit.visitor_id == visitor_id)
+    
+    if due_before:
+        query = query.filter(Visit.follow_up_date < due_before)
+    
+    if cursor:
+        query = query.filter(tuple_(Visit.follow_up_date, Visit.id) > _decode_cursor(cursor))
+    
+    rows = query.order_by(Visit.follow_up_date, Visit.id).limit(limit + 1).all()
+    page = rows[:limit]
+    now = datetime.utcnow()
+    return {
+        "items": [{**row._asdict(), "overdue": row.follow_up_date < now} for row in page],
+        "next_cursor": _encode_cursor(page[-1].follow_up_date, page[-1].id) if len(rows) > limit else None
+    }
+
+
+def complete_follow_up(db: Session, visit_id: str) -> Visit:
+    """Mark a visit's follow-up as done"""
+    visit = get_visit_by_id(db, visit_id)
+    if not visit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Visita não encontrada"
+        )
+    
+    if visit.status != VisitStatus.REALIZADA or not visit.follow_up_needed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Esta visita não tem follow-up pendente"
+        )
+    
+    if visit.follow_up_completed_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O follow-up desta visita já foi concluído"
+        )
+    
+    visit.follow_up_completed_at = datetime.utcnow()
+    scheduler_service.cancel_jobs(db, scheduler_service.JOB_VISIT_FOLLOW_UP, [visit.id])
+    db.commit()
+    db.refresh(visit)
+    return visit
+
+
 def get_visit_stats(db: Session, member_id: Optional[str] = None) -> Dict[str, Any]:
     """Get visit statistics"""
     if member_id:
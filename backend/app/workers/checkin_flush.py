@@ -0,0 +1,28 @@
+"""
+Check-in Flush Worker - Applies QR check-ins recorded in Redis to the database
+
+Standalone: python -m app.workers.checkin_flush
+In-app: started on API startup when CHECKIN_FLUSH_IN_APP is enabled
+"""
+from app.core.config import settings
+from app.services import checkin as checkin_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the check-in flush worker inside the API process"""
+    return runner.run_in_app(
+        "checkin_flush",
+        checkin_service.flush_checkins,
+        settings.CHECKIN_FLUSH_INTERVAL_SECONDS,
+        batch_size=settings.CHECKIN_FLUSH_BATCH_SIZE
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "checkin_flush",
+        checkin_service.flush_checkins,
+        settings.CHECKIN_FLUSH_INTERVAL_SECONDS,
+        batch_size=settings.CHECKIN_FLUSH_BATCH_SIZE
+    )
@@ -0,0 +1,78 @@
+"""
+Delivery Worker - Sends notification emails and web pushes
+
+Claims due deliveries in batches, splits them per channel into provider-sized chunks
+and sends the chunks concurrently (at most DELIVERY_CONCURRENCY provider calls at once).
+
+Standalone: python -m app.workers.delivery
+In-app: started on API startup when DELIVERY_WORKER_IN_APP is enabled
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services import delivery as delivery_service
+from app.services import delivery_providers
+from app.workers import runner
+
+
+async def _send_chunk(provider, chunk: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> List[Tuple[str, Optional[str]]]:
+    async with semaphore:
+        started = time.monotonic()
+        try:
+            errors = await asyncio.to_thread(provider.send_batch, chunk)
+        except Exception as e:
+            errors = [str(e)] * len(chunk)
+        failed = sum(1 for error in errors if error is not None)
+        delivery_service.record_send(provider.channel, len(chunk) - failed, failed, time.monotonic() - started)
+    return [(message["delivery_id"], error) for message, error in zip(chunk, errors)]
+
+
+async def run_once(providers: Dict[Any, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """Claim one batch, send it and record the results"""
+    claimed = await asyncio.to_thread(
+        runner.run_with_session, delivery_service.claim_batch, batch_size=settings.DELIVERY_BATCH_SIZE
+    )
+
+    results: List[Tuple[str, Optional[str]]] = []
+    sends = []
+    for channel in {message["channel"] for message in claimed["messages"]}:
+        messages = [message for message in claimed["messages"] if message["channel"] == channel]
+        provider = providers.get(channel)
+        if provider is None:
+            results.extend((message["delivery_id"], f"Canal {channel.value} não configurado") for message in messages)
+            continue
+        for start in range(0, len(messages), provider.max_batch_size):
+            sends.append(_send_chunk(provider, messages[start:start + provider.max_batch_size], semaphore))
+
+    for chunk_results in await asyncio.gather(*sends):
+        results.extend(chunk_results)
+
+    if results:
+        summary = await asyncio.to_thread(runner.run_with_session, delivery_service.record_results, results=results)
+        claimed.update(summary)
+    del claimed["messages"]
+    return claimed
+
+
+async def run_in_app() -> None:
+    """Run the delivery worker loop without blocking the event loop"""
+    interval = settings.DELIVERY_POLL_INTERVAL_SECONDS
+    print(f"⚙️  Delivery worker started (backend: {delivery_providers.backend_name()}, interval: {interval}s)")
+    providers = delivery_providers.get_providers()
+    semaphore = asyncio.Semaphore(settings.DELIVERY_CONCURRENCY)
+    while True:
+        try:
+            result = await run_once(providers, semaphore)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error in worker delivery: {e}")
+            result = {}
+        if not runner.has_more_work(result):
+            await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_in_app())
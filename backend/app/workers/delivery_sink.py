@@ -0,0 +1,56 @@
+"""
+Delivery Sink - Local HTTP server that stands in for the email/push providers
+
+Point the API at it with DELIVERY_BACKEND=sink and DELIVERY_SINK_URL=http://localhost:8025/messages.
+Nothing leaves the machine: batches are kept in memory and can be inspected or cleared.
+
+    python -m app.workers.delivery_sink [port]
+
+POST   /messages  - store a batch (what SinkProvider sends)
+GET    /messages  - list stored batches
+DELETE /messages  - clear stored batches
+"""
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    batches = []
+
+    def _reply(self, code: int, body=None):
+        data = json.dumps(body if body is not None else {}).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if self.path != "/messages":
+            return self._reply(404)
+        length = int(self.headers.get("Content-Length", 0))
+        batch = json.loads(self.rfile.read(length) or b"{}")
+        SinkHandler.batches.append(batch)
+        print(f"📨 {batch.get('channel')}: {len(batch.get('messages', []))} message(s)")
+        self._reply(202, {"accepted": len(batch.get("messages", []))})
+
+    def do_GET(self):
+        if self.path != "/messages":
+            return self._reply(404)
+        self._reply(200, SinkHandler.batches)
+
+    def do_DELETE(self):
+        if self.path != "/messages":
+            return self._reply(404)
+        SinkHandler.batches.clear()
+        self._reply(200)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8025
+    print(f"📭 Delivery sink listening on http://localhost:{port}/messages")
+    ThreadingHTTPServer(("", port), SinkHandler).serve_forever()
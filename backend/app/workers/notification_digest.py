@@ -0,0 +1,26 @@
+"""
+Notification Digest Worker - Folds staged LOW priority notifications into daily digests
+
+Standalone: python -m app.workers.notification_digest
+In-app: started on API startup when NOTIFICATION_DIGEST_ENABLED is set
+"""
+from app.core.config import settings
+from app.services import notification as notification_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the digest worker inside the API process"""
+    return runner.run_in_app(
+        "notification-digest",
+        notification_service.build_digests,
+        settings.NOTIFICATION_DIGEST_POLL_INTERVAL_SECONDS
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "notification-digest",
+        notification_service.build_digests,
+        settings.NOTIFICATION_DIGEST_POLL_INTERVAL_SECONDS
+    )
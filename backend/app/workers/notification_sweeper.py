@@ -0,0 +1,28 @@
+"""
+Notification Sweeper - Deletes expired notifications in batches
+
+Standalone: python -m app.workers.notification_sweeper
+In-app: started on API startup when NOTIFICATION_SWEEPER_IN_APP is enabled
+"""
+from app.core.config import settings
+from app.services import notification as notification_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the sweeper inside the API process"""
+    return runner.run_in_app(
+        "notification-sweeper",
+        notification_service.sweep_expired_notifications,
+        settings.NOTIFICATION_SWEEP_INTERVAL_SECONDS,
+        batch_size=settings.NOTIFICATION_SWEEP_BATCH_SIZE
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "notification-sweeper",
+        notification_service.sweep_expired_notifications,
+        settings.NOTIFICATION_SWEEP_INTERVAL_SECONDS,
+        batch_size=settings.NOTIFICATION_SWEEP_BATCH_SIZE
+    )
@@ -0,0 +1,28 @@
+"""
+Outbox Worker - Drains the outbox in batches and delivers side effects
+
+Standalone: python -m app.workers.outbox
+In-app: started on API startup when OUTBOX_WORKER_IN_APP is enabled
+"""
+from app.core.config import settings
+from app.services import outbox as outbox_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the outbox worker inside the API process"""
+    return runner.run_in_app(
+        "outbox",
+        outbox_service.process_batch,
+        settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        batch_size=settings.OUTBOX_BATCH_SIZE
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "outbox",
+        outbox_service.process_batch,
+        settings.OUTBOX_POLL_INTERVAL_SECONDS,
+        batch_size=settings.OUTBOX_BATCH_SIZE
+    )
@@ -0,0 +1,56 @@
+"""
+Worker Runner - Shared loop for periodic background tasks
+"""
+import asyncio
+import time
+from typing import Callable, Dict, Any
+
+from app.core.database import SessionLocal
+
+
+Task = Callable[..., Dict[str, Any]]
+
+
+def run_with_session(task: Task, **kwargs) -> Dict[str, Any]:
+    """Run a task with its own database session"""
+    db = SessionLocal()
+    try:
+        return task(db, **kwargs)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def has_more_work(result: Dict[str, Any]) -> bool:
+    """A task that filled its batch probably has more work waiting"""
+    return bool(result.get("processed")) and result.get("processed") >= result.get("batch_size", float("inf"))
+
+
+def run_forever(name: str, task: Task, interval_seconds: float, **kwargs) -> None:
+    """Run a task in a loop as a standalone process (blocking)"""
+    print(f"⚙️  Worker {name} started (interval: {interval_seconds}s)")
+    while True:
+        try:
+            result = run_with_session(task, **kwargs)
+        except Exception as e:
+            print(f"Error in worker {name}: {e}")
+            result = {}
+        if not has_more_work(result):
+            time.sleep(interval_seconds)
+
+
+async def run_in_app(name: str, task: Task, interval_seconds: float, **kwargs) -> None:
+    """Run a task in a loop inside the API process without blocking the event loop"""
+    print(f"⚙️  In-app worker {name} started (interval: {interval_seconds}s)")
+    while True:
+        try:
+            result = await asyncio.to_thread(run_with_session, task, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error in worker {name}: {e}")
+            result = {}
+        if not has_more_work(result):
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,28 @@
+"""
+Scheduler Worker - Runs due reminders (meetings, collective meetings, visit follow-ups)
+
+Standalone: python -m app.workers.scheduler
+In-app: started on API startup when SCHEDULER_WORKER_IN_APP is enabled
+"""
+from app.core.config import settings
+from app.services import scheduler as scheduler_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the scheduler inside the API process"""
+    return runner.run_in_app(
+        "scheduler",
+        scheduler_service.run_due_jobs,
+        settings.SCHEDULER_POLL_INTERVAL_SECONDS,
+        batch_size=settings.SCHEDULER_BATCH_SIZE
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "scheduler",
+        scheduler_service.run_due_jobs,
+        settings.SCHEDULER_POLL_INTERVAL_SECONDS,
+        batch_size=settings.SCHEDULER_BATCH_SIZE
+    )
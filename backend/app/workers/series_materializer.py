@@ -0,0 +1,28 @@
+"""
+Series Materializer Worker - Creates the meetings of recurring series shortly before they happen
+
+Standalone: python -m app.workers.series_materializer
+In-app: started on API startup when SERIES_WORKER_IN_APP is enabled
+"""
+from app.core.config import settings
+from app.services import meeting_series as series_service
+from app.workers import runner
+
+
+def run_in_app():
+    """Coroutine for running the series materializer inside the API process"""
+    return runner.run_in_app(
+        "series_materializer",
+        series_service.materialize_due_series,
+        settings.SERIES_WORKER_INTERVAL_SECONDS,
+        batch_size=settings.SERIES_WORKER_BATCH_SIZE
+    )
+
+
+if __name__ == "__main__":
+    runner.run_forever(
+        "series_materializer",
+        series_service.materialize_due_series,
+        settings.SERIES_WORKER_INTERVAL_SECONDS,
+        batch_size=settings.SERIES_WORKER_BATCH_SIZE
+    )
@@ -0,0 +1,81 @@
+"""Benchmark: legacy per-day slot scan vs. interval sweep (meeting_service.find_free_slots)
+
+Runs on synthetic in-memory meetings, no database needed:
+    python benchmark_available_slots.py [days] [meetings_per_day]
+"""
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.services.meeting import find_free_slots
+
+OPEN_HOUR, CLOSE_HOUR, STEP, DURATION = 9, 18, 30, 60
+
+
+def legacy_day_slots(meetings, day: datetime, duration_minutes: int):
+    """Previous get_available_slots algorithm (one call per day, O(slots x meetings))"""
+    start_of_day = day.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_of_day = start_of_day + timedelta(days=1)
+    existing_meetings = [m for m in meetings if start_of_day <= m.scheduled_date < end_of_day]
+
+    available_slots = []
+    current_time = start_of_day.replace(hour=OPEN_HOUR, minute=0)
+    end_time = start_of_day.replace(hour=CLOSE_HOUR, minute=0)
+    while current_time < end_time:
+        is_available = True
+        for meeting in existing_meetings:
+            meeting_end = meeting.scheduled_date + timedelta(minutes=int(meeting.duration_minutes))
+            slot_end = current_time + timedelta(minutes=duration_minutes)
+            if not (slot_end <= meeting.scheduled_date or current_time >= meeting_end):
+                is_available = False
+                break
+        if is_available:
+            available_slots.append(current_time)
+        current_time += timedelta(minutes=STEP)
+    return available_slots
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 31
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    random.seed(42)
+    first = datetime(2025, 1, 6)
+
+    meetings = sorted(
+        (
+            SimpleNamespace(
+                scheduled_date=first + timedelta(days=d, hours=random.randint(8, 17), minutes=random.choice([0, 15, 30, 45])),
+                duration_minutes=str(random.choice([30, 45, 60, 90]))
+            )
+            for d in range(days) for _ in range(per_day)
+        ),
+        key=lambda m: m.scheduled_date
+    )
+
+    def legacy():
+        # The booking UI made one request per day
+        slots = []
+        for d in range(days):
+            slots += legacy_day_slots(meetings, first + timedelta(days=d), DURATION)
+        return slots
+
+    def sweep():
+        busy = [(m.scheduled_date, m.scheduled_date + timedelta(minutes=int(m.duration_minutes))) for m in meetings]
+        return find_free_slots(busy, first.date(), (first + timedelta(days=days - 1)).date(), DURATION, OPEN_HOUR, CLOSE_HOUR, STEP)
+
+    # The sweep only returns slots that end within business hours
+    closes = lambda slot: slot + timedelta(minutes=DURATION) <= slot.replace(hour=CLOSE_HOUR, minute=0)
+    assert [s for s in legacy() if closes(s)] == sweep(), "results differ"
+
+    runs = 20
+    legacy_time = timeit.timeit(legacy, number=runs) / runs
+    sweep_time = timeit.timeit(sweep, number=runs) / runs
+    print(f"{days} days, {len(meetings)} meetings, {len(sweep())} free slots")
+    print(f"legacy: {legacy_time * 1000:.2f} ms")
+    print(f"sweep:  {sweep_time * 1000:.2f} ms ({legacy_time / sweep_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Hub free/busy bitmap cache (availability_service.get_bitmaps, invalidate_days)
+"""
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.timezone import local_now
+from app.models.availability import HubWorkingHours, HubBlockedPeriod
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.user import User, UserRole, UserStatus
+from app.services import availability as availability_service
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+MODELS = [User, Meeting, HubWorkingHours, HubBlockedPeriod]
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(availability_service, "get_redis", lambda: client)
+    return client
+
+
+@pytest.fixture
+def hub_id(db):
+    hub = User(email="hub@example.com", password_hash="x", role=UserRole.HUB, status=UserStatus.ACTIVE)
+    db.add(hub)
+    db.commit()
+    return hub.id
+
+
+def _day():
+    return local_now().date() + timedelta(days=1)
+
+
+def _book(db, hub_id, hour):
+    db.add(Meeting(
+        member_id="member",
+        assigned_hub_id=hub_id,
+        scheduled_date=datetime.combine(_day(), time(hour)),
+        duration_minutes=60,
+        status=MeetingStatus.CONFIRMED
+    ))
+    db.commit()
+    availability_service.invalidate_interval(db, datetime.combine(_day(), time(hour)), 60)
+
+
+def _free_at(db, hub_id, hour):
+    day = _day()
+    bitmap = availability_service.get_bitmaps(db, [hub_id], day, day)[hub_id][day]
+    slot = hour * 60 // availability_service.SLOT_MINUTES
+    return bool(bitmap >> slot & 1)
+
+
+def test_change_is_visible_on_the_next_read(db, hub_id, cache):
+    assert _free_at(db, hub_id, 10)
+    assert cache.get(availability_service._key(hub_id, _day())) is not None
+
+    _book(db, hub_id, 10)
+
+    assert cache.get(availability_service._key(hub_id, _day())) is None
+    assert not _free_at(db, hub_id, 10)
+    assert _free_at(db, hub_id, 11)
+
+
+def test_write_computed_before_an_invalidation_is_ignored(db, hub_id, monkeypatch):
+    compute = availability_service.compute_bitmaps
+
+    def compute_then_race(db, hub_ids, first_day, last_day):
+        bitmaps = compute(db, hub_ids, first_day, last_day)
+        # Another request books and invalidates before this reader caches its snapshot
+        monkeypatch.setattr(availability_service, "compute_bitmaps", compute)
+        _book(db, hub_id, 10)
+        return bitmaps
+
+    monkeypatch.setattr(availability_service, "compute_bitmaps", compute_then_race)
+    assert _free_at(db, hub_id, 10)  # Stale snapshot, served once
+
+    assert not _free_at(db, hub_id, 10)
+
+
+def test_entries_expire_within_the_ttl(db, hub_id, cache):
+    day = local_now().date() + timedelta(days=20)
+    availability_service.get_bitmaps(db, [hub_id], day, day)
+
+    assert 0 < cache.ttl(availability_service._key(hub_id, day)) <= settings.AVAILABILITY_CACHE_TTL_SECONDS
@@ -0,0 +1,113 @@
+"""
+Email / web push deliveries through the sink backend (delivery_service, SinkProvider)
+"""
+import pytest
+
+from app.core.config import settings
+from app.models.notification import Notification, NotificationPriority, NotificationType
+from app.models.notification_delivery import (
+    NotificationDelivery, NotificationPreference, PushSubscription, DeliveryChannel, DeliveryStatus
+)
+from app.models.user import User, UserRole
+from app.services import delivery as delivery_service
+from app.services.delivery_providers import SinkProvider
+
+
+MODELS = [User, Notification, NotificationDelivery, NotificationPreference, PushSubscription]
+
+
+@pytest.fixture(autouse=True)
+def sink(monkeypatch):
+    monkeypatch.setattr(settings, "DELIVERY_BACKEND", "sink")
+    monkeypatch.setattr(settings, "DELIVERY_SINK_URL", None)
+    monkeypatch.setattr(settings, "APP_URL", "https://union.test")
+    SinkProvider.sent.clear()
+    yield SinkProvider.sent
+    SinkProvider.sent.clear()
+
+
+def _user(db, email, full_name="Membro"):
+    user = User(email=email, password_hash="x", role=UserRole.MEMBER, full_name=full_name)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _notification(user_id, title, priority=NotificationPriority.HIGH):
+    return Notification(
+        user_id=user_id,
+        type=NotificationType.MEETING_CONFIRMED,
+        priority=priority,
+        title=title,
+        message="Sua reunião foi confirmada",
+        action_url="/meetings/1",
+        action_label="Ver reunião"
+    )
+
+
+def test_schedule_and_send_through_the_sink(db, statements, sink):
+    pushed = _user(db, "pushed@example.com", "Ana")
+    no_email = _user(db, "no-email@example.com")
+    urgent_only = _user(db, "urgent@example.com")
+    db.add_all([
+        PushSubscription(user_id=pushed.id, endpoint="https://push.test/1", p256dh="key", auth="secret"),
+        NotificationPreference(user_id=no_email.id, email_enabled=False, push_enabled=True, min_priority=NotificationPriority.NORMAL),
+        NotificationPreference(user_id=urgent_only.id, email_enabled=True, push_enabled=True, min_priority=NotificationPriority.URGENT),
+    ])
+    db.commit()
+    user_ids = [pushed.id, no_email.id, urgent_only.id]
+    notifications = [_notification(user_id, f"Reunião {index}") for index, user_id in enumerate(user_ids)]
+    db.add_all(notifications)
+
+    statements.clear()
+    deliveries = delivery_service.schedule_deliveries(db, notifications)
+    assert len(statements) == 1  # Preferences and push subscriptions together, no flush
+    db.commit()
+
+    rows = {(delivery.user_id, delivery.channel) for delivery in db.query(NotificationDelivery)}
+    assert rows == {(pushed.id, DeliveryChannel.EMAIL), (pushed.id, DeliveryChannel.WEB_PUSH)}
+    assert {delivery.notification_id for delivery in deliveries} == {notifications[0].id}
+    assert all(delivery.status == DeliveryStatus.PENDING for delivery in deliveries)
+
+    claimed = delivery_service.claim_batch(db)
+    results = []
+    for channel in DeliveryChannel:
+        messages = [message for message in claimed["messages"] if message["channel"] == channel]
+        errors = SinkProvider(channel).send_batch(messages)
+        results.extend((message["delivery_id"], error) for message, error in zip(messages, errors))
+    assert delivery_service.record_results(db, results) == {"sent": 2, "retried": 0, "failed": 0}
+
+    assert {delivery.status for delivery in db.query(NotificationDelivery)} == {DeliveryStatus.SENT}
+    batches = {batch["channel"]: batch["messages"] for batch in sink}
+    email, = batches["EMAIL"]
+    assert email["to"] == ["pushed@example.com"]
+    assert email["subject"] == "Reunião 0"
+    assert "Olá Ana" in email["html"]
+    assert "https://union.test/meetings/1" in email["text"]
+    push, = batches["WEB_PUSH"]
+    assert push == {"title": "Reunião 0", "body": "Sua reunião foi confirmada", "url": "https://union.test/meetings/1"}
+
+
+def test_pending_delivery_is_not_queued_twice(db):
+    user = _user(db, "member@example.com")
+    notification = _notification(user.id, "Primeira")
+    db.add(notification)
+    delivery_service.schedule_deliveries(db, [notification])
+    db.commit()
+
+    # Coalesced into the same row before the worker sent it
+    notification.title = "Atualizada"
+    delivery_service.schedule_deliveries(db, [notification, notification])
+    db.commit()
+
+    assert db.query(NotificationDelivery).count() == 1
+
+
+def test_no_deliveries_without_an_email_backend(db, monkeypatch):
+    monkeypatch.setattr(settings, "DELIVERY_BACKEND", "auto")
+    monkeypatch.setattr(settings, "RESEND_API_KEY", None)
+    user = _user(db, "member@example.com")
+    notification = _notification(user.id, "Sem e-mail")
+    db.add(notification)
+
+    assert delivery_service.schedule_deliveries(db, [notification]) == []
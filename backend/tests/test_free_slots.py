@@ -0,0 +1,102 @@
+"""
+Free meeting slots (meeting_service.find_free_slots, _merge_intervals)
+"""
+import random
+from datetime import date, datetime, time, timedelta
+
+from app.services import meeting as meeting_service
+
+
+DAY = date(2030, 1, 7)
+
+
+def _at(hour, minute=0, day=DAY):
+    return datetime.combine(day, time(hour, minute))
+
+
+def _slots(busy, start_date=DAY, end_date=DAY, duration=60, open_hour=9, close_hour=18, step=30):
+    return meeting_service.find_free_slots(sorted(busy), start_date, end_date, duration, open_hour, close_hour, step)
+
+
+def _brute_force(busy, start_date, end_date, duration, open_hour, close_hour, step):
+    """Every step of every day, checked against every interval"""
+    slots = []
+    day = start_date
+    while day <= end_date:
+        current = datetime.combine(day, time(open_hour))
+        while current + timedelta(minutes=duration) <= datetime.combine(day, time(close_hour)):
+            end = current + timedelta(minutes=duration)
+            if not any(busy_start < end and busy_end > current for busy_start, busy_end in busy):
+                slots.append(current)
+            current += timedelta(minutes=step)
+        day += timedelta(days=1)
+    return slots
+
+
+def test_merge_overlapping_adjacent_and_nested():
+    intervals = [
+        (_at(9), _at(10)),
+        (_at(9, 30), _at(11)),  # Overlaps
+        (_at(11), _at(12)),  # Adjacent
+        (_at(11, 15), _at(11, 45)),  # Nested
+        (_at(14), _at(15)),
+    ]
+
+    assert meeting_service._merge_intervals(intervals) == [(_at(9), _at(12)), (_at(14), _at(15))]
+    assert meeting_service._merge_intervals([]) == []
+
+
+def test_empty_day_is_every_step():
+    slots = _slots([])
+
+    assert slots[0] == _at(9)
+    assert slots[-1] == _at(17)
+    assert len(slots) == 17
+
+
+def test_overlapping_and_adjacent_busy_intervals():
+    busy = [(_at(10), _at(11)), (_at(10, 30), _at(11, 30)), (_at(11, 30), _at(12, 15))]
+
+    slots = _slots(busy)
+
+    assert _at(9) in slots
+    assert not [slot for slot in slots if _at(9, 30) <= slot < _at(12, 30)]
+    assert _at(12, 30) in slots  # First step after the merged block
+    assert slots == _brute_force(busy, DAY, DAY, 60, 9, 18, 30)
+
+
+def test_meeting_crossing_midnight_blocks_the_next_morning():
+    busy = [(_at(23, 0, DAY - timedelta(days=1)), _at(10, 10))]
+
+    slots = _slots(busy)
+
+    assert slots[0] == _at(10, 30)
+
+
+def test_multi_day_range():
+    last_day = DAY + timedelta(days=2)
+    busy = [
+        (_at(9), _at(18)),  # First day fully booked
+        (_at(12, 0, DAY + timedelta(days=1)), _at(13, 0, DAY + timedelta(days=1))),
+    ]
+
+    slots = _slots(busy, end_date=last_day)
+
+    assert not [slot for slot in slots if slot.date() == DAY]
+    assert {slot.date() for slot in slots} == {DAY + timedelta(days=1), last_day}
+    assert len([slot for slot in slots if slot.date() == last_day]) == 17
+    assert slots == _brute_force(busy, DAY, last_day, 60, 9, 18, 30)
+
+
+def test_matches_brute_force_on_random_calendars():
+    generator = random.Random(38)
+    for _ in range(200):
+        busy = []
+        for _ in range(generator.randint(0, 12)):
+            start = datetime.combine(DAY, time.min) + timedelta(minutes=generator.randrange(-24 * 60, 4 * 24 * 60, 5))
+            busy.append((start, start + timedelta(minutes=generator.choice([15, 30, 45, 60, 90, 240, 600]))))
+        duration = generator.choice([15, 30, 45, 60, 90])
+        step = generator.choice([15, 30, 60])
+        last_day = DAY + timedelta(days=generator.randint(0, 3))
+
+        assert _slots(busy, DAY, last_day, duration, 8, 19, step) == _brute_force(busy, DAY, last_day, duration, 8, 19, step)
@@ -0,0 +1,103 @@
+"""
+Member graph queries and incremental sync (member_graph.GraphCache, get_never_met, get_second_degree)
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.models.member import Member, MemberStatus, BusinessCategory
+from app.models.referral import Referral
+from app.models.user import User, UserRole
+from app.models.visit import Visit, VisitPurpose, VisitStatus
+from app.services import member_graph as member_graph_service
+
+
+MODELS = [User, Member, Visit, Referral]
+
+
+@pytest.fixture(autouse=True)
+def graph_cache(monkeypatch):
+    cache = member_graph_service.GraphCache()
+    monkeypatch.setattr(member_graph_service, "graph_cache", cache)
+    monkeypatch.setattr(settings, "GRAPH_REBUILD_SECONDS", 3600)
+    return cache
+
+
+def _member(db, name, member_status=MemberStatus.ACTIVE):
+    user = User(email=f"{name.lower()}@example.com", password_hash="x", role=UserRole.MEMBER)
+    db.add(user)
+    db.flush()
+    member = Member(
+        user_id=user.id,
+        company_name=name,
+        business_category=BusinessCategory.TECNOLOGIA,
+        status=member_status,
+        created_at=datetime(2030, 1, 1) + timedelta(minutes=db.query(Member).count())
+    )
+    db.add(member)
+    db.flush()
+    return member
+
+
+def _visit(db, visitor, visited):
+    visit = Visit(visitor_id=visitor.id, visited_id=visited.id, purpose=VisitPurpose.NETWORKING, visit_date=datetime(2030, 1, 10, 10))
+    db.add(visit)
+    db.flush()
+    return visit
+
+
+@pytest.fixture
+def members(db):
+    """A visits B and C; B and C both visit D; C visits E; B visits the inactive G; F met nobody"""
+    members = {name: _member(db, name) for name in "ABCDEF"}
+    members["G"] = _member(db, "G", MemberStatus.LEAD)
+    for visitor, visited in ["AB", "AC", "BD", "CD", "CE", "BG"]:
+        _visit(db, members[visitor], members[visited])
+    db.commit()
+    return members
+
+
+def _names(rows):
+    return [row["company_name"] for row in rows]
+
+
+def test_never_met_lists_active_members_without_visits(db, members):
+    assert _names(member_graph_service.get_never_met(db, members["A"].id)) == ["D", "E", "F"]
+    assert _names(member_graph_service.get_never_met(db, members["F"].id)) == ["A", "B", "C", "D", "E"]
+    assert _names(member_graph_service.get_never_met(db, members["A"].id, skip=1, limit=1)) == ["E"]
+
+
+def test_second_degree_is_ranked_by_mutual_contacts(db, members):
+    rows = member_graph_service.get_second_degree(db, members["A"].id)
+
+    assert [(row["company_name"], row["mutual_connections"]) for row in rows] == [("D", 2), ("E", 1)]
+
+
+def test_isolated_members_are_active_and_unlinked(db, members):
+    assert _names(member_graph_service.get_isolated(db)) == ["F"]
+    stats = member_graph_service.get_stats(db)
+    assert (stats["members"], stats["active_members"], stats["edges"], stats["isolated_members"]) == (7, 6, 6, 1)
+
+
+def test_unknown_member_is_404(db, members):
+    with pytest.raises(HTTPException) as error:
+        member_graph_service.get_never_met(db, "missing")
+
+    assert error.value.status_code == 404
+
+
+def test_cancelled_visit_is_synced_without_a_rebuild(db, members, graph_cache):
+    assert _names(member_graph_service.get_never_met(db, members["A"].id)) == ["D", "E", "F"]
+    rebuilt_at = graph_cache._rebuilt_at
+
+    visit = db.query(Visit).filter(Visit.visitor_id == members["A"].id, Visit.visited_id == members["C"].id).one()
+    visit.status = VisitStatus.CANCELADA
+    db.commit()
+
+    assert _names(member_graph_service.get_never_met(db, members["A"].id)) == ["C", "D", "E", "F"]
+    rows = member_graph_service.get_second_degree(db, members["A"].id)
+    assert [(row["company_name"], row["mutual_connections"]) for row in rows] == [("D", 1)]
+    assert member_graph_service.get_stats(db)["edges"] == 5
+    assert graph_cache._rebuilt_at == rebuilt_at
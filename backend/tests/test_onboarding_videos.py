@@ -0,0 +1,106 @@
+"""
+Onboarding videos with progress (video_service)
+"""
+from app.models.onboarding_video import OnboardingVideo, VideoProvider
+from app.models.user import User, UserRole
+from app.models.video_progress import VideoProgress
+from app.schemas.onboarding_video import OnboardingVideoWithProgress
+from app.services import onboarding_video as video_service
+
+
+MODELS = [User, OnboardingVideo, VideoProgress]
+
+
+def _user(db, email):
+    user = User(email=email, password_hash="x", role=UserRole.VISITOR)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _videos(db, count):
+    videos = [
+        OnboardingVideo(title=f"Vídeo {index}", video_url=f"https://youtu.be/{index}", provider=VideoProvider.YOUTUBE, order=count - index)
+        for index in range(count)
+    ]
+    db.add_all(videos)
+    db.commit()
+    return videos
+
+
+def _racing(monkeypatch):
+    """get_user_progress misses once, as if another request inserted the row right after the check"""
+    real = video_service.get_user_progress
+    calls = []
+
+    def get_user_progress(db, user_id, video_id):
+        calls.append(video_id)
+        return None if len(calls) == 1 else real(db, user_id, video_id)
+
+    monkeypatch.setattr(video_service, "get_user_progress", get_user_progress)
+
+
+def test_videos_with_progress_in_one_statement(db, statements):
+    user = _user(db, "visitor@example.com")
+    other = _user(db, "other@example.com")
+    videos = _videos(db, 5)
+    videos[0].is_active = False
+    db.commit()
+    video_service.mark_video_completed(db, user.id, videos[1].id)
+    video_service.mark_video_started(db, user.id, videos[2].id)
+    video_service.mark_video_completed(db, other.id, videos[3].id)
+    user_id = user.id  # Read before counting: commits expire the instance
+
+    statements.clear()
+    result = video_service.get_videos_with_progress(db, user_id)
+
+    assert len(statements) == 1
+    assert [video["title"] for video in result] == ["Vídeo 4", "Vídeo 3", "Vídeo 2", "Vídeo 1"]
+    progress = {video["title"]: video["user_progress"] for video in result}
+    assert progress["Vídeo 1"]["completed"] is True
+    assert progress["Vídeo 2"]["completed"] is False
+    assert progress["Vídeo 3"] is None  # Only the other user watched it
+    assert progress["Vídeo 4"] is None
+    for video in result:
+        OnboardingVideoWithProgress.model_validate(video)
+
+
+def test_statement_count_does_not_grow_with_videos(db, statements):
+    user_id = _user(db, "visitor@example.com").id
+    for video in _videos(db, 1):
+        video_service.mark_video_started(db, user_id, video.id)
+    statements.clear()
+    video_service.get_videos_with_progress(db, user_id)
+    single = len(statements)
+
+    for video in _videos(db, 20):
+        video_service.mark_video_completed(db, user_id, video.id)
+    statements.clear()
+    assert len(video_service.get_videos_with_progress(db, user_id)) == 21
+    assert len(statements) == single == 1
+
+
+def test_concurrent_start_returns_existing_progress(db, monkeypatch):
+    user = _user(db, "visitor@example.com")
+    video = _videos(db, 1)[0]
+    existing = video_service.mark_video_started(db, user.id, video.id)
+    _racing(monkeypatch)
+
+    progress = video_service.mark_video_started(db, user.id, video.id)
+
+    assert progress.id == existing.id
+    assert db.query(VideoProgress).count() == 1
+
+
+def test_concurrent_complete_completes_existing_progress(db, monkeypatch):
+    user = _user(db, "visitor@example.com")
+    video = _videos(db, 1)[0]
+    existing = video_service.mark_video_started(db, user.id, video.id)
+    _racing(monkeypatch)
+
+    progress = video_service.mark_video_completed(db, user.id, video.id)
+
+    assert progress.id == existing.id
+    assert progress.completed is True
+    assert progress.completed_at is not None
+    assert db.query(VideoProgress).count() == 1
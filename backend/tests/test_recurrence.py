@@ -0,0 +1,124 @@
+"""
+Recurring collective meetings (recurrence.expand_occurrences, meeting_series.materialize_series)
+"""
+from datetime import datetime, timedelta
+
+from app.core.timezone import local_now
+from app.models.calendar_feed import CalendarFeed
+from app.models.collective_meeting import (
+    CollectiveMeeting, CollectiveMeetingSeries, CollectiveMeetingType, SeriesFrequency, meeting_attendees
+)
+from app.models.member import Member
+from app.models.scheduled_job import ScheduledJob
+from app.models.user import User, UserRole
+from app.services import meeting_series as series_service
+from app.services import recurrence
+
+
+MODELS = [User, Member, CollectiveMeetingSeries, CollectiveMeeting, meeting_attendees, ScheduledJob, CalendarFeed]
+
+MONDAY = datetime(2030, 1, 7, 10)
+
+
+def _series(**rule):
+    rule.setdefault("frequency", SeriesFrequency.WEEKLY)
+    rule.setdefault("interval", 1)
+    return CollectiveMeetingSeries(
+        title="Reunião semanal",
+        meeting_type=CollectiveMeetingType.ONLINE,
+        **rule
+    )
+
+
+def _expand(series, start=datetime(2030, 1, 1), end=datetime(2031, 1, 1)):
+    return list(recurrence.expand_occurrences(series, start, end))
+
+
+def test_count_is_relative_to_the_first_occurrence():
+    series = _series(starts_at=MONDAY, by_weekday="MO,TH", count=5)
+
+    assert _expand(series) == [
+        datetime(2030, 1, 7, 10), datetime(2030, 1, 10, 10), datetime(2030, 1, 14, 10),
+        datetime(2030, 1, 17, 10), datetime(2030, 1, 21, 10),
+    ]
+    # A later window still stops at the fifth occurrence
+    assert _expand(series, start=datetime(2030, 1, 15)) == [datetime(2030, 1, 17, 10), datetime(2030, 1, 21, 10)]
+
+
+def test_until_is_inclusive():
+    series = _series(starts_at=datetime(2030, 1, 1, 10), frequency=SeriesFrequency.DAILY, interval=2, until=datetime(2030, 1, 7, 10))
+
+    assert _expand(series) == [datetime(2030, 1, day, 10) for day in (1, 3, 5, 7)]
+
+
+def test_weekly_interval_with_weekdays():
+    series = _series(starts_at=MONDAY, interval=2, by_weekday="we,FR")
+
+    assert _expand(series, end=datetime(2030, 2, 9)) == [
+        datetime(2030, 1, 9, 10), datetime(2030, 1, 11, 10),
+        datetime(2030, 1, 23, 10), datetime(2030, 1, 25, 10),
+        datetime(2030, 2, 6, 10), datetime(2030, 2, 8, 10),
+    ]
+
+
+def test_weekly_defaults_to_the_first_weekday():
+    series = _series(starts_at=MONDAY, count=3)
+
+    assert _expand(series) == [MONDAY, MONDAY + timedelta(weeks=1), MONDAY + timedelta(weeks=2)]
+
+
+def test_monthly_skips_short_months():
+    series = _series(starts_at=datetime(2030, 1, 31, 19), frequency=SeriesFrequency.MONTHLY, count=3)
+
+    assert _expand(series) == [datetime(2030, 1, 31, 19), datetime(2030, 3, 31, 19), datetime(2030, 5, 31, 19)]
+
+
+def test_window_far_from_the_start_matches_a_full_walk():
+    for frequency, interval in [(SeriesFrequency.DAILY, 3), (SeriesFrequency.WEEKLY, 2), (SeriesFrequency.MONTHLY, 5)]:
+        series = _series(starts_at=MONDAY, frequency=frequency, interval=interval)
+        start, end = datetime(2034, 6, 1), datetime(2036, 1, 1)
+        full = [occurrence for occurrence in _expand(series, MONDAY, end) if occurrence >= start]
+
+        assert _expand(series, start, end) == full
+        assert full
+
+
+def test_has_occurrences_from():
+    assert recurrence.has_occurrences_from(_series(starts_at=MONDAY), datetime(2099, 1, 1))
+    assert recurrence.has_occurrences_from(_series(starts_at=MONDAY, count=2), MONDAY + timedelta(days=7))
+    assert not recurrence.has_occurrences_from(_series(starts_at=MONDAY, count=2), MONDAY + timedelta(days=8))
+    assert not recurrence.has_occurrences_from(_series(starts_at=MONDAY, until=MONDAY), MONDAY + timedelta(minutes=1))
+
+
+def _stored_series(db, **rule):
+    user = User(email=f"hub{db.query(User).count()}@example.com", password_hash="x", role=UserRole.HUB)
+    db.add(user)
+    db.flush()
+    series = _series(created_by_id=user.id, **rule)
+    db.add(series)
+    db.flush()
+    return series
+
+
+def test_exhausted_series_is_deactivated(db):
+    tomorrow = local_now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    horizon = tomorrow + timedelta(days=14)
+    counted = _stored_series(db, starts_at=tomorrow, frequency=SeriesFrequency.DAILY, count=3)
+    ended = _stored_series(db, starts_at=tomorrow, until=tomorrow + timedelta(days=7))
+    open_ended = _stored_series(db, starts_at=tomorrow)
+    partly = _stored_series(db, starts_at=tomorrow, count=4)
+
+    created = {
+        series.id: series_service.materialize_series(db, series, horizon)
+        for series in (counted, ended, open_ended, partly)
+    }
+    db.commit()
+
+    assert created == {counted.id: 3, ended.id: 2, open_ended.id: 2, partly.id: 2}
+    assert counted.is_active is False
+    assert ended.is_active is False
+    assert open_ended.is_active is True
+    assert partly.is_active is True  # Two occurrences left after the horizon
+    pending = recurrence.get_unmaterialized_occurrences(db, horizon, horizon + timedelta(days=30))
+    assert {series.id for series, _ in pending} == {open_ended.id, partly.id}
+    assert [occurrence for series, occurrence in pending if series is partly] == [horizon, horizon + timedelta(days=7)]
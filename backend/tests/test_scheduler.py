@@ -0,0 +1,82 @@
+"""
+Reminder jobs (scheduler_service.schedule_many, run_due_jobs)
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.timezone import local_now, to_utc
+from app.models.meeting import Meeting, MeetingStatus
+from app.models.member import Member, BusinessCategory
+from app.models.notification import Notification, NotificationType
+from app.models.notification_delivery import NotificationDelivery, NotificationPreference, PushSubscription
+from app.models.scheduled_job import ScheduledJob
+from app.models.user import User, UserRole
+from app.services import scheduler as scheduler_service
+
+
+MODELS = [User, Member, Meeting, ScheduledJob, Notification, NotificationDelivery, NotificationPreference, PushSubscription]
+
+
+@pytest.fixture(autouse=True)
+def no_deliveries(monkeypatch):
+    monkeypatch.setattr(settings, "DELIVERY_BACKEND", "auto")
+    monkeypatch.setattr(settings, "RESEND_API_KEY", None)
+
+
+def _minute(value: datetime) -> datetime:
+    return value.replace(second=0, microsecond=0)
+
+
+def _confirmed_meeting(db, scheduled_date):
+    user = User(email="member@example.com", password_hash="x", role=UserRole.MEMBER)
+    db.add(user)
+    db.flush()
+    member = Member(user_id=user.id, company_name="Empresa", business_category=BusinessCategory.TECNOLOGIA)
+    db.add(member)
+    db.flush()
+    meeting = Meeting(member_id=member.id, scheduled_date=scheduled_date, duration_minutes=60, status=MeetingStatus.CONFIRMED)
+    db.add(meeting)
+    db.commit()
+    return meeting
+
+
+def test_run_at_is_the_local_event_converted_to_utc(db):
+    event_at = _minute(local_now()) + timedelta(days=2)
+
+    scheduler_service.schedule_jobs(db, scheduler_service.JOB_MEETING_REMINDER, "meeting", event_at, [1440, 60])
+    db.commit()
+
+    assert sorted(job.run_at for job in db.query(ScheduledJob)) == [
+        to_utc(event_at) - timedelta(minutes=1440), to_utc(event_at) - timedelta(minutes=60)
+    ]
+
+
+def test_reminders_due_soon_are_queued(db):
+    # 60 minutes before an event 90 minutes from now (local) is still in the future
+    event_at = _minute(local_now()) + timedelta(minutes=90)
+
+    scheduler_service.schedule_jobs(db, scheduler_service.JOB_MEETING_REMINDER, "meeting", event_at, [1440, 60])
+    db.commit()
+
+    run_at, = [job.run_at for job in db.query(ScheduledJob)]
+    assert datetime.utcnow() < run_at <= datetime.utcnow() + timedelta(minutes=31)
+
+
+def test_due_reminder_runs_for_an_upcoming_local_meeting(db):
+    meeting = _confirmed_meeting(db, _minute(local_now()) + timedelta(minutes=90))
+    scheduler_service.schedule_meeting_reminders(db, meeting)
+    db.commit()
+    assert db.query(ScheduledJob).count() == 1
+
+    assert scheduler_service.run_due_jobs(db)["processed"] == 0
+    db.query(ScheduledJob).update({"run_at": datetime.utcnow() - timedelta(seconds=1)})
+    db.commit()
+
+    result = scheduler_service.run_due_jobs(db)
+
+    assert result["succeeded"] == 1
+    notification, = db.query(Notification).all()
+    assert notification.type == NotificationType.MEETING_REMINDER
+    assert db.query(ScheduledJob).count() == 0
@@ -0,0 +1,26 @@
+"""
+Search headlines (search.restore_accents)
+"""
+from app.core.search import restore_accents
+
+
+def test_accents_are_put_back_around_the_highlights():
+    document = "Consultoria em gestão ágil para São Paulo"
+    headline = "em <mark>gestao</mark> <mark>agil</mark> para Sao"
+
+    assert restore_accents(headline, document) == "em <mark>gestão</mark> <mark>ágil</mark> para São"
+
+
+def test_user_text_is_escaped_and_only_highlight_tags_are_markup():
+    document = 'Café <img src=x onerror="alert(1)"> & cia'
+    headline = '<mark>Cafe</mark> <img src=x onerror="alert(1)"> & cia'
+
+    assert restore_accents(headline, document) == (
+        '<mark>Café</mark> &lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; cia'
+    )
+
+
+def test_headline_not_found_in_the_document_is_still_escaped():
+    headline = "<mark>script</mark> <script>alert(1)</script>"
+
+    assert restore_accents(headline, "outro texto") == "<mark>script</mark> &lt;script&gt;alert(1)&lt;/script&gt;"
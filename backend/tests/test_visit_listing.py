@@ -0,0 +1,76 @@
+"""
+Hub visit listing (visit_service.get_all_visits)
+"""
+from datetime import datetime, timedelta
+
+from app.models.member import Member, BusinessCategory
+from app.models.user import User, UserRole
+from app.models.visit import Visit, VisitPurpose, VisitStatus
+from app.services import visit as visit_service
+
+
+MODELS = [User, Member, Visit]
+
+
+def _member(db, email, full_name=None):
+    user = User(email=email, password_hash="x", role=UserRole.MEMBER, full_name=full_name)
+    db.add(user)
+    db.flush()
+    member = Member(user_id=user.id, company_name=f"Empresa {email}", business_category=BusinessCategory.TECNOLOGIA)
+    db.add(member)
+    db.flush()
+    return member
+
+
+def _visits(db, visitor, visited, count, start=datetime(2030, 1, 1, 10)):
+    for index in range(count):
+        db.add(Visit(
+            visitor_id=visitor.id,
+            visited_id=visited.id,
+            purpose=VisitPurpose.NETWORKING,
+            visit_date=start + timedelta(hours=index)
+        ))
+    db.commit()
+
+
+def test_statement_count_does_not_grow_with_visits(db, statements):
+    visitor = _member(db, "visitor@example.com", "Visitante")
+    visited = _member(db, "visited@example.com", "Visitado")
+
+    _visits(db, visitor, visited, 1)
+    statements.clear()
+    assert len(visit_service.get_all_visits(db)) == 1
+    single = len(statements)
+
+    _visits(db, visitor, visited, 24, start=datetime(2030, 2, 1, 10))
+    statements.clear()
+    assert len(visit_service.get_all_visits(db)) == 25
+    assert len(statements) == single == 1
+
+
+def test_names_fall_back_to_email(db):
+    named = _member(db, "named@example.com", "Maria Souza")
+    blank = _member(db, "blank@example.com", "")
+    unnamed = _member(db, "unnamed@example.com", None)
+    _visits(db, blank, named, 1)
+    _visits(db, unnamed, named, 1, start=datetime(2030, 3, 1, 10))
+
+    rows = visit_service.get_all_visits(db)
+
+    assert {row["visitor_name"] for row in rows} == {"blank@example.com", "unnamed@example.com"}
+    assert {row["visited_name"] for row in rows} == {"Maria Souza"}
+    assert {row["visited_company"] for row in rows} == {"Empresa named@example.com"}
+
+
+def test_filters_and_newest_first(db):
+    visitor = _member(db, "visitor@example.com", "Visitante")
+    visited = _member(db, "visited@example.com", "Visitado")
+    _visits(db, visitor, visited, 3)
+    cancelled = db.query(Visit).order_by(Visit.visit_date).first()
+    cancelled.status = VisitStatus.CANCELADA
+    db.commit()
+
+    rows = visit_service.get_all_visits(db, status_filter=VisitStatus.AGENDADA)
+
+    assert [row["visit_date"] for row in rows] == [datetime(2030, 1, 1, 12), datetime(2030, 1, 1, 11)]
+    assert visit_service.get_all_visits(db, skip=1, limit=1)[0]["visit_date"] == datetime(2030, 1, 1, 11)